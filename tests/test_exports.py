@@ -35,6 +35,20 @@ def test_export_onnx():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+def test_export_onnx_submit():
+    """Test asynchronous ONNX Runtime inference with a pool of IO-bound requests matches synchronous inference."""
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = YOLO(MODEL).export(format="onnx", imgsz=32)
+    backend = AutoBackend(file, workers=2)
+    ims = [torch.rand(1, 3, 32, 32) for _ in range(4)]
+    expected = [backend(im).clone() for im in ims]
+    futures = [backend.submit(im) for im in ims]
+    assert all(torch.allclose(f.result(), y) for f, y in zip(futures, expected))
+
+
 @pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
 def test_export_openvino():
     """Test YOLO export to OpenVINO format for model inference compatibility."""
@@ -2,6 +2,9 @@
 
 import contextlib
 import csv
+import json
+import subprocess
+import sys
 import urllib
 from copy import copy
 from pathlib import Path
@@ -29,6 +32,7 @@ from ultralytics.utils import (
     WEIGHTS_DIR,
     WINDOWS,
     YAML,
+    IterableSimpleNamespace,
     checks,
     is_dir_writeable,
     is_github_action_running,
@@ -360,6 +364,138 @@ def test_data_converter():
     coco80_to_coco91_class()
 
 
+def test_data_stream_json():
+    """Test incremental JSON parsing yields top-level values and array elements across chunk boundaries."""
+    from ultralytics.data.converter import stream_json
+
+    data = {"info": {"s": 'a "quoted" [value]'}, "images": [{"id": i, "w": 640.5} for i in range(20)], "n": 12345}
+    file = TMP / "stream.json"
+    file.write_text(json.dumps(data, indent=1))
+    expected = [("info", data["info"]), *(("images", x) for x in data["images"]), ("n", 12345)]
+    for chunk_size in 1, 7, 1 << 20:
+        assert list(stream_json(file, chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("use_segments", [False, True])
+def test_data_convert_coco_buckets(use_segments):
+    """Test bucketed COCO conversion matches per-annotation conversion for crowd, duplicate and multi-part labels."""
+    import shutil
+
+    from ultralytics.data.converter import convert_coco, merge_multi_segment
+
+    url = "http://images.cocodataset.org"
+    images = [
+        {"id": i, "height": 480, "width": 640, "file_name": f"{i}.jpg", "coco_url": f"{url}/{split}/{i}.jpg"}
+        for i, split in ((3, "train2017"), (1, "val2017"), (2, "train2017"), (4, "val2017"))
+    ]
+    square = [[10, 20, 110, 20, 110, 70, 10, 70]]
+    annotations = [
+        {"image_id": 1, "bbox": [10, 20, 100, 50], "category_id": 1, "iscrowd": 0, "segmentation": square},
+        {"image_id": 1, "bbox": [10, 20, 100, 50], "category_id": 1, "iscrowd": 0, "segmentation": square},  # dupe
+        {"image_id": 1, "bbox": [0, 0, 640, 480], "category_id": 1, "iscrowd": 1, "segmentation": {"counts": [1]}},
+        {"image_id": 1, "bbox": [5, 5, 0, 10], "category_id": 2, "iscrowd": 0, "segmentation": square},  # zero width
+        {"image_id": 2, "bbox": [100, 100, 200, 150], "category_id": 3, "iscrowd": 0, "segmentation": []},
+        {
+            "image_id": 2,
+            "bbox": [300, 200, 200, 100],
+            "category_id": 18,
+            "iscrowd": 0,
+            "segmentation": [[300, 200, 400, 200, 400, 300], [450, 250, 500, 250, 500, 300, 450, 300]],  # multi-part
+        },
+        {"image_id": 3, "bbox": [1.5, 2.25, 30.75, 40.125], "category_id": 90, "iscrowd": 0, "segmentation": square},
+        {"image_id": 2, "bbox": [100, 100, 200, 150], "category_id": 3, "iscrowd": 0, "segmentation": square},  # dupe
+    ]
+
+    def convert_annotations(img, anns):  # reference per-annotation conversion of one image
+        h, w = img["height"], img["width"]
+        bboxes, segments = [], []
+        for ann in anns:
+            if ann.get("iscrowd", False):
+                continue
+            box = np.array(ann["bbox"], dtype=np.float64)
+            box[:2] += box[2:] / 2  # xy top-left corner to center
+            box[[0, 2]] /= w  # normalize x
+            box[[1, 3]] /= h  # normalize y
+            if box[2] <= 0 or box[3] <= 0:
+                continue
+            box = [ann["category_id"] - 1] + box.tolist()
+            if box not in bboxes:
+                bboxes.append(box)
+                if use_segments:
+                    if len(ann["segmentation"]) == 0:
+                        segments.append([])
+                        continue
+                    elif len(ann["segmentation"]) > 1:
+                        seg = np.concatenate(merge_multi_segment(ann["segmentation"]), axis=0)
+                    else:
+                        seg = np.array(ann["segmentation"][0]).reshape(-1, 2)
+                    segments.append([box[0]] + (seg / np.array([w, h])).reshape(-1).tolist())
+        lines = [segments[i] if use_segments and len(segments[i]) > 0 else bboxes[i] for i in range(len(bboxes))]
+        return "".join(("%g " * len(line)).rstrip() % tuple(line) + "\n" for line in lines)
+
+    labels_dir, save_dir = TMP / "coco_buckets" / "annotations", TMP / "coco_buckets" / "converted"
+    shutil.rmtree(labels_dir.parent, ignore_errors=True)
+    labels_dir.mkdir(parents=True)
+    (labels_dir / "lvis_v1_train.json").write_text(json.dumps({"images": images, "annotations": annotations}))
+    convert_coco(labels_dir, save_dir, use_segments=use_segments, cls91to80=False, lvis=True, workers=0, bucket_size=64)
+
+    converted = [img for img in images if any(ann["image_id"] == img["id"] for ann in annotations)]
+    for img in converted:
+        anns = [ann for ann in annotations if ann["image_id"] == img["id"]]
+        label = save_dir / "labels" / Path(img["coco_url"][len(url) + 1 :]).with_suffix(".txt")
+        assert label.read_text() == convert_annotations(img, anns), f"labels differ for image {img['id']}"
+    expected = sorted(str(Path("./images") / img["coco_url"][len(url) + 1 :]) for img in converted)
+    assert (save_dir / "train.txt").read_text().splitlines() == expected, "LVIS image list should be sorted"
+
+
+def test_data_verify_image_labels():
+    """Test header-only image sizes and bulk label parsing against PIL and per-file verification."""
+    from ultralytics.data.utils import exif_size, image_size, verify_image_label, verify_image_labels
+
+    for f in ASSETS.glob("*.jpg"):
+        png = TMP / f"{f.stem}.png"
+        Image.open(f).save(png)
+        assert image_size(f) == ("jpeg", exif_size(Image.open(f)))
+        assert image_size(png) == ("png", Image.open(f).size)
+
+    labels = ["0 0.5 0.5 0.2 0.2\n0 0.5 0.5 0.2 0.2\n1 0.1 0.1 0.1 0.1", "0 0.1 0.1 0.9 0.1 0.9 0.9", "", "0 x 1 1 1"]
+    args = []
+    for i, text in enumerate(labels):
+        (TMP / f"verify{i}.txt").write_text(text)
+        args.append((str(SOURCE), str(TMP / f"verify{i}.txt"), "", False, 2, 0, 0, False))
+    args.append((str(SOURCE), str(TMP / "missing.txt"), "", False, 2, 0, 0, False))
+    results = verify_image_labels(args)
+    for a, r in zip(args, results):
+        expected = verify_image_label(a)
+        assert len(r) == len(expected) and r[5:] == expected[5:]
+    assert len(results[0][1]) == 2 and len(results[1][3]) == 1  # duplicate removed, segment kept
+    assert [list(r[5:9]) for r in results[2:]] == [[0, 1, 1, 0], [0, 1, 0, 1], [1, 0, 0, 0]]  # empty, corrupt, missing
+
+
+def test_data_split_dota():
+    """Test vectorized polygon-window IoF and splitting DOTA-style images into files or packed tar shards."""
+    import tarfile
+
+    from ultralytics.data.split_dota import bbox_iof, split_trainval
+
+    diamond = np.array([[5, 0, 10, 5, 5, 10, 0, 5]], dtype=np.float32)  # area 50
+    windows = np.array([[0, 0, 5, 10], [2, 2, 8, 8], [20, 20, 30, 30]])
+    assert np.allclose(bbox_iof(diamond, windows), [[0.5, 34 / 50, 0]])
+
+    root = TMP / "dota-split"
+    for split in ("train", "val"):
+        (root / "images" / split).mkdir(parents=True, exist_ok=True)
+        (root / "labels" / split).mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(root / "images" / split / "P0001.jpg"), np.zeros((300, 500, 3), dtype=np.uint8))
+        (root / "labels" / split / "P0001.txt").write_text("0 0.1 0.1 0.2 0.1 0.2 0.2 0.1 0.2\n")
+    split_trainval(root, TMP / "dota-split-files", crop_size=256, gap=64, workers=0)
+    split_trainval(root, TMP / "dota-split-shards", crop_size=256, gap=64, workers=2, shard_size=4)
+    files = sorted(p.name for p in (TMP / "dota-split-files" / "images" / "train").glob("*.jpg"))
+    with tarfile.open(TMP / "dota-split-shards" / "shards" / "train-000000.tar") as tar:
+        names = tar.getnames()
+    assert len(files) == 6 and set(names) <= {*files, "P0001__256__0___0.txt"} and len(names) == 5
+
+
 def test_data_annotator():
     """Test automatic annotation of data using detection and segmentation models."""
     from ultralytics.data.annotator import auto_annotate
@@ -479,6 +615,454 @@ def test_utils_files():
         print(new_path)
 
 
+def test_trackers_gated_matching():
+    """Test that gated IoU and component-wise assignment match the dense tracker association."""
+    from ultralytics.trackers.utils.matching import (
+        gated_iou_distance,
+        iou_distance,
+        linear_assignment,
+        sparse_linear_assignment,
+    )
+
+    xy = np.random.uniform(0, 1000, (300, 2))
+    boxes = np.concatenate([xy, xy + np.random.uniform(10, 40, (300, 2))], axis=1)
+    atracks, btracks = list(boxes), list(boxes[::-1] + np.random.uniform(-3, 3, boxes.shape))
+    dists = gated_iou_distance(atracks, btracks)
+    assert np.allclose(dists, iou_distance(atracks, btracks), atol=1e-5)
+
+    matches, u_a, u_b = linear_assignment(dists, thresh=0.8)
+    sparse_matches, sparse_u_a, sparse_u_b = sparse_linear_assignment(dists, thresh=0.8)
+    assert sorted(map(tuple, matches)) == sorted(map(tuple, sparse_matches.tolist()))
+    assert set(u_a) == set(sparse_u_a) and set(u_b) == set(sparse_u_b)
+
+
+def test_trackers_state_snapshot():
+    """Test that a tracker restored from a state snapshot continues with identical tracks and IDs."""
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers import BOTSORT
+
+    args = IterableSimpleNamespace(**YAML.load(ROOT / "cfg/trackers/botsort.yaml"))
+    xy, conf = np.random.uniform(0, 600, (20, 2)), np.random.uniform(0.3, 1, (20, 1))
+    imgs = np.random.randint(0, 255, (6, 320, 320, 3), dtype=np.uint8)
+    dets = [Boxes(np.concatenate([xy + i, xy + i + 30, conf, np.zeros_like(conf)], 1), (640, 640)) for i in range(6)]
+
+    tracker = BOTSORT(args)
+    for det, img in zip(dets[:3], imgs[:3]):
+        tracker.update(det, img)
+    tracker.save_state(TMP / "tracker_state.npz")
+    expected = [tracker.update(det, img) for det, img in zip(dets[3:], imgs[3:])]
+
+    restored = BOTSORT(args)
+    restored.load_state(TMP / "tracker_state.npz")
+    for (det, img), tracks in zip(zip(dets[3:], imgs[3:]), expected):
+        assert np.allclose(restored.update(det, img), tracks)
+
+
+@pytest.mark.parametrize("rect", [False, True])
+def test_predictor_fused_preprocess(rect):
+    """Test that fused preprocessing matches the generic letterbox and normalization path."""
+    model = YOLO(CFG)
+    model.predict(np.zeros((32, 32, 3), dtype=np.uint8), imgsz=64, rect=rect, verbose=False)  # set up predictor
+    predictor = model.predictor
+    ims = [np.random.randint(0, 255, (48, 80, 3), dtype=np.uint8) for _ in range(2)]
+    fused = predictor.preprocess(ims)
+    generic = torch.from_numpy(np.stack(predictor.pre_transform(ims))[..., ::-1].transpose(0, 3, 1, 2).copy()) / 255
+    assert torch.equal(fused, generic.to(fused))
+    expected = fused.clone()
+    second = predictor.preprocess([np.zeros_like(x) for x in ims])
+    assert second.data_ptr() != fused.data_ptr(), "consecutive batches should not share buffers"
+    assert torch.equal(fused, expected), "previous batch must stay valid while the next one is preprocessed"
+    assert predictor.preprocess(ims).data_ptr() == fused.data_ptr(), "preprocess buffers should be reused"
+
+
+def test_predictor_buckets():
+    """Test that inputs are snapped to the smallest fitting shape bucket and that every bucket is warmed up."""
+    model = YOLO(CFG)
+    im = np.zeros((480, 1280, 3), dtype=np.uint8)
+    model.predict(im, imgsz=640, buckets=[[320, 640], [480, 640], 800], verbose=False)
+    predictor = model.predictor
+    assert predictor.buckets == [(320, 640), (480, 640), (640, 640)], "oversized buckets should be dropped"
+    assert predictor.get_letterbox([im]).new_shape == (320, 640)
+    assert predictor.get_letterbox([im, np.zeros((600, 600, 3), dtype=np.uint8)]).new_shape == (640, 640)
+    assert {(1, 3, *b) for b in predictor.buckets} <= predictor.model.warmed_shapes
+
+
+def test_predictor_tile():
+    """Test sliced inference merges tile detections into one result per image in image coordinates."""
+    from ultralytics.engine.results import RoiMasks
+    from ultralytics.utils.ops import merge_boxes
+
+    boxes = torch.tensor([[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]], dtype=torch.float32)
+    keep, fused = merge_boxes(boxes, torch.tensor([0.9, 0.9, 0.5]), iou_thres=0.5, weighted=True)
+    assert keep.tolist() == [0, 2] and torch.allclose(fused[0], torch.tensor([0.5, 0.5, 10.5, 10.5]))
+
+    im = cv2.imread(str(ASSETS / "bus.jpg"))  # 1080x810
+    for merge in ("nms", "wbf"):
+        result = YOLO(WEIGHTS_DIR / "yolo11n-seg.pt")(im, imgsz=320, tile=320, tile_merge=merge, batch=4)[0]
+        assert result.orig_shape == im.shape[:2] and len(result.boxes)
+        assert (result.boxes.xyxy[:, 2] <= im.shape[1]).all() and (result.boxes.xyxy[:, 3] <= im.shape[0]).all()
+        assert isinstance(result.masks, RoiMasks) and result.masks.shape == (len(result.boxes), *im.shape[:2])
+
+
+def test_inference_server():
+    """Test that the inference server batches concurrent HTTP requests and returns Results summaries."""
+    import asyncio
+    import json
+
+    from ultralytics.engine.server import InferenceServer
+
+    async def request(port, body, method="POST", path="/predict", length=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        length = len(body) if length is None else length
+        head = f"{method} {path} HTTP/1.1\r\nContent-Length: {length}\r\nConnection: close\r\n\r\n"
+        writer.write(head.encode() + body)
+        head, _, payload = (await reader.read()).partition(b"\r\n\r\n")
+        writer.close()
+        return int(head.split()[1]), json.loads(payload)
+
+    async def run():
+        server = InferenceServer(YOLO(CFG), workers=0, max_batch=4, max_delay=50, max_body=1 << 20, imgsz=64)
+        task = asyncio.ensure_future(server.serve(port=0))
+        while server.server is None:
+            await asyncio.sleep(0.05)
+        port = server.server.sockets[0].getsockname()[1]
+        image = cv2.imencode(".jpg", np.zeros((48, 64, 3), dtype=np.uint8))[1].tobytes()
+        responses = await asyncio.gather(*[request(port, image) for _ in range(4)], request(port, b"not an image"))
+        health = await request(port, b"", method="GET", path="/health")
+        limits = [await request(port, b"", length=2 << 20), await request(port, b"", length="-1")]
+        task.cancel()
+        return server, responses, health, limits
+
+    server, responses, (status, health), limits = asyncio.run(run())
+    assert [status for status, _ in limits] == [413, 400], "oversized and invalid bodies should be rejected"
+    with pytest.raises(ValueError, match="workers=0"):
+        InferenceServer(YOLO(CFG), workers=1)  # worker processes need a checkpoint path
+    assert [status for status, _ in responses] == [200, 200, 200, 200, 400]
+    assert all(r["shape"] == [48, 64] and isinstance(r["results"], list) for _, r in responses[:4])
+    assert status == 200 and health["requests"] == 5 and server.stats["batches"] < 5, "requests should be batched"
+
+
+def test_cli_serve_alias():
+    """Test that 'yolo serve' starts the server while the one-letter 'yolo s' alias still runs solutions."""
+    from unittest.mock import patch
+
+    from ultralytics.cfg import entrypoint
+
+    with patch("ultralytics.cfg.handle_yolo_solutions") as solutions:
+        with patch("ultralytics.cfg.handle_yolo_serve") as serve:
+            entrypoint("yolo s")
+            entrypoint("yolo serve")
+    solutions.assert_called_once()
+    serve.assert_called_once()
+
+
+def test_shared_memory_source():
+    """Test passing frames through a shared-memory ring buffer to the shared-memory stream loader."""
+    from ultralytics.data.loaders import LoadSharedMemory, SharedFrameRing
+
+    ring = SharedFrameRing("yolo_test_ring", shape=(32, 48, 3), slots=2, create=True)
+    try:
+        loader = LoadSharedMemory(ring.name, buffer=True, timeout=1)
+        assert ring.put(np.full((32, 48, 3), 1, dtype=np.uint8), source=3)
+        assert ring.put(np.full((16, 48, 3), 2, dtype=np.uint8))
+        assert not ring.put(np.zeros((32, 48, 3), dtype=np.uint8), block=False), "full ring should drop frames"
+        first = next(iter(loader))[1][0]
+        assert ring.put(np.full((32, 48, 3), 3, dtype=np.uint8), block=False), "copied frame should release its slot"
+        ring.close()
+        batches = [(frames[0].shape, int(frames[0][0, 0, 0]), loader.meta[0]["source"]) for _, frames, _ in loader]
+        assert batches == [((16, 48, 3), 2, 0), ((32, 48, 3), 3, 0)]
+        assert (first == 1).all(), "retained frames must not change when slots are reused"
+    finally:
+        ring.unlink()
+
+    ring = SharedFrameRing("yolo_test_ring_view", shape=(32, 48, 3), slots=2, create=True)
+    try:
+        loader = iter(LoadSharedMemory(ring.name, buffer=True, timeout=1, copy=False))
+        for i in range(2):
+            assert ring.put(np.full((32, 48, 3), i, dtype=np.uint8))
+        frame = next(loader)[1][0]
+        assert not frame.flags.writeable and not frame.flags.owndata and (frame == 0).all()
+        assert not ring.put(np.zeros((32, 48, 3), dtype=np.uint8), block=False), "viewed frame should hold its slot"
+        assert (next(loader)[1][0] == 1).all() and ring.put(np.full((32, 48, 3), 3, dtype=np.uint8), block=False)
+        ring.close()
+    finally:
+        ring.unlink()
+
+
+def test_results_lazy_fields():
+    """Test that deferred Results fields are computed once on first access and stay deferred through _apply."""
+    from ultralytics.engine.results import Results
+
+    calls = []
+
+    def masks():
+        calls.append(1)
+        return torch.ones(2, 32, 32)
+
+    boxes = torch.tensor([[0, 0, 8, 8, 0.9, 0], [4, 4, 16, 16, 0.8, 0]])
+    result = Results(np.zeros((32, 32, 3), dtype=np.uint8), path="", names={0: "a"}, boxes=boxes, masks=masks)
+    subset = result.cpu()[0:1]
+    assert len(result) == 2 and not calls, "masks should not be computed before access"
+    assert subset.masks.data.shape == (1, 32, 32) and result.masks is result.masks and len(calls) == 1
+
+
+def test_segment_lazy_masks():
+    """Test that lazy masks keep their own prototypes and the mask options in use when the result was built."""
+    model = YOLO(WEIGHTS_DIR / "yolo11n-seg.pt")
+    model.predict(SOURCE, imgsz=320, lazy=True, verbose=False)  # set up predictor
+    predictor = model.predictor
+    torch.manual_seed(0)
+    proto, img, orig_img = torch.randn(32, 80, 80), torch.zeros(1, 3, 320, 320), np.zeros((480, 640, 3), np.uint8)
+    pred = torch.cat([torch.tensor([[16, 16, 200, 240, 0.9, 0], [100, 50, 300, 300, 0.8, 0]]), torch.randn(2, 32)], 1)
+    expected, result = (predictor.construct_lazy_result(pred.clone(), img, orig_img, "", proto) for _ in range(2))
+    expected = expected.masks.data.clone()
+    proto.zero_()  # next batch written into a reused backend output buffer
+    predictor.args.retina_masks = True  # args of a later predict call
+    assert len(expected) and torch.equal(result.masks.data, expected)
+
+
+def test_results_writer(tmp_path):
+    """Test streaming detections of Results objects to numpy record arrays in buffered row groups."""
+    from ultralytics.engine.results import Results, ResultsWriter
+
+    boxes = torch.tensor([[0, 0, 8, 8, 0.9, 1], [4, 4, 16, 16, 0.8, 0]])
+    results = [
+        Results(np.zeros((32, 32, 3), dtype=np.uint8), path=f"{i}.jpg", names={0: "a", 1: "b"}) for i in range(3)
+    ]
+    for i, r in enumerate(results):
+        r.update(boxes=boxes[:i])
+    with ResultsWriter(tmp_path / "detections.npy", row_group_size=2, normalize=True) as writer:
+        writer.append(results)
+    records = np.load(tmp_path / "detections.npy")
+    assert records["image"].tolist() == [1, 2, 2] and records["class"].tolist() == [1, 1, 0]
+    assert records["x2"][-1] == 0.5 and (records["track_id"] == -1).all()
+    assert (tmp_path / "detections.paths.txt").read_text().split() == ["0.jpg", "1.jpg", "2.jpg"]
+
+    # Row counts crossing digit boundaries must not change the size of the rewritten header
+    dtype = np.load(tmp_path / "detections.npy").dtype
+    assert len({len(ResultsWriter._npy_header(dtype, 10**i)) for i in range(19)}) == 1
+    results[0].update(boxes=boxes[torch.arange(1234) % 2])
+    with ResultsWriter(tmp_path / "many.npy", row_group_size=500) as writer:
+        writer.append(results[:1])
+    records = np.load(tmp_path / "many.npy")
+    assert len(records) == 1234 and records["class"].tolist() == [1, 0] * 617
+
+
+def test_process_mask_roi():
+    """Test that ROI mask crops match dense upsampled masks and that RoiMasks rebuilds them and their RLE."""
+    from ultralytics.engine.results import RoiMasks
+    from ultralytics.utils import ops
+
+    torch.manual_seed(0)
+    protos, coeffs, shape = torch.randn(32, 48, 80), torch.randn(8, 32), (270, 480)
+    boxes = torch.tensor([[0, 0, 50, 40], [100.5, 30.2, 300.7, 200.1], [400, 200, 480, 270]]).repeat(3, 1)[:8]
+    for native, dense in (
+        (False, ops.process_mask(protos, coeffs, boxes, shape, upsample=True)),
+        (True, ops.process_mask_native(protos, coeffs, boxes, shape)),
+    ):
+        masks = RoiMasks(*ops.process_mask_roi(protos, coeffs, boxes, shape, native=native), shape, shape)
+        data = masks.data
+        assert (data != dense).sum() <= 1e-4 * dense.numel(), "ROI masks may only differ at float rounding boundaries"
+        assert torch.equal(masks.area, data.sum((1, 2)).long())
+        counts = masks[1:2].rle()[0]["counts"]
+        decoded = np.repeat(np.arange(len(counts)) % 2, counts).reshape(shape[1], shape[0]).T
+        assert sum(counts) == shape[0] * shape[1] and np.array_equal(decoded, data[1].numpy())
+
+
+def test_lazy_import():
+    """Test that 'import ultralytics' defers PyTorch and model families until their classes are first accessed."""
+    code = (
+        "import sys, ultralytics; assert 'torch' not in sys.modules, 'torch imported'; "
+        "from ultralytics import YOLO; assert 'ultralytics.models.sam' not in sys.modules, 'SAM imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_sam_feature_cache(tmp_path):
+    """Test that the SAM feature cache keys images by content and spills evicted features to disk in float16."""
+    from ultralytics.models.sam import FeatureCache
+
+    cache = FeatureCache(max_bytes=1, disk=tmp_path)  # keep only the newest entry in memory
+    a, b = np.zeros((32, 32, 3), dtype=np.uint8), np.ones((32, 32, 3), dtype=np.uint8)
+    features = {"image_embed": torch.rand(1, 8, 4, 4), "high_res_feats": [torch.rand(1, 4, 16, 16)]}
+    cache.put(cache.key(a, (64, 64)), features)
+    cache.put(cache.key(b, (64, 64)), torch.rand(1, 8, 4, 4))
+    assert cache.key(a, (64, 64)) != cache.key(a, (32, 32)) and cache.get(cache.key(a, (32, 32))) is None
+    assert len(cache.spilled) == 1 and len(list(tmp_path.glob("*.npy"))) == 1
+    restored = cache.get(cache.key(a.copy(), (64, 64)))
+    assert torch.allclose(restored["high_res_feats"][0], features["high_res_feats"][0], atol=1e-3)
+    assert restored["image_embed"].dtype == torch.float32 and cache.hits == 1 and cache.misses == 1
+
+
+def test_sam_predict_batch():
+    """Test that batched SAM prompts over several images match prompting each image on its own."""
+    from ultralytics.models.sam import FeatureCache, SAM2Predictor
+    from ultralytics.models.sam.build import build_sam2_t
+
+    predictor = SAM2Predictor(overrides=dict(imgsz=256, device="cpu", verbose=False, save=False))
+    predictor.setup_model(build_sam2_t(), verbose=False)
+    images = [ASSETS / "bus.jpg", ASSETS / "zidane.jpg", ASSETS / "bus.jpg"]
+    bboxes = [[[22, 231, 805, 756], [50, 400, 250, 900]], [[747, 41, 1148, 711]], None]
+    points = [None, [[[900, 300], [400, 400]]], None]
+    results = predictor.predict_batch(images, bboxes=bboxes, points=points, prompt_batch=2)
+    assert [len(r.boxes) for r in results] == [2, 1, 0] and results[2].masks is None
+    for image, b, p, r in zip(images[:2], bboxes, points, results):
+        single = predictor(str(image), bboxes=b, points=p)[0]
+        assert torch.equal(r.masks.data, single.masks.data) and torch.allclose(r.boxes.conf, single.boxes.conf)
+
+    predictor.feature_cache = FeatureCache()
+    predictor.predict_batch(images[:2], bboxes=bboxes[:2], points=points[:2], batch=2)
+    tensors = [t for f, _ in predictor.feature_cache.memory.values() for t in [f["image_embed"], *f["high_res_feats"]]]
+    assert all(t.untyped_storage().nbytes() == t.numel() * t.element_size() for t in tensors), "cached batch views"
+
+
+def test_sam_generate_roi_masks():
+    """Test that segment-everything returns the same masks as ROI crops as it does densely."""
+    from ultralytics.models.sam import SAM2Predictor
+    from ultralytics.models.sam.build import build_sam2_t
+
+    model, results = build_sam2_t(), []
+    for roi_masks in (False, True):
+        overrides = dict(imgsz=256, device="cpu", verbose=False, save=False, iou=1.0, roi_masks=roi_masks)
+        predictor = SAM2Predictor(overrides=overrides)
+        predictor.setup_model(model, verbose=False)
+        kwargs = dict(points_stride=8, conf_thres=-1e9, stability_score_thresh=-1.0)  # keep random-weight masks
+        results.append(predictor(str(ASSETS / "bus.jpg"), **kwargs)[0])
+    dense, roi = results
+    assert type(roi.masks).__name__ == "RoiMasks" and len(dense.masks) == len(roi.masks) > 0
+    assert torch.equal(dense.masks.data, roi.masks.data.bool()) and torch.equal(dense.boxes.data, roi.boxes.data)
+
+
+def test_sam2_video_trim_memory():
+    """Test that SAM 2 video tracking drops only the non-conditioning outputs memory attention no longer reads."""
+    from ultralytics.models.sam import SAM2VideoPredictor
+    from ultralytics.models.sam.build import build_sam2_t
+
+    predictor = SAM2VideoPredictor(overrides=dict(device="cpu", verbose=False))
+    predictor.model = model = build_sam2_t()
+    outputs = [
+        {"cond_frame_outputs": {0: {}}, "non_cond_frame_outputs": {t: {} for t in range(1, 100)}} for _ in range(3)
+    ]
+    predictor.inference_state = {
+        "output_dict": outputs[0],
+        "output_dict_per_obj": {0: outputs[1], 1: outputs[2]},
+        "consolidated_frame_inds": {"non_cond_frame_outputs": {5}},  # frame with user inputs is always kept
+    }
+    predictor._trim_non_cond_memory(99)
+    window = max(model.num_maskmem - 1, model.max_obj_ptrs_in_encoder - 1)  # stride 1
+    kept = {5, *range(100 - window, 100)}
+    state = predictor.inference_state
+    for output_dict in (state["output_dict"], *state["output_dict_per_obj"].values()):
+        assert set(output_dict["non_cond_frame_outputs"]) == kept and set(output_dict["cond_frame_outputs"]) == {0}
+
+
+def test_sam2_video_multi_object_prompts():
+    """Test that prompting several SAM 2 video objects in one call matches prompting each object on its own."""
+    from types import SimpleNamespace
+
+    from ultralytics.models.sam import SAM2VideoPredictor
+    from ultralytics.models.sam.build import build_sam2_t
+
+    torch.manual_seed(0)
+    model, ims = build_sam2_t(), [torch.rand(1, 3, 256, 256) for _ in range(4)]
+    points = torch.tensor([[[60.0, 80.0]], [[180.0, 120.0]], [[100.0, 200.0]]])
+    labels = torch.ones(3, 1, dtype=torch.int32)
+
+    def session():
+        predictor = SAM2VideoPredictor(overrides=dict(imgsz=256, device="cpu", verbose=False, save=False))
+        predictor.setup_model(model, verbose=False)
+        predictor.imgsz = [256, 256]
+        predictor.model.set_imgsz(predictor.imgsz)
+        predictor.dataset = SimpleNamespace(mode="video", frames=len(ims), frame=0)
+        predictor.init_state(predictor)
+        predictor.inference_state["im"] = ims[0]
+        return predictor
+
+    def outputs(predictor, frame_idx=0):
+        temp = predictor.inference_state["temp_output_dict_per_obj"]
+        return [temp[i]["cond_frame_outputs"][frame_idx] for i in sorted(temp)]
+
+    def track(predictor, frames):
+        for t in frames:
+            predictor.dataset.frame = t
+            yield predictor.inference(ims[t])[0]
+
+    batched, single = session(), session()
+    masks = batched.add_new_prompts(obj_id=[0, 1, 2], points=points, labels=labels)[0]
+    for i in range(3):
+        single_masks = single.add_new_prompts(obj_id=i, points=points[[i]], labels=labels[[i]])[0]
+    assert torch.allclose(masks, single_masks, atol=1e-4)
+    for a, b in zip(outputs(batched), outputs(single)):
+        assert torch.allclose(a["pred_masks"], b["pred_masks"], atol=1e-4)
+        assert torch.allclose(a["obj_ptr"], b["obj_ptr"], atol=1e-4)
+    for a, b in zip(track(batched, range(3)), track(single, range(3))):
+        assert a.shape == b.shape and torch.allclose(a, b, atol=1e-3)
+
+    # Corrections on a tracked frame fall back to one object at a time, duplicated IDs to consecutive prompts
+    for obj_ids, frame_idx in (([0, 1], 1), ([2, 2], 2)):
+        batched.inference_state["im"] = single.inference_state["im"] = ims[frame_idx]
+        masks = batched.add_new_prompts(obj_id=obj_ids, points=points[:2], labels=labels[:2], frame_idx=frame_idx)[0]
+        for i, obj_id in enumerate(obj_ids):
+            single_masks = single.add_new_prompts(
+                obj_id=obj_id, points=points[[i]], labels=labels[[i]], frame_idx=frame_idx
+            )[0]
+        assert torch.allclose(masks, single_masks, atol=1e-3)
+    for a, b in zip(track(batched, [3]), track(single, [3])):
+        assert a.shape == b.shape and torch.allclose(a, b, atol=1e-3)
+
+
+def test_utils_cpu_layout():
+    """Test CPU core list parsing and the NUMA-aware layout of workers across nodes."""
+    import os
+
+    from ultralytics.utils.cpu import numa_layout, numa_nodes, parse_cpus, set_cpu_config
+
+    assert parse_cpus("0-3,8") == [0, 1, 2, 3, 8] and parse_cpus([3, 1, 3]) == [1, 3]
+    nodes = [list(range(0, 8)), list(range(8, 16))]
+    assert numa_layout(4, nodes) == [[0, 1, 2, 3], [8, 9, 10, 11], [4, 5, 6, 7], [12, 13, 14, 15]]
+    assert all(len(cores) == 1 for cores in numa_layout(5, [[0, 1]])), "oversubscribed workers share single cores"
+    assert sum(len(cores) for cores in numa_nodes()) >= 1
+
+    threads = torch.get_num_threads()
+    cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    try:
+        assert set_cpu_config(cpus=cores[:1] if cores else 0) == 1, "threads should default to the pinned cores"
+        assert set_cpu_config(threads=3) == 3 and set_cpu_config() is None
+    finally:
+        set_cpu_config(threads=threads, cpus=cores)
+
+
+def test_model_registry():
+    """Test that the model registry shares AutoBackends per key and evicts least recently used entries."""
+    from ultralytics.nn.registry import ModelRegistry
+
+    registry = ModelRegistry(max_models=2)
+    a, b = YOLO(CFG).model, YOLO(CFG).model
+    backend = registry.get(a, device=torch.device("cpu"), verbose=False)
+    assert registry.get(a, device=torch.device("cpu")) is backend, "verbose should not be part of the cache key"
+    assert backend.model is not a, "cached backends should wrap a copy of in-memory modules"
+    registry.get(a, device=torch.device("cpu"), fp16=True)
+    registry.get(b, device=torch.device("cpu"))
+    assert len(registry) == 2 and registry.get(a, device=torch.device("cpu")) is not backend, "LRU entry evicted"
+    registry.configure(max_models=0)
+    assert not registry.enabled and len(registry) == 0
+
+    from ultralytics.nn.registry import MODEL_REGISTRY
+
+    MODEL_REGISTRY.configure(max_models=2)
+    try:
+        first, second = YOLO(MODEL), YOLO(MODEL)
+        shared = first.model
+        assert second.model is shared and not shared.training, "checkpoints should be shared between models"
+        assert not any(p.requires_grad for p in shared.parameters()), "shared checkpoint should be frozen"
+        first.fuse()
+        first.to("cpu")
+        assert first.model is not shared and not shared.is_fused(), "mutating a model must not change the shared module"
+        assert second.model is shared and first.overrides is not shared.args
+    finally:
+        MODEL_REGISTRY.configure(max_models=0)
+
+
 @pytest.mark.slow
 def test_utils_patches_torch_save():
     """Test torch_save backoff when _torch_save raises RuntimeError."""
@@ -636,6 +1220,30 @@ def test_yolo_world():
     )
 
 
+@pytest.mark.skipif(checks.IS_PYTHON_3_12, reason="YOLOWorld with CLIP is not supported in Python 3.12")
+@pytest.mark.skipif(
+    checks.IS_PYTHON_3_8 and LINUX and ARM64,
+    reason="YOLOWorld with CLIP is not supported in Python 3.8 and aarch64 Linux",
+)
+def test_yolo_world_registry():
+    """Test that setting classes on a registry-shared YOLOWorld model leaves other instances unchanged."""
+    from ultralytics.nn.registry import MODEL_REGISTRY
+
+    MODEL_REGISTRY.configure(max_models=4)
+    try:
+        first, second = YOLO(WEIGHTS_DIR / "yolov8s-world.pt"), YOLO(WEIGHTS_DIR / "yolov8s-world.pt")
+        second(SOURCE)  # set up a predictor on a cached backend
+        names, nc, txt_feats = dict(second.names), second.model.model[-1].nc, second.model.txt_feats.clone()
+        first(SOURCE)
+        first.set_classes(["tree", "window"])
+        assert first.names == {0: "tree", 1: "window"} and first(SOURCE, conf=0.01)[0].names == first.names
+        assert second.model.names == names and second.model.model[-1].nc == nc
+        assert torch.equal(second.model.txt_feats, txt_feats), "shared class embeddings must not change"
+        assert second.predictor.model.names == names and second(SOURCE)[0].names == names
+    finally:
+        MODEL_REGISTRY.configure(max_models=0)
+
+
 @pytest.mark.skipif(checks.IS_PYTHON_3_12 or not TORCH_1_9, reason="YOLOE with CLIP is not supported in Python 3.12")
 @pytest.mark.skipif(
     checks.IS_PYTHON_3_8 and LINUX and ARM64,
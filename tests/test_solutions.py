@@ -358,3 +358,100 @@ def test_display_output_method():
         mock_imshow.assert_called_once()
         mock_wait.assert_called_once()
         mock_destroy.assert_called_once()
+
+
+def test_crossing_counter():
+    """Test vectorized line crossing and polygon entry counting with direction and count-once semantics."""
+    from ultralytics.solutions.crossing import CrossingCounter
+
+    counter = CrossingCounter([[(0, 50), (100, 50)], [(60, 0), (90, 0), (90, 30), (60, 30)]])
+    crossed, _ = counter.update([1, 2, 3], np.array([[20, 40], [70, 60], [10, 10]]))
+    assert not crossed.any(), "tracks without a previous position must not be counted"
+    crossed, inward = counter.update([1, 2, 3], np.array([[20, 60], [70, 40], [75, 20]]))
+    assert crossed[:, 0].tolist() == [True, True, False] and inward[:, 0].tolist() == [True, False, False]
+    assert crossed[:, 1].tolist() == [False, False, True] and inward[2, 1]
+    crossed, _ = counter.update([1, 3], np.array([[20, 40], [76, 21]]))
+    assert not crossed.any(), "tracks must only be counted once per region"
+
+    counter = CrossingCounter([[(0, 50), (100, 50)]], max_age=2)
+    counter.update([1, 2], np.array([[20, 40], [30, 40]]))
+    for _ in range(4):  # track 1 disappears
+        counter.update([2], np.array([[30, 40]]))
+    assert list(counter.track_rows) == [2] and len(counter.prev) == 1, "stale tracks must be pruned"
+
+
+def test_heatmap_accumulate():
+    """Test vectorized heatmap accumulation against the per-box disc logic, and the decay and interval options."""
+    import torch
+
+    from ultralytics.engine.results import Results
+
+    def heatmap_effect(heatmap, box):  # reference per-box implementation
+        x0, y0, x1, y1 = map(int, box)
+        xv, yv = np.meshgrid(np.arange(x0, x1), np.arange(y0, y1))
+        dist_squared = (xv - ((x0 + x1) // 2)) ** 2 + (yv - ((y0 + y1) // 2)) ** 2
+        heatmap[y0:y1, x0:x1][dist_squared <= (min(x1 - x0, y1 - y0) // 2) ** 2] += 2
+
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 100, (50, 2))
+    boxes = np.concatenate([xy, xy + rng.uniform(0, 40, (50, 2))], 1).clip(0, [120, 100, 120, 100])
+    boxes = np.concatenate([boxes, [[10, 10, 10, 30], [0, 0, 120, 100], [5.7, 3.2, 18.9, 40.5]]]).astype(np.float32)
+    heatmap = solutions.Heatmap(model=MODEL, show=SHOW)
+    heatmap.heatmap = np.zeros((100, 120), dtype=np.float32)
+    heatmap.accumulate(boxes)
+    expected = np.zeros((100, 120), dtype=np.float32)
+    for box in boxes:
+        heatmap_effect(expected, box)
+    assert np.array_equal(heatmap.heatmap, expected), "vectorized accumulation must match per-box heatmap effect"
+
+    frame = np.zeros((100, 120, 3), dtype=np.uint8)
+    track = torch.tensor([[10, 10, 50, 50, 1, 0.9, 0]], dtype=torch.float32)
+    results = [Results(frame, path=None, names={0: "person"}, boxes=track) for _ in range(3)]
+    heatmap = solutions.Heatmap(model=MODEL, show=SHOW, heatmap_decay=0.5, heatmap_interval=2)
+    with patch.object(heatmap.model, "track", side_effect=[[r] for r in results]):
+        heatmap(frame.copy())
+        stamp, rendered = heatmap.heatmap.copy(), heatmap.colored_heatmap
+        heatmap(frame.copy())
+        assert np.allclose(heatmap.heatmap, stamp * 0.5 + stamp), "older activity must decay every frame"
+        assert heatmap.colored_heatmap is rendered, "colormap must be reused between render intervals"
+        heatmap(frame.copy())
+        assert heatmap.colored_heatmap is not rendered, "colormap must be re-rendered every interval frames"
+
+
+def test_headless_process_batch():
+    """Test headless batched processing matches per-frame counting without drawing on the frames."""
+    import torch
+
+    from ultralytics.engine.results import Results
+
+    frames = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(4)]
+    tracks = [  # two tracks crossing the line y=50 in opposite directions, boxes as (x1, y1, x2, y2, id, conf, cls)
+        torch.tensor([[10, y, 20, y + 10, 1, 0.9, 0], [60, 80 - y, 70, 90 - y, 2, 0.9, 0]], dtype=torch.float32)
+        for y in (10, 30, 50, 70)
+    ]
+    results = [Results(f, path=None, names={0: "person"}, boxes=t) for f, t in zip(frames, tracks)]
+    kwargs = dict(model=MODEL, region=[(0, 50), (100, 50)], show=SHOW)
+
+    counter = solutions.ObjectCounter(**kwargs)
+    with patch.object(counter.model, "track", side_effect=[[r] for r in results]):
+        expected = [counter(f.copy()) for f in frames]
+    headless = solutions.ObjectCounter(headless=True, **kwargs)
+    with patch.object(headless.model, "track", return_value=results) as mock_track:
+        batched = headless.process_batch(frames)
+    mock_track.assert_called_once()
+    assert [(r.in_count, r.out_count) for r in batched] == [(r.in_count, r.out_count) for r in expected]
+    assert batched[-1].in_count == 1 and batched[-1].out_count == 1
+    assert all(r.plot_im is f and not f.any() for r, f in zip(batched, frames)), "headless mode must not draw"
+
+    failing = solutions.ObjectCounter(headless=True, **kwargs)  # a failing frame must not leave stale batch tracks
+    with patch.object(failing.model, "track", return_value=results), patch.object(
+        failing, "process", side_effect=RuntimeError
+    ):
+        with pytest.raises(RuntimeError):
+            failing.process_batch(frames)
+    assert failing.batch_tracks == []
+
+    cropper = solutions.ObjectCropper(model=MODEL, show=SHOW, crop_dir=str(TMP / "crops"))  # no extract_tracks
+    with patch.object(cropper.model, "track") as mock_track:
+        assert len(cropper.process_batch(frames)) == len(frames)
+    mock_track.assert_not_called()
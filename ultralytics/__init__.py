@@ -2,18 +2,30 @@
 
 __version__ = "8.3.176"
 
+import importlib
 import os
+from typing import TYPE_CHECKING
 
 # Set ENV variables (place before imports)
 if not os.environ.get("OMP_NUM_THREADS"):
     os.environ["OMP_NUM_THREADS"] = "1"  # default for reduced CPU utilization during training
 
-from ultralytics.models import NAS, RTDETR, SAM, YOLO, YOLOE, FastSAM, YOLOWorld
-from ultralytics.utils import ASSETS, SETTINGS
-from ultralytics.utils.checks import check_yolo as checks
-from ultralytics.utils.downloads import download
+if TYPE_CHECKING:
+    from ultralytics.models import NAS, RTDETR, SAM, YOLO, YOLOE, FastSAM, YOLOWorld
+    from ultralytics.utils import ASSETS
+    from ultralytics.utils import SETTINGS as settings
+    from ultralytics.utils.checks import check_yolo as checks
+    from ultralytics.utils.downloads import download
+
+MODELS = ("YOLO", "YOLOWorld", "YOLOE", "NAS", "SAM", "FastSAM", "RTDETR")
+LAZY_ATTRS = {  # public attributes imported on first access, as {name: (module, attribute)}
+    **{name: ("ultralytics.models", name) for name in MODELS},
+    "ASSETS": ("ultralytics.utils", "ASSETS"),
+    "settings": ("ultralytics.utils", "SETTINGS"),
+    "checks": ("ultralytics.utils.checks", "check_yolo"),
+    "download": ("ultralytics.utils.downloads", "download"),
+}
 
-settings = SETTINGS
 __all__ = (
     "__version__",
     "ASSETS",
@@ -28,3 +40,18 @@ __all__ = (
     "download",
     "settings",
 )
+
+
+def __getattr__(name: str):
+    """Import model classes and utilities on first access, so 'import ultralytics' does not import PyTorch."""
+    if name in LAZY_ATTRS:
+        module, attr = LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module), attr)
+        globals()[name] = value  # cache, later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily imported attributes in the attribute list."""
+    return sorted({*globals(), *__all__})
@@ -135,6 +135,7 @@ CLI_HELP_MSG = f"""
         yolo copy-cfg
         yolo cfg
         yolo solutions help
+        yolo serve model=yolo11n.pt port=8000
 
     Docs: https://docs.ultralytics.com
     Solutions: https://docs.ultralytics.com/solutions/
@@ -181,6 +182,7 @@ CFG_FRACTION_KEYS = frozenset(
         "conf",
         "iou",
         "fraction",
+        "tile_overlap",
     }
 )
 CFG_INT_KEYS = frozenset(
@@ -193,6 +195,10 @@ CFG_INT_KEYS = frozenset(
         "mask_ratio",
         "max_det",
         "vid_stride",
+        "tile",
+        "threads",
+        "inter_threads",
+        "streams",
         "line_width",
         "nbs",
         "save_period",
@@ -224,6 +230,8 @@ CFG_BOOL_KEYS = frozenset(
         "augment",
         "agnostic_nms",
         "retina_masks",
+        "roi_masks",
+        "lazy",
         "show_boxes",
         "keras",
         "optimize",
@@ -630,6 +638,49 @@ def handle_yolo_settings(args: List[str]) -> None:
         LOGGER.warning(f"settings error: '{e}'. Please see {url} for help.")
 
 
+def handle_yolo_serve(args: List[str]) -> None:
+    """
+    Serve a YOLO model over HTTP with dynamic request batching.
+
+    Server arguments are `host`, `port`, `unix`, `workers`, `max_batch`, `max_delay`, `max_queue` and `max_body`. All
+    other arguments are predict arguments applied to every request, i.e. `conf=0.5` or `imgsz=640`.
+
+    Args:
+        args (List[str]): Command-line arguments in the format 'key=value'.
+
+    Examples:
+        Serve a model on port 8000 with two worker processes:
+        >>> handle_yolo_serve(["model=yolo11n.pt", "port=8000", "workers=2"])
+
+        Serve on a Unix socket, batching up to 16 requests that arrive within 10 ms:
+        >>> handle_yolo_serve(["model=yolo11n.onnx", "unix=/tmp/yolo.sock", "max_batch=16", "max_delay=10"])
+    """
+    from ultralytics.engine.server import InferenceServer
+
+    server_args = {"host": "127.0.0.1", "port": 8000, "unix": None}
+    server_kwargs = {"workers": 1, "max_batch": 8, "max_delay": 5.0, "max_queue": 256, "max_body": 32 << 20}
+    overrides = {}
+    for arg in merge_equals_args(args):
+        arg = arg.lstrip("-").rstrip(",")
+        if "=" in arg:
+            try:
+                k, v = parse_key_value_pair(arg)
+            except (NameError, SyntaxError, ValueError, AssertionError) as e:
+                check_dict_alignment({**DEFAULT_CFG_DICT, **server_args, **server_kwargs}, {arg: ""}, e)
+            if k in server_args:
+                server_args[k] = v
+            elif k in server_kwargs:
+                server_kwargs[k] = v
+            else:
+                overrides[k] = v
+        elif isinstance(DEFAULT_CFG_DICT.get(arg), bool):
+            overrides[arg] = True
+    check_dict_alignment(DEFAULT_CFG_DICT, overrides)
+    check_cfg(overrides)
+    model = overrides.pop("model", None) or "yolo11n.pt"
+    InferenceServer(model, **server_kwargs, **overrides).run(**server_args)
+
+
 def handle_yolo_solutions(args: List[str]) -> None:
     """
     Process YOLO solutions arguments and run the specified computer vision solutions pipeline.
@@ -862,11 +913,12 @@ def entrypoint(debug: str = "") -> None:
         "logout": lambda: handle_yolo_hub(args),
         "copy-cfg": copy_default_cfg,
         "solutions": lambda: handle_yolo_solutions(args[1:]),
+        "serve": lambda: handle_yolo_serve(args[1:]),
     }
     full_args_dict = {**DEFAULT_CFG_DICT, **{k: None for k in TASKS}, **{k: None for k in MODES}, **special}
 
     # Define common misuses of special commands, i.e. -h, -help, --help
-    special.update({k[0]: v for k, v in special.items()})  # singular
+    special.update({k[0]: v for k, v in special.items() if k != "serve"})  # singular, 's' stays 'solutions'
     special.update({k[:-1]: v for k, v in special.items() if len(k) > 1 and k.endswith("s")})  # singular
     special = {**special, **{f"-{k}": v for k, v in special.items()}, **{f"--{k}": v for k, v in special.items()}}
 
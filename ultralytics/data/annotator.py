@@ -17,6 +17,7 @@ def auto_annotate(
     max_det: int = 300,
     classes: Optional[List[int]] = None,
     output_dir: Optional[Union[str, Path]] = None,
+    batch: int = 8,
 ) -> None:
     """
     Automatically annotate images using a YOLO object detection model and a SAM segmentation model.
@@ -36,6 +37,7 @@ def auto_annotate(
         classes (List[int], optional): Filter predictions to specified class IDs, returning only relevant detections.
         output_dir (str | Path, optional): Directory to save the annotated results. If None, creates a default
             directory based on the input data path.
+        batch (int): Number of images segmented per SAM call, whose images are encoded and boxes decoded together.
 
     Examples:
         >>> from ultralytics.data.annotator import auto_annotate
@@ -53,15 +55,26 @@ def auto_annotate(
         data, stream=True, device=device, conf=conf, iou=iou, imgsz=imgsz, max_det=max_det, classes=classes
     )
 
-    for result in det_results:
-        class_ids = result.boxes.cls.int().tolist()  # Extract class IDs from detection results
-        if class_ids:
-            boxes = result.boxes.xyxy  # Boxes object for bbox outputs
-            sam_results = sam_model(result.orig_img, bboxes=boxes, verbose=False, save=False, device=device)
-            segments = sam_results[0].masks.xyn
-
+    def annotate(results):
+        """Segment the detections of a batch of images and write their labels."""
+        sam_results = sam_model.predict_batch(
+            [r.orig_img for r in results], bboxes=[r.boxes.xyxy for r in results], verbose=False, device=device
+        )
+        for result, sam_result in zip(results, sam_results):
+            class_ids = result.boxes.cls.int().tolist()  # Extract class IDs from detection results
+            segments = sam_result.masks.xyn
             with open(f"{Path(output_dir) / Path(result.path).stem}.txt", "w", encoding="utf-8") as f:
                 for i, s in enumerate(segments):
                     if s.any():
                         segment = map(str, s.reshape(-1).tolist())
                         f.write(f"{class_ids[i]} " + " ".join(segment) + "\n")
+
+    results = []
+    for result in det_results:
+        if len(result.boxes):  # images without detections get no label file
+            results.append(result)
+        if len(results) == batch:
+            annotate(results)
+            results = []
+    if results:
+        annotate(results)
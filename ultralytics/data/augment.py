@@ -3,7 +3,7 @@
 import math
 import random
 from copy import deepcopy
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -1605,6 +1605,7 @@ class LetterBox:
 
     Methods:
         __call__: Resize and pad image, update labels and bounding boxes.
+        get_params: Compute the resize and padding geometry for an image shape.
 
     Examples:
         >>> transform = LetterBox(new_shape=(640, 640))
@@ -1681,6 +1682,52 @@ class LetterBox:
         img = labels.get("img") if image is None else image
         shape = img.shape[:2]  # current shape [height, width]
         new_shape = labels.pop("rect_shape", self.new_shape)
+        new_unpad, ratio, (top, bottom, left, right) = self.get_params(shape, new_shape)
+
+        if shape[::-1] != new_unpad:  # resize
+            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
+            if img.ndim == 2:
+                img = img[..., None]
+
+        h, w, c = img.shape
+        if c == 3:
+            img = cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114))
+        else:  # multispectral
+            pad_img = np.full((h + top + bottom, w + left + right, c), fill_value=114, dtype=img.dtype)
+            pad_img[top : top + h, left : left + w] = img
+            img = pad_img
+
+        if labels.get("ratio_pad"):
+            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+
+        if len(labels):
+            labels = self._update_labels(labels, ratio, left, top)
+            labels["img"] = img
+            labels["resized_shape"] = new_shape
+            return labels
+        else:
+            return img
+
+    def get_params(
+        self, shape: Tuple[int, int], new_shape: Optional[Union[int, Tuple[int, int]]] = None
+    ) -> Tuple[Tuple[int, int], Tuple[float, float], Tuple[int, int, int, int]]:
+        """
+        Compute the resize and padding geometry used to letterbox an image of a given shape.
+
+        Args:
+            shape (Tuple[int, int]): Current image shape (height, width).
+            new_shape (int | Tuple[int, int], optional): Target shape (height, width), defaults to `self.new_shape`.
+
+        Returns:
+            new_unpad (Tuple[int, int]): Resized image size (width, height) before padding.
+            ratio (Tuple[float, float]): Scaling ratios (width, height).
+            pad (Tuple[int, int, int, int]): Padding (top, bottom, left, right) in pixels.
+
+        Examples:
+            >>> letterbox = LetterBox(new_shape=(640, 640))
+            >>> new_unpad, ratio, (top, bottom, left, right) = letterbox.get_params((480, 640))
+        """
+        new_shape = self.new_shape if new_shape is None else new_shape
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
 
@@ -1704,31 +1751,9 @@ class LetterBox:
             dw /= 2  # divide padding into 2 sides
             dh /= 2
 
-        if shape[::-1] != new_unpad:  # resize
-            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
-            if img.ndim == 2:
-                img = img[..., None]
-
         top, bottom = int(round(dh - 0.1)) if self.center else 0, int(round(dh + 0.1))
         left, right = int(round(dw - 0.1)) if self.center else 0, int(round(dw + 0.1))
-        h, w, c = img.shape
-        if c == 3:
-            img = cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114))
-        else:  # multispectral
-            pad_img = np.full((h + top + bottom, w + left + right, c), fill_value=114, dtype=img.dtype)
-            pad_img[top : top + h, left : left + w] = img
-            img = pad_img
-
-        if labels.get("ratio_pad"):
-            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
-
-        if len(labels):
-            labels = self._update_labels(labels, ratio, left, top)
-            labels["img"] = img
-            labels["resized_shape"] = new_shape
-            return labels
-        else:
-            return img
+        return new_unpad, ratio, (top, bottom, left, right)
 
     @staticmethod
     def _update_labels(labels: Dict[str, Any], ratio: Tuple[float, float], padw: float, padh: float) -> Dict[str, Any]:
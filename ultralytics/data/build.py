@@ -17,6 +17,7 @@ from ultralytics.data.loaders import (
     LoadImagesAndVideos,
     LoadPilAndNumpy,
     LoadScreenshots,
+    LoadSharedMemory,
     LoadStreams,
     LoadTensor,
     SourceTypes,
@@ -281,7 +282,12 @@ def load_inference_source(source=None, batch: int = 1, vid_stride: int = 1, buff
 
         Load a video stream source
         >>> dataset = load_inference_source("rtsp://example.com/stream", vid_stride=2)
+
+        Load frames from shared-memory rings written by decode processes
+        >>> dataset = load_inference_source("shm://cam0,cam1")
     """
+    if isinstance(source, str) and source.startswith("shm://"):  # shared-memory frame rings, see SharedFrameRing
+        source = LoadSharedMemory(source[len("shm://") :], buffer=buffer)
     source, stream, screenshot, from_img, in_memory, tensor = check_source(source)
     source_type = source.source_type if in_memory else SourceTypes(stream, screenshot, from_img, tensor)
 
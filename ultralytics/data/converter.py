@@ -1,12 +1,18 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import contextlib
 import json
+import math
 import random
+import re
 import shutil
+import tempfile
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -225,6 +231,90 @@ def coco80_to_coco91_class() -> List[int]:
     ]
 
 
+def stream_json(json_file: Union[str, Path], chunk_size: int = 1 << 22) -> Iterator[Tuple[str, Any]]:
+    """
+    Parse a JSON object file incrementally, yielding its top-level items without loading the whole file.
+
+    The file is read `chunk_size` characters at a time and decoded with `json.JSONDecoder.raw_decode`. Top-level arrays
+    such as COCO 'images' and 'annotations' are yielded element by element, so memory is bounded by the chunk size and
+    the largest element instead of the file size.
+
+    Args:
+        json_file (str | Path): Path to a JSON file holding an object at the top level.
+        chunk_size (int, optional): Number of characters to read at a time.
+
+    Yields:
+        key (str): The top-level key.
+        value (Any): Each element of the value if it is an array, otherwise the value itself.
+
+    Examples:
+        >>> for key, x in stream_json("instances_val2017.json"):
+        ...     if key == "annotations":
+        ...         print(x["image_id"], x["bbox"])
+    """
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r"\s*")
+    with open(json_file, encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+
+        def fill():
+            """Append the next chunk to the unparsed part of the buffer, return False at the end of the file."""
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            return not eof
+
+        def peek():
+            """Skip whitespace and return the next character, reading more chunks as needed."""
+            nonlocal pos
+            while True:
+                pos = whitespace.match(buf, pos).end()
+                if pos < len(buf) or not fill():
+                    return buf[pos : pos + 1]
+
+        def decode():
+            """Decode the next value, reading more chunks until it is complete."""
+            nonlocal pos
+            while True:
+                peek()
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if not fill():
+                        raise
+                    continue
+                if end < len(buf):
+                    pos = end
+                    return value
+                start = pos
+                if not fill():  # a value ending the buffer, i.e. a number, may continue in the next chunk
+                    pos = end - start  # the buffer now starts at the value
+                    return value
+
+        def expect(char):
+            """Consume the expected structural character."""
+            nonlocal pos
+            if peek() != char:
+                raise ValueError(f"Expecting '{char}' at character {pos} of the buffer while streaming {json_file}")
+            pos += 1
+
+        expect("{")
+        while peek() != "}":
+            key = decode()
+            expect(":")
+            if peek() == "[":
+                pos += 1
+                while peek() != "]":
+                    yield key, decode()
+                    if peek() == ",":
+                        pos += 1
+                pos += 1
+            else:
+                yield key, decode()
+            if peek() == ",":
+                pos += 1
+
+
 def convert_coco(
     labels_dir: str = "../coco/annotations/",
     save_dir: str = "coco_converted/",
@@ -232,10 +322,18 @@ def convert_coco(
     use_keypoints: bool = False,
     cls91to80: bool = True,
     lvis: bool = False,
+    workers: int = NUM_THREADS,
+    bucket_size: int = 1 << 26,
 ):
     """
     Convert COCO dataset annotations to a YOLO annotation format suitable for training YOLO models.
 
+    Annotation files are streamed with `stream_json` and their images and annotations are spilled to temporary JSON
+    lines buckets grouped by image ID, so memory stays bounded for Objects365- or LVIS-sized files. Spilled lines are
+    buffered and appended to their buckets one file at a time, so the number of open files does not grow with the number
+    of buckets. Each bucket holds all annotations of its images and is converted to label files by a pool of worker
+    processes, each holding one bucket of about `bucket_size` bytes at a time.
+
     Args:
         labels_dir (str, optional): Path to directory containing COCO dataset annotation files.
         save_dir (str, optional): Path to directory to save results to.
@@ -243,6 +341,10 @@ def convert_coco(
         use_keypoints (bool, optional): Whether to include keypoint annotations in the output.
         cls91to80 (bool, optional): Whether to map 91 COCO class IDs to the corresponding 80 COCO class IDs.
         lvis (bool, optional): Whether to convert data in lvis dataset way.
+        workers (int, optional): Number of worker processes writing label files, buckets are converted in the main
+            process if 0 or 1.
+        bucket_size (int, optional): Approximate size in bytes of the annotation file part held by each bucket, and of
+            the lines buffered in memory before they are appended to the buckets.
 
     Examples:
         >>> from ultralytics.data.converter import convert_coco
@@ -258,8 +360,10 @@ def convert_coco(
     for p in save_dir / "labels", save_dir / "images":
         p.mkdir(parents=True, exist_ok=True)  # make dir
 
-    # Convert classes
-    coco80 = coco91_to_coco80_class()
+    # Annotation fields used for conversion, the rest is not written to buckets
+    keys = {"image_id", "bbox", "category_id", "iscrowd"}
+    keys |= {"segmentation"} if use_segments else set()
+    keys |= {"keypoints"} if use_keypoints else set()
 
     # Import json
     for json_file in sorted(Path(labels_dir).resolve().glob("*.json")):
@@ -271,79 +375,151 @@ def convert_coco(
             # since LVIS val set contains images from COCO 2017 train in addition to the COCO 2017 val split.
             (fn / "train2017").mkdir(parents=True, exist_ok=True)
             (fn / "val2017").mkdir(parents=True, exist_ok=True)
-        with open(json_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Create image dict
-        images = {f"{x['id']:d}": x for x in data["images"]}
-        # Create image-annotations dict
-        annotations = defaultdict(list)
-        for ann in data["annotations"]:
-            annotations[ann["image_id"]].append(ann)
 
         image_txt = []
-        # Write labels file
-        for img_id, anns in TQDM(annotations.items(), desc=f"Annotations {json_file}"):
-            img = images[f"{img_id:d}"]
-            h, w = img["height"], img["width"]
-            f = str(Path(img["coco_url"]).relative_to("http://images.cocodataset.org")) if lvis else img["file_name"]
-            if lvis:
-                image_txt.append(str(Path("./images") / f))
-
-            bboxes = []
-            segments = []
-            keypoints = []
-            for ann in anns:
-                if ann.get("iscrowd", False):
-                    continue
-                # The COCO box format is [top left x, top left y, width, height]
-                box = np.array(ann["bbox"], dtype=np.float64)
-                box[:2] += box[2:] / 2  # xy top-left corner to center
-                box[[0, 2]] /= w  # normalize x
-                box[[1, 3]] /= h  # normalize y
-                if box[2] <= 0 or box[3] <= 0:  # if w <= 0 and h <= 0
+        with tempfile.TemporaryDirectory(dir=save_dir) as tmp:
+            # Spill images and annotations to buckets by image ID, so each bucket holds everything about its images
+            n = max(workers, 1, math.ceil(json_file.stat().st_size / bucket_size))
+            buckets = [Path(tmp) / f"{i}.jsonl" for i in range(n)]
+            for b in buckets:
+                b.touch()
+            pending, size = defaultdict(list), 0  # lines buffered per bucket
+
+            def flush():
+                """Append the buffered lines to their buckets, with a single bucket file open at a time."""
+                for i, lines in pending.items():
+                    with open(buckets[i], "a", encoding="utf-8") as f:
+                        f.writelines(lines)
+                pending.clear()
+
+            for key, x in TQDM(stream_json(json_file), desc=f"Reading {json_file}", unit=" items"):
+                if key == "images":
+                    img = {k: x[k] for k in ("id", "height", "width", "file_name", "coco_url") if k in x}
+                    i, line = x["id"] % n, json.dumps({"image": img}) + "\n"
+                elif key == "annotations":
+                    i, line = x["image_id"] % n, json.dumps({k: v for k, v in x.items() if k in keys}) + "\n"
+                else:
                     continue
-
-                cls = coco80[ann["category_id"] - 1] if cls91to80 else ann["category_id"] - 1  # class
-                box = [cls] + box.tolist()
-                if box not in bboxes:
-                    bboxes.append(box)
-                    if use_segments and ann.get("segmentation") is not None:
-                        if len(ann["segmentation"]) == 0:
-                            segments.append([])
-                            continue
-                        elif len(ann["segmentation"]) > 1:
-                            s = merge_multi_segment(ann["segmentation"])
-                            s = (np.concatenate(s, axis=0) / np.array([w, h])).reshape(-1).tolist()
-                        else:
-                            s = [j for i in ann["segmentation"] for j in i]  # all segments concatenated
-                            s = (np.array(s).reshape(-1, 2) / np.array([w, h])).reshape(-1).tolist()
-                        s = [cls] + s
-                        segments.append(s)
-                    if use_keypoints and ann.get("keypoints") is not None:
-                        keypoints.append(
-                            box + (np.array(ann["keypoints"]).reshape(-1, 3) / np.array([w, h, 1])).reshape(-1).tolist()
-                        )
-
-            # Write
-            with open((fn / f).with_suffix(".txt"), "a", encoding="utf-8") as file:
-                for i in range(len(bboxes)):
-                    if use_keypoints:
-                        line = (*(keypoints[i]),)  # cls, box, keypoints
-                    else:
-                        line = (
-                            *(segments[i] if use_segments and len(segments[i]) > 0 else bboxes[i]),
-                        )  # cls, box or segments
-                    file.write(("%g " * len(line)).rstrip() % line + "\n")
+                pending[i].append(line)
+                size += len(line)
+                if size >= bucket_size:
+                    flush()
+                    size = 0
+            flush()
+
+            # Write labels files
+            convert = partial(
+                convert_coco_bucket,
+                save_dir=fn,
+                use_segments=use_segments,
+                use_keypoints=use_keypoints,
+                cls91to80=cls91to80,
+                lvis=lvis,
+            )
+            with Pool(workers) if workers > 1 else contextlib.nullcontext() as pool:
+                results = pool.imap_unordered(convert, buckets) if pool else map(convert, buckets)
+                for paths in TQDM(results, total=n, desc=f"Annotations {json_file}"):
+                    image_txt.extend(paths)
 
         if lvis:
             filename = Path(save_dir) / json_file.name.replace("lvis_v1_", "").replace(".json", ".txt")
             with open(filename, "a", encoding="utf-8") as f:
-                f.writelines(f"{line}\n" for line in image_txt)
+                f.writelines(f"{line}\n" for line in sorted(image_txt))  # buckets finish in any order
 
     LOGGER.info(f"{'LVIS' if lvis else 'COCO'} data converted successfully.\nResults saved to {save_dir.resolve()}")
 
 
+def convert_coco_bucket(
+    bucket: Union[str, Path],
+    save_dir: Path,
+    use_segments: bool = False,
+    use_keypoints: bool = False,
+    cls91to80: bool = True,
+    lvis: bool = False,
+) -> List[str]:
+    """
+    Convert the images and annotations of a `convert_coco` bucket to YOLO label files.
+
+    Args:
+        bucket (str | Path): Path to a JSON lines file with '{"image": {...}}' image lines and COCO annotation lines.
+        save_dir (Path): Labels directory of the annotation file.
+        use_segments (bool, optional): Whether to include segmentation masks in the output.
+        use_keypoints (bool, optional): Whether to include keypoint annotations in the output.
+        cls91to80 (bool, optional): Whether to map 91 COCO class IDs to the corresponding 80 COCO class IDs.
+        lvis (bool, optional): Whether to convert data in lvis dataset way.
+
+    Returns:
+        (List[str]): Image paths of the converted images relative to the dataset root, only for LVIS.
+    """
+    coco80 = np.array(coco91_to_coco80_class(), dtype=object)
+    images, annotations = {}, defaultdict(list)
+    with open(bucket, encoding="utf-8") as f:
+        for line in f:
+            x = json.loads(line)
+            if "image" in x:
+                images[x["image"]["id"]] = x["image"]
+            else:
+                annotations[x["image_id"]].append(x)
+
+    image_txt = []
+    for img_id, anns in annotations.items():
+        img = images[img_id]
+        h, w = img["height"], img["width"]
+        f = str(Path(img["coco_url"]).relative_to("http://images.cocodataset.org")) if lvis else img["file_name"]
+        if lvis:
+            image_txt.append(str(Path("./images") / f))
+
+        # Normalize the boxes of all annotations of the image at once
+        # The COCO box format is [top left x, top left y, width, height]
+        anns = [ann for ann in anns if not ann.get("iscrowd", False)]
+        xywh = np.array([ann["bbox"] for ann in anns], dtype=np.float64).reshape(-1, 4)
+        xywh[:, :2] += xywh[:, 2:] / 2  # xy top-left corner to center
+        xywh[:, [0, 2]] /= w  # normalize x
+        xywh[:, [1, 3]] /= h  # normalize y
+        category = np.array([ann["category_id"] - 1 for ann in anns], dtype=np.int64)
+        cls = coco80[category] if cls91to80 else category  # class
+        valid = (xywh[:, 2] > 0) & (xywh[:, 3] > 0)  # skip if w <= 0 or h <= 0
+
+        bboxes = []
+        seen = set()
+        segments = []
+        keypoints = []
+        for ann, c, b, v in zip(anns, cls.tolist(), xywh.tolist(), valid.tolist()):
+            if not v:
+                continue
+            box = [c] + b
+            if tuple(box) in seen:
+                continue
+            seen.add(tuple(box))
+            bboxes.append(box)
+            if use_segments and ann.get("segmentation") is not None:
+                if len(ann["segmentation"]) == 0:
+                    segments.append([])
+                    continue
+                elif len(ann["segmentation"]) > 1:
+                    s = merge_multi_segment(ann["segmentation"])
+                    s = (np.concatenate(s, axis=0) / np.array([w, h])).reshape(-1).tolist()
+                else:
+                    s = (np.array(ann["segmentation"][0]).reshape(-1, 2) / np.array([w, h])).reshape(-1).tolist()
+                segments.append([c] + s)
+            if use_keypoints and ann.get("keypoints") is not None:
+                keypoints.append(
+                    box + (np.array(ann["keypoints"]).reshape(-1, 3) / np.array([w, h, 1])).reshape(-1).tolist()
+                )
+
+        # Write
+        with open((save_dir / f).with_suffix(".txt"), "a", encoding="utf-8") as file:
+            for i in range(len(bboxes)):
+                if use_keypoints:
+                    line = (*(keypoints[i]),)  # cls, box, keypoints
+                else:
+                    line = (
+                        *(segments[i] if use_segments and len(segments[i]) > 0 else bboxes[i]),
+                    )  # cls, box or segments
+                file.write(("%g " * len(line)).rstrip() % line + "\n")
+    return image_txt
+
+
 def convert_segment_masks_to_yolo_seg(masks_dir: str, output_dir: str, classes: int):
     """
     Convert a dataset of segmentation mask images to the YOLO segmentation format.
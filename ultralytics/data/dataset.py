@@ -2,8 +2,8 @@
 
 import json
 from collections import defaultdict
-from itertools import repeat
-from multiprocessing.pool import ThreadPool
+from itertools import chain, repeat
+from multiprocessing.pool import Pool, ThreadPool
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -32,12 +32,13 @@ from .converter import merge_multi_segment
 from .utils import (
     HELP_URL,
     check_file_speeds,
+    file_signature,
     get_hash,
     img2label_paths,
     load_dataset_cache_file,
     save_dataset_cache_file,
     verify_image,
-    verify_image_label,
+    verify_image_labels,
 )
 
 # Ultralytics dataset *.cache version, >= 1.0.0 for Ultralytics YOLO models
@@ -91,6 +92,10 @@ class YOLODataset(BaseDataset):
         """
         Cache dataset labels, check images and read shapes.
 
+        Images and labels are verified in chunks, in a process pool for large datasets. Files whose size and
+        modification time are unchanged since a previous cache at `path` reuse its labels instead of being verified
+        again.
+
         Args:
             path (Path): Path where to save the cache file.
 
@@ -107,29 +112,36 @@ class YOLODataset(BaseDataset):
                 "'kpt_shape' in data.yaml missing or incorrect. Should be a list with [number of "
                 "keypoints, number of dims (2 for x,y or 3 for x,y,visible)], i.e. 'kpt_shape: [17, 3]'"
             )
-        with ThreadPool(NUM_THREADS) as pool:
-            results = pool.imap(
-                func=verify_image_label,
-                iterable=zip(
-                    self.im_files,
-                    self.label_files,
-                    repeat(self.prefix),
-                    repeat(self.use_keypoints),
-                    repeat(len(self.data["names"])),
-                    repeat(nkpt),
-                    repeat(ndim),
-                    repeat(self.single_cls),
-                ),
-            )
-            pbar = TQDM(results, desc=desc, total=total)
-            for im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg in pbar:
-                nm += nm_f
-                nf += nf_f
-                ne += ne_f
-                nc += nc_f
-                if im_file:
-                    x["labels"].append(
-                        {
+        params = (self.use_keypoints, len(self.data["names"]), nkpt, ndim, self.single_cls)
+        try:  # reuse labels of files unchanged since the previous scan
+            previous = load_dataset_cache_file(path)
+            assert previous["version"] == DATASET_CACHE_VERSION and previous.get("params") == params
+            stats, previous = previous["stats"], {lb["im_file"]: lb for lb in previous["labels"]}
+        except (FileNotFoundError, AssertionError, AttributeError, KeyError):
+            stats, previous = {}, {}
+        x["params"], x["stats"] = params, {}
+        signatures = [file_signature(*f) for f in zip(self.im_files, self.label_files)]
+        reused = [
+            (previous[f], stats[f][1]) if f in previous and stats[f][0] == s else None
+            for f, s in zip(self.im_files, signatures)
+        ]
+        args = [
+            (f, lb_file, self.prefix, self.use_keypoints, len(self.data["names"]), nkpt, ndim, self.single_cls)
+            for f, lb_file, r in zip(self.im_files, self.label_files, reused)
+            if r is None
+        ]
+        bs = min(256, max(1, -(-len(args) // NUM_THREADS)))  # files per task
+        chunks = [args[i : i + bs] for i in range(0, len(args), bs)]
+        # Processes avoid GIL contention on large scans, threads avoid their startup cost on small ones
+        with (Pool if len(args) > 10000 else ThreadPool)(NUM_THREADS) as pool:
+            verified = chain.from_iterable(pool.imap(func=verify_image_labels, iterable=chunks))
+            pbar = TQDM(zip(self.im_files, signatures, reused), desc=desc, total=total)
+            for f, signature, r in pbar:
+                if r is None:
+                    im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg = next(verified)
+                    label = None
+                    if im_file:
+                        label = {
                             "im_file": im_file,
                             "shape": shape,
                             "cls": lb[:, 0:1],  # n, 1
@@ -139,7 +151,15 @@ class YOLODataset(BaseDataset):
                             "normalized": True,
                             "bbox_format": "xywh",
                         }
-                    )
+                else:
+                    label, (nm_f, nf_f, ne_f), nc_f, msg = r[0], r[1], 0, ""
+                nm += nm_f
+                nf += nf_f
+                ne += ne_f
+                nc += nc_f
+                if label:
+                    x["labels"].append(label)
+                    x["stats"][f] = signature, (nm_f, nf_f, ne_f)
                 if msg:
                     msgs.append(msg)
                 pbar.desc = f"{desc} {nf} images, {nm + ne} backgrounds, {nc} corrupt"
@@ -182,7 +202,7 @@ class YOLODataset(BaseDataset):
                 LOGGER.info("\n".join(cache["msgs"]))  # display warnings
 
         # Read cache
-        [cache.pop(k) for k in ("hash", "version", "msgs")]  # remove items
+        [cache.pop(k, None) for k in ("hash", "version", "msgs", "params", "stats")]  # remove items
         labels = cache["labels"]
         if not labels:
             raise RuntimeError(
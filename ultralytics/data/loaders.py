@@ -3,12 +3,13 @@
 import glob
 import math
 import os
+import sys
 import time
 import urllib
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Thread
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -635,6 +636,316 @@ class LoadTensor:
         return self.bs
 
 
+class SharedFrameRing:
+    """
+    Ring buffer of image frames in shared memory, written by one producer process and read by one consumer process.
+
+    Frames cross the process boundary without pickling: the producer writes each frame once into a fixed-size slot, or
+    decodes straight into it with `reserve` and `commit`, and the consumer receives a numpy view of the slot. Each slot
+    carries the frame's source ID, timestamp and shape. A frame handed to the consumer stays valid until its next `get`
+    call, as the producer never overwrites frames that have not been released.
+
+    Shared memory layout: an int64 header (slots, capacity, head, tail, closed), an int64 metadata record per slot
+    (frame index, source ID, height, width, channels, timestamp in ns), and `slots` frame buffers of `capacity` bytes.
+
+    Ordering: the producer writes a frame and its metadata before storing the new HEAD index, and the consumer reads,
+    and optionally copies, a frame and its metadata before storing the new TAIL index. Each side only stores its own
+    index, so a slot is never written while it can be read, and a published HEAD always refers to a complete frame.
+
+    Attributes:
+        name (str): Name of the shared memory block.
+        slots (int): Number of frame slots in the ring.
+        capacity (int): Maximum size of a frame in bytes.
+        shm (SharedMemory): The shared memory block.
+        header (np.ndarray): Header fields with shape (8,).
+        meta (np.ndarray): Per-slot metadata records with shape (slots, 6).
+        data (np.ndarray): Frame buffers with shape (slots, capacity).
+
+    Methods:
+        reserve: Wait for a free slot and return a writable view to decode the next frame into.
+        commit: Publish the frame written into the reserved slot.
+        put: Copy a frame into the next free slot and publish it.
+        get: Return the next or the most recent frame and its metadata.
+        close: Mark the ring closed when producing and detach from the shared memory.
+        unlink: Free the shared memory block.
+
+    Examples:
+        Producer process, decoding frames straight into shared memory
+        >>> ring = SharedFrameRing("cam0", shape=(1080, 1920, 3), slots=8, create=True)
+        >>> cap = cv2.VideoCapture("video.mp4")
+        >>> while cap.read(ring.reserve((1080, 1920, 3)))[0]:
+        ...     ring.commit(source=0)
+        >>> ring.close()
+
+        Consumer process, usually through `LoadSharedMemory` or `model.predict(source="shm://cam0")`
+        >>> ring = SharedFrameRing("cam0")
+        >>> frame, meta = ring.get()
+    """
+
+    SLOTS, CAPACITY, HEAD, TAIL, CLOSED = range(5)  # header field indices
+
+    def __init__(
+        self, name: str, shape: Optional[Tuple[int, ...]] = None, slots: int = 8, create: bool = False
+    ) -> None:
+        """
+        Create a new ring buffer, or attach to an existing one by name.
+
+        Args:
+            name (str): Name of the shared memory block.
+            shape (Tuple[int, ...], optional): Largest frame shape (H, W, C), required when creating the ring.
+            slots (int): Number of frame slots, used when creating the ring.
+            create (bool): Whether to create the ring instead of attaching to it.
+        """
+        from multiprocessing import shared_memory
+
+        if create:
+            capacity = int(np.prod(shape))
+            size = 64 + -(-slots * 48 // 64) * 64 + slots * capacity  # header, padded metadata and frames
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            # Attached memory belongs to the producer, do not let this process' resource tracker unlink it at exit
+            if sys.version_info >= (3, 13):
+                self.shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                from multiprocessing import resource_tracker
+
+                self.shm = shared_memory.SharedMemory(name=name)
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+        self.header = np.ndarray((8,), dtype=np.int64, buffer=self.shm.buf)
+        if create:
+            self.header[:] = 0
+            self.header[[self.SLOTS, self.CAPACITY]] = slots, capacity
+        self.name = name
+        self.slots, self.capacity = int(self.header[self.SLOTS]), int(self.header[self.CAPACITY])
+        meta_bytes = -(-self.slots * 48 // 64) * 64  # metadata records padded to a 64-byte boundary
+        self.meta = np.ndarray((self.slots, 6), dtype=np.int64, buffer=self.shm.buf, offset=64)
+        self.data = np.ndarray((self.slots, self.capacity), dtype=np.uint8, buffer=self.shm.buf, offset=64 + meta_bytes)
+        self.create = create
+        self.next = int(self.header[self.TAIL])  # index of the next frame to read
+        self.reserved = None  # shape of the frame being written into the reserved slot
+
+    def reserve(self, shape: Tuple[int, ...], block: bool = True, timeout: Optional[float] = None):
+        """
+        Wait for a free slot and return a writable view to decode the next frame into.
+
+        Args:
+            shape (Tuple[int, ...]): Frame shape (H, W, C) or (H, W).
+            block (bool): Whether to wait for the consumer to release a slot when the ring is full.
+            timeout (float, optional): Maximum time to wait in seconds.
+
+        Returns:
+            (np.ndarray | None): A uint8 view of the slot with the given shape, or None if the ring stayed full, in which
+                case the frame should be dropped.
+        """
+        if int(np.prod(shape)) > self.capacity:
+            raise ValueError(f"Frame shape {tuple(shape)} exceeds the ring capacity of {self.capacity} bytes.")
+        head, deadline = int(self.header[self.HEAD]), time.time() + (timeout or float("inf"))
+        while head - self.header[self.TAIL] >= self.slots:  # ring full, the oldest slot is still held by the consumer
+            if not block or time.time() > deadline:
+                return None
+            time.sleep(0.001)
+        self.reserved = tuple(shape)
+        return self.data[head % self.slots, : int(np.prod(shape))].reshape(shape)
+
+    def commit(self, source: int = 0, timestamp: Optional[float] = None) -> None:
+        """
+        Publish the frame written into the reserved slot.
+
+        Args:
+            source (int): Source ID of the frame, i.e. the camera index when several streams share a ring.
+            timestamp (float, optional): Capture time in seconds since the epoch, defaults to the current time.
+        """
+        assert self.reserved is not None, "commit() requires a slot returned by reserve()"
+        head = int(self.header[self.HEAD])
+        h, w = self.reserved[:2]
+        c = self.reserved[2] if len(self.reserved) > 2 else 1
+        ns = time.time_ns() if timestamp is None else int(timestamp * 1e9)
+        self.meta[head % self.slots] = head, source, h, w, c, ns
+        self.header[self.HEAD] = head + 1  # publish after the frame and metadata are written
+        self.reserved = None
+
+    def put(
+        self,
+        frame: np.ndarray,
+        source: int = 0,
+        timestamp: Optional[float] = None,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Copy a frame into the next free slot and publish it.
+
+        Args:
+            frame (np.ndarray): A uint8 frame of shape (H, W, C) or (H, W).
+            source (int): Source ID of the frame.
+            timestamp (float, optional): Capture time in seconds since the epoch, defaults to the current time.
+            block (bool): Whether to wait for the consumer to release a slot when the ring is full.
+            timeout (float, optional): Maximum time to wait in seconds.
+
+        Returns:
+            (bool): Whether the frame was written, False if it was dropped because the ring stayed full.
+        """
+        if frame.dtype != np.uint8:
+            raise TypeError(f"SharedFrameRing expects uint8 frames, but got {frame.dtype}.")
+        slot = self.reserve(frame.shape, block=block, timeout=timeout)
+        if slot is None:
+            return False
+        slot[:] = frame
+        self.commit(source=source, timestamp=timestamp)
+        return True
+
+    def get(
+        self, latest: bool = False, block: bool = True, timeout: Optional[float] = None, copy: bool = False
+    ) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+        """
+        Release the previously returned frame and return the next one, or the most recent one, with its metadata.
+
+        Args:
+            latest (bool): Whether to skip to the most recent frame, dropping older unread frames.
+            block (bool): Whether to wait for a new frame.
+            timeout (float, optional): Maximum time to wait in seconds.
+            copy (bool): Whether to return a copy of the frame and release its slot immediately, instead of a view that
+                is only valid until the next call.
+
+        Returns:
+            (Tuple[np.ndarray, Dict[str, Any]] | None): The frame with shape (H, W, C), read-only if it is a view, and
+                its metadata with keys 'frame', 'source', 'timestamp' and 'shape', or None when no frame arrived in
+                time or the producer closed the ring.
+        """
+        deadline = time.time() + (timeout or float("inf"))
+        while self.header[self.HEAD] <= self.next:
+            if self.header[self.CLOSED] or not block or time.time() > deadline:
+                return None
+            time.sleep(0.0005)
+        n = int(self.header[self.HEAD]) - 1 if latest else self.next
+        frame, source, h, w, c, ns = (int(x) for x in self.meta[n % self.slots])
+        im = self.data[n % self.slots, : h * w * c].reshape(h, w, c)
+        if copy:
+            im = im.copy()
+        else:
+            im.flags.writeable = False
+        self.next = n + 1
+        self.header[self.TAIL] = self.next if copy else n  # release after reading, hold a returned view until next call
+        return im, {"frame": frame, "source": source, "timestamp": ns / 1e9, "shape": (h, w, c)}
+
+    def close(self) -> None:
+        """Mark the ring closed when producing, so the consumer stops after the remaining frames, and detach from it."""
+        if self.create:
+            self.header[self.CLOSED] = 1
+        else:
+            self.header[self.TAIL] = self.next  # release the held frame
+        self.header = self.meta = self.data = None  # drop views so the memory map can be closed
+        try:
+            self.shm.close()
+        except BufferError:  # frames are still referenced, the mapping is closed once they are garbage collected
+            pass
+
+    def unlink(self) -> None:
+        """Free the shared memory block, called by the producer once the consumer is done with it."""
+        if sys.version_info < (3, 13):  # re-register in case a consumer sharing this resource tracker unregistered it
+            from multiprocessing import resource_tracker
+
+            resource_tracker.register(self.shm._name, "shared_memory")
+        self.shm.unlink()
+
+
+class LoadSharedMemory:
+    """
+    Stream loader reading frames from shared-memory ring buffers written by separate decode processes.
+
+    Each source is a `SharedFrameRing` filled by its own producer process. Every batch holds one frame per ring. By
+    default frames are copied out of shared memory, so that Results keeping the frames, e.g. the list returned by
+    non-streaming `predict`, are not changed when the producer reuses the slots. With `copy=False` the batch holds
+    read-only views of the ring slots instead, skipping the copy: each frame then stays valid only until the next batch
+    is read, so it must not be kept, or must be copied by the consumer, once the loader moves on.
+
+    Attributes:
+        sources (List[str]): Names of the shared memory rings.
+        rings (List[SharedFrameRing]): The attached ring buffers.
+        buffer (bool): Whether to read every frame in order (True) or only the most recent frame of each ring (False).
+        timeout (float | None): Maximum time to wait for a frame in seconds, None to wait until the producer closes.
+        copy (bool): Whether frames are copied out of shared memory (True) or returned as views of the ring slots.
+        mode (str): Set to 'stream' indicating real-time capture.
+        bs (int): Batch size, equal to the number of rings.
+        meta (List[Dict[str, Any]]): Metadata of the frames of the last batch, with keys 'frame', 'source',
+            'timestamp' and 'shape'.
+        source_type (SourceTypes): Source type flags, marking this loader as a stream.
+
+    Methods:
+        close: Detach from all rings.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> model = YOLO("yolo11n.pt")
+        >>> for result in model.predict(source="shm://cam0,cam1", stream=True):
+        ...     pass
+        >>> loader = LoadSharedMemory(["cam0", "cam1"], buffer=True)
+        >>> for paths, frames, info in loader:
+        ...     timestamps = [m["timestamp"] for m in loader.meta]
+
+        Zero-copy streaming, each batch of Results is used before the next one is read
+        >>> for result in model.predict(source=LoadSharedMemory("cam0", copy=False), stream=True):
+        ...     count = len(result.boxes)
+    """
+
+    def __init__(
+        self,
+        sources: Union[str, List[str]],
+        buffer: bool = False,
+        timeout: Optional[float] = None,
+        copy: bool = True,
+    ) -> None:
+        """
+        Attach to the shared memory rings of one or more producers.
+
+        Args:
+            sources (str | List[str]): Ring names, as a list or a comma-separated string.
+            buffer (bool): Whether to read every frame in order (True) or only the most recent frame of each ring (False).
+            timeout (float, optional): Maximum time to wait for a frame in seconds.
+            copy (bool): Whether to copy frames out of shared memory, instead of returning views of the ring slots that
+                are only valid until the next batch is read.
+        """
+        self.sources = sources.split(",") if isinstance(sources, str) else list(sources)
+        self.rings = [SharedFrameRing(name) for name in self.sources]
+        self.buffer = buffer
+        self.timeout = timeout
+        self.copy = copy
+        self.mode = "stream"
+        self.bs = len(self.rings)
+        self.meta = []
+        self.source_type = SourceTypes(stream=True)
+
+    def close(self) -> None:
+        """Detach from all rings, releasing their held frames."""
+        for ring in self.rings:
+            if ring.header is not None:
+                ring.close()
+
+    def __iter__(self):
+        """Iterate over batches of frames from the shared memory rings."""
+        self.count = -1
+        return self
+
+    def __next__(self) -> Tuple[List[str], List[np.ndarray], List[str]]:
+        """Return the next batch with one frame per ring, stopping when a producer closes its ring or times out."""
+        self.count += 1
+        images, meta, info = [], [], []
+        for name, ring in zip(self.sources, self.rings):
+            item = ring.get(latest=not self.buffer, timeout=self.timeout, copy=self.copy)
+            if item is None:
+                self.close()
+                raise StopIteration
+            images.append(item[0])
+            meta.append(item[1])
+            info.append(f"{name} (frame {item[1]['frame']}): ")
+        self.meta = meta
+        return self.sources, images, info
+
+    def __len__(self) -> int:
+        """Return the number of rings, the batch size of the loader."""
+        return self.bs
+
+
 def autocast_list(source: List[Any]) -> List[Union[Image.Image, np.ndarray]]:
     """Merge a list of sources into a list of numpy arrays or PIL images for Ultralytics prediction."""
     files = []
@@ -705,4 +1016,4 @@ def get_best_youtube_url(url: str, method: str = "pytube") -> Optional[str]:
 
 
 # Define constants
-LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadScreenshots)
+LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadScreenshots, LoadSharedMemory)
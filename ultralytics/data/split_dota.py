@@ -1,18 +1,22 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import contextlib
+import io
 import itertools
+import tarfile
+from functools import partial
 from glob import glob
 from math import ceil
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import cv2
 import numpy as np
 from PIL import Image
 
 from ultralytics.data.utils import exif_size, img2label_paths
-from ultralytics.utils import TQDM
-from ultralytics.utils.checks import check_requirements
+from ultralytics.utils import NUM_THREADS, TQDM
 
 
 def bbox_iof(polygon1: np.ndarray, bbox2: np.ndarray, eps: float = 1e-6) -> np.ndarray:
@@ -30,11 +34,11 @@ def bbox_iof(polygon1: np.ndarray, bbox2: np.ndarray, eps: float = 1e-6) -> np.n
     Notes:
         Polygon format: [x1, y1, x2, y2, x3, y3, x4, y4].
         Bounding box format: [x_min, y_min, x_max, y_max].
+        Intersections of all polygon and box pairs whose bounding boxes overlap are computed at once, see
+        `clip_polygons`.
     """
-    check_requirements("shapely>=2.0.0")
-    from shapely.geometry import Polygon
-
     polygon1 = polygon1.reshape(-1, 4, 2)
+    bbox2 = bbox2.reshape(-1, 4)
     lt_point = np.min(polygon1, axis=-2)  # left-top
     rb_point = np.max(polygon1, axis=-2)  # right-bottom
     bbox1 = np.concatenate([lt_point, rb_point], axis=-1)
@@ -44,22 +48,58 @@ def bbox_iof(polygon1: np.ndarray, bbox2: np.ndarray, eps: float = 1e-6) -> np.n
     wh = np.clip(rb - lt, 0, np.inf)
     h_overlaps = wh[..., 0] * wh[..., 1]
 
-    left, top, right, bottom = (bbox2[..., i] for i in range(4))
-    polygon2 = np.stack([left, top, right, top, right, bottom, left, bottom], axis=-1).reshape(-1, 4, 2)
-
-    sg_polys1 = [Polygon(p) for p in polygon1]
-    sg_polys2 = [Polygon(p) for p in polygon2]
     overlaps = np.zeros(h_overlaps.shape)
-    for p in zip(*np.nonzero(h_overlaps)):
-        overlaps[p] = sg_polys1[p[0]].intersection(sg_polys2[p[-1]]).area
-    unions = np.array([p.area for p in sg_polys1], dtype=np.float32)
-    unions = unions[..., None]
+    i, j = np.nonzero(h_overlaps)  # only clip the pairs whose bounding boxes overlap
+    overlaps[i, j] = polygon_area(clip_polygons(polygon1[i], bbox2[j]))
+    unions = polygon_area(polygon1).astype(np.float32)[..., None]
 
     unions = np.clip(unions, eps, np.inf)
-    outputs = overlaps / unions
-    if outputs.ndim == 1:
-        outputs = outputs[..., None]
-    return outputs
+    return overlaps / unions
+
+
+def clip_polygons(polygons: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """
+    Clip polygons to axis-aligned boxes, one box per polygon, with a vectorized Sutherland-Hodgman algorithm.
+
+    Each edge of a polygon is replaced by two vertices for each side of the box, the intersection with the side or
+    the clipped end vertex, and the end vertex projected onto the side. Vertices outside of a side thus end up on that
+    side, where they only add zero-area spikes, so every polygon keeps a fixed number of vertices and the area of the
+    result equals the area of the exact intersection.
+
+    Args:
+        polygons (np.ndarray): Polygon vertices with shape (N, V, 2).
+        boxes (np.ndarray): Boxes with shape (N, 4) in [x_min, y_min, x_max, y_max] format.
+
+    Returns:
+        (np.ndarray): Clipped polygon vertices with shape (N, V * 16, 2), including duplicate and collinear vertices.
+    """
+    pts = polygons.astype(np.float64)
+    boxes = boxes.astype(np.float64)
+    for axis, side, sign in ((0, 0, 1.0), (0, 2, -1.0), (1, 1, 1.0), (1, 3, -1.0)):  # left, right, top, bottom
+        bound = boxes[:, side, None]  # (N, 1)
+        start, end = pts, np.roll(pts, -1, axis=1)  # edges start -> end
+        d_start, d_end = sign * (start[..., axis] - bound), sign * (end[..., axis] - bound)  # >= 0 inside
+        cross = (d_start >= 0) != (d_end >= 0)
+        t = d_start / np.where(cross, d_start - d_end, 1.0)
+        inter = start + t[..., None] * (end - start)
+        proj = end.copy()
+        proj[..., axis] = np.where(d_end < 0, bound, end[..., axis])
+        pts = np.stack([np.where(cross[..., None], inter, proj), proj], axis=2).reshape(len(pts), -1, 2)
+    return pts
+
+
+def polygon_area(polygons: np.ndarray) -> np.ndarray:
+    """
+    Calculate the areas of polygons with the shoelace formula.
+
+    Args:
+        polygons (np.ndarray): Polygon vertices with shape (N, V, 2).
+
+    Returns:
+        (np.ndarray): Polygon areas with shape (N,).
+    """
+    x, y = polygons[..., 0], polygons[..., 1]
+    return 0.5 * np.abs((x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y).sum(-1))
 
 
 def load_yolo_dota(data_root: str, split: str = "train") -> List[Dict[str, Any]]:
@@ -165,6 +205,46 @@ def get_window_obj(anno: Dict[str, Any], windows: np.ndarray, iof_thr: float = 0
         return [np.zeros((0, 9), dtype=np.float32) for _ in range(len(windows))]  # window_anns
 
 
+def crop_windows(
+    anno: Dict[str, Any],
+    windows: np.ndarray,
+    window_objs: List[np.ndarray],
+    allow_background_images: bool = True,
+) -> Iterator[Tuple[str, np.ndarray, str]]:
+    """
+    Crop the windows of an image, decoding the image only once, and yield each crop with its labels.
+
+    Args:
+        anno (Dict[str, Any]): Annotation dict, including 'filepath', 'label', 'ori_size' as its keys.
+        windows (np.ndarray): Array of windows coordinates with shape (N, 4).
+        window_objs (List[np.ndarray]): A list of labels inside each window.
+        allow_background_images (bool, optional): Whether to include background images without labels.
+
+    Yields:
+        name (str): Name of the window, '{image stem}__{crop size}__{x start}___{y start}'.
+        patch_im (np.ndarray): Crop of the image, a view of the decoded image.
+        labels (str): Labels of the window in YOLO OBB text format, empty if the window has no labels.
+    """
+    im = cv2.imread(anno["filepath"])
+    name = Path(anno["filepath"]).stem
+    for window, label in zip(windows, window_objs):
+        x_start, y_start, x_stop, y_stop = window.tolist()
+        new_name = f"{name}__{x_stop - x_start}__{x_start}___{y_start}"
+        patch_im = im[y_start:y_stop, x_start:x_stop]
+        ph, pw = patch_im.shape[:2]
+
+        if not len(label) and not allow_background_images:
+            continue
+        lines = ""
+        if len(label):
+            label[:, 1::2] -= x_start
+            label[:, 2::2] -= y_start
+            label[:, 1::2] /= pw
+            label[:, 2::2] /= ph
+            lines = "".join(f"{int(lb[0])} {' '.join(f'{coord:.6g}' for coord in lb[1:])}\n" for lb in label)
+        yield new_name, patch_im, lines
+
+
 def crop_and_save(
     anno: Dict[str, Any],
     windows: np.ndarray,
@@ -194,27 +274,124 @@ def crop_and_save(
                     - train
                     - val
     """
-    im = cv2.imread(anno["filepath"])
-    name = Path(anno["filepath"]).stem
-    for i, window in enumerate(windows):
-        x_start, y_start, x_stop, y_stop = window.tolist()
-        new_name = f"{name}__{x_stop - x_start}__{x_start}___{y_start}"
-        patch_im = im[y_start:y_stop, x_start:x_stop]
-        ph, pw = patch_im.shape[:2]
+    for new_name, patch_im, lines in crop_windows(anno, windows, window_objs, allow_background_images):
+        cv2.imwrite(str(Path(im_dir) / f"{new_name}.jpg"), patch_im)
+        if lines:
+            with open(Path(lb_dir) / f"{new_name}.txt", "w", encoding="utf-8") as f:
+                f.write(lines)
 
-        label = window_objs[i]
-        if len(label) or allow_background_images:
-            cv2.imwrite(str(Path(im_dir) / f"{new_name}.jpg"), patch_im)
-        if len(label):
-            label[:, 1::2] -= x_start
-            label[:, 2::2] -= y_start
-            label[:, 1::2] /= pw
-            label[:, 2::2] /= ph
 
-            with open(Path(lb_dir) / f"{new_name}.txt", "w", encoding="utf-8") as f:
-                for lb in label:
-                    formatted_coords = [f"{coord:.6g}" for coord in lb[1:]]
-                    f.write(f"{int(lb[0])} {' '.join(formatted_coords)}\n")
+def split_image(
+    anno: Dict[str, Any],
+    crop_sizes: Tuple[int, ...],
+    gaps: Tuple[int, ...],
+    im_dir: str,
+    lb_dir: Optional[str] = None,
+    pack: bool = False,
+) -> List[Tuple[str, bytes, str]]:
+    """
+    Split one image and its labels into windows, saving them to files or returning them encoded for packing.
+
+    Args:
+        anno (Dict[str, Any]): Annotation dict, including 'filepath' and 'ori_size', and 'label' for labeled splits.
+        crop_sizes (Tuple[int, ...]): Tuple of crop sizes.
+        gaps (Tuple[int, ...]): Tuple of gaps between crops.
+        im_dir (str): The output directory path of images.
+        lb_dir (str, optional): The output directory path of labels.
+        pack (bool, optional): Whether to return JPEG-encoded windows instead of writing them to `im_dir` and `lb_dir`.
+
+    Returns:
+        (List[Tuple[str, bytes, str]]): Name, JPEG bytes and label text of each window if `pack`, else an empty list.
+    """
+    windows = get_windows(anno["ori_size"], crop_sizes, gaps)
+    if "label" in anno:
+        window_objs = get_window_obj(anno, windows)
+    else:  # test split, every window is saved without labels
+        window_objs = [np.zeros((0, 9), dtype=np.float32) for _ in range(len(windows))]
+    if not pack:
+        crop_and_save(anno, windows, window_objs, im_dir, lb_dir)
+        return []
+    return [
+        (name, cv2.imencode(".jpg", patch_im)[1].tobytes(), lines)
+        for name, patch_im, lines in crop_windows(anno, windows, window_objs)
+    ]
+
+
+def pack_shards(samples: Iterable[List[Tuple[str, bytes, str]]], shard_dir: Path, prefix: str, shard_size: int) -> int:
+    """
+    Pack window images and labels into uncompressed tar shards of at most `shard_size` windows each.
+
+    Each window is stored as '{name}.jpg' and, if it has labels, '{name}.txt', following the WebDataset layout, so
+    millions of windows are written as a few large sequential files instead of millions of small ones.
+
+    Args:
+        samples (Iterable[List[Tuple[str, bytes, str]]]): Encoded windows of each image, see `split_image`.
+        shard_dir (Path): The output directory of the shards.
+        prefix (str): Shard file name prefix, shards are named '{prefix}-000000.tar', '{prefix}-000001.tar', ...
+        shard_size (int): Maximum number of windows per shard.
+
+    Returns:
+        (int): Number of shards written.
+    """
+    tar, n, shards = None, 0, 0
+    try:
+        for windows in samples:
+            for name, data, lines in windows:
+                if tar is None or n == shard_size:
+                    if tar is not None:
+                        tar.close()
+                    tar, n, shards = tarfile.open(shard_dir / f"{prefix}-{shards:06d}.tar", "w"), 0, shards + 1
+                for file, content in ((f"{name}.jpg", data), (f"{name}.txt", lines.encode())):
+                    if content:
+                        info = tarfile.TarInfo(file)
+                        info.size = len(content)
+                        tar.addfile(info, io.BytesIO(content))
+                n += 1
+    finally:
+        if tar is not None:
+            tar.close()
+    return shards
+
+
+def split_images(
+    annos: List[Dict[str, Any]],
+    desc: str,
+    crop_sizes: Tuple[int, ...],
+    gaps: Tuple[int, ...],
+    im_dir: Path,
+    lb_dir: Optional[Path] = None,
+    workers: int = NUM_THREADS,
+    shard_size: int = 0,
+) -> None:
+    """
+    Split images into windows with a pool of worker processes, writing files or packed shards.
+
+    Args:
+        annos (List[Dict[str, Any]]): Annotation dicts of the images, see `split_image`.
+        desc (str): Progress bar description and shard file name prefix.
+        crop_sizes (Tuple[int, ...]): Tuple of crop sizes.
+        gaps (Tuple[int, ...]): Tuple of gaps between crops.
+        im_dir (Path): The output directory of images, or of the shards if `shard_size`.
+        lb_dir (Path, optional): The output directory of labels.
+        workers (int, optional): Number of worker processes, images are split in the main process if 0 or 1.
+        shard_size (int, optional): Maximum number of windows per tar shard, windows are written as files if 0.
+    """
+    fn = partial(
+        split_image,
+        crop_sizes=crop_sizes,
+        gaps=gaps,
+        im_dir=str(im_dir),
+        lb_dir=lb_dir and str(lb_dir),
+        pack=shard_size > 0,
+    )
+    with Pool(workers) if workers > 1 else contextlib.nullcontext() as pool:
+        results = pool.imap_unordered(fn, annos) if pool else map(fn, annos)
+        results = TQDM(results, total=len(annos), desc=desc)
+        if shard_size > 0:
+            pack_shards(results, im_dir, desc, shard_size)
+        else:
+            for _ in results:
+                pass
 
 
 def split_images_and_labels(
@@ -223,6 +400,8 @@ def split_images_and_labels(
     split: str = "train",
     crop_sizes: Tuple[int, ...] = (1024,),
     gaps: Tuple[int, ...] = (200,),
+    workers: int = NUM_THREADS,
+    shard_size: int = 0,
 ) -> None:
     """
     Split both images and labels for a given dataset split.
@@ -233,6 +412,9 @@ def split_images_and_labels(
         split (str, optional): The split data set, could be 'train' or 'val'.
         crop_sizes (Tuple[int, ...], optional): Tuple of crop sizes.
         gaps (Tuple[int, ...], optional): Tuple of gaps between crops.
+        workers (int, optional): Number of worker processes splitting images in parallel.
+        shard_size (int, optional): Pack windows into tar shards of this many windows in 'save_dir/shards' instead of
+            writing each window as a separate file, 0 to write files.
 
     Notes:
         The directory structure assumed for the DOTA dataset:
@@ -247,21 +429,32 @@ def split_images_and_labels(
                     - split
                 - labels
                     - split
+        or with `shard_size`:
+            - save_dir
+                - shards
+                    - split-000000.tar
     """
-    im_dir = Path(save_dir) / "images" / split
-    im_dir.mkdir(parents=True, exist_ok=True)
-    lb_dir = Path(save_dir) / "labels" / split
-    lb_dir.mkdir(parents=True, exist_ok=True)
+    if shard_size > 0:
+        im_dir = lb_dir = Path(save_dir) / "shards"
+        im_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        im_dir = Path(save_dir) / "images" / split
+        im_dir.mkdir(parents=True, exist_ok=True)
+        lb_dir = Path(save_dir) / "labels" / split
+        lb_dir.mkdir(parents=True, exist_ok=True)
 
     annos = load_yolo_dota(data_root, split=split)
-    for anno in TQDM(annos, total=len(annos), desc=split):
-        windows = get_windows(anno["ori_size"], crop_sizes, gaps)
-        window_objs = get_window_obj(anno, windows)
-        crop_and_save(anno, windows, window_objs, str(im_dir), str(lb_dir))
+    split_images(annos, split, crop_sizes, gaps, im_dir, lb_dir, workers=workers, shard_size=shard_size)
 
 
 def split_trainval(
-    data_root: str, save_dir: str, crop_size: int = 1024, gap: int = 200, rates: Tuple[float, ...] = (1.0,)
+    data_root: str,
+    save_dir: str,
+    crop_size: int = 1024,
+    gap: int = 200,
+    rates: Tuple[float, ...] = (1.0,),
+    workers: int = NUM_THREADS,
+    shard_size: int = 0,
 ) -> None:
     """
     Split train and val sets of DOTA dataset with multiple scaling rates.
@@ -272,6 +465,8 @@ def split_trainval(
         crop_size (int, optional): Base crop size.
         gap (int, optional): Base gap between crops.
         rates (Tuple[float, ...], optional): Scaling rates for crop_size and gap.
+        workers (int, optional): Number of worker processes splitting images in parallel.
+        shard_size (int, optional): Pack windows into tar shards of this many windows instead of separate files.
 
     Notes:
         The directory structure assumed for the DOTA dataset:
@@ -296,11 +491,17 @@ def split_trainval(
         crop_sizes.append(int(crop_size / r))
         gaps.append(int(gap / r))
     for split in {"train", "val"}:
-        split_images_and_labels(data_root, save_dir, split, crop_sizes, gaps)
+        split_images_and_labels(data_root, save_dir, split, crop_sizes, gaps, workers=workers, shard_size=shard_size)
 
 
 def split_test(
-    data_root: str, save_dir: str, crop_size: int = 1024, gap: int = 200, rates: Tuple[float, ...] = (1.0,)
+    data_root: str,
+    save_dir: str,
+    crop_size: int = 1024,
+    gap: int = 200,
+    rates: Tuple[float, ...] = (1.0,),
+    workers: int = NUM_THREADS,
+    shard_size: int = 0,
 ) -> None:
     """
     Split test set of DOTA dataset, labels are not included within this set.
@@ -311,6 +512,9 @@ def split_test(
         crop_size (int, optional): Base crop size.
         gap (int, optional): Base gap between crops.
         rates (Tuple[float, ...], optional): Scaling rates for crop_size and gap.
+        workers (int, optional): Number of worker processes splitting images in parallel.
+        shard_size (int, optional): Pack windows into tar shards of this many windows in 'save_dir/shards' instead of
+            writing each window as a separate file, 0 to write files.
 
     Notes:
         The directory structure assumed for the DOTA dataset:
@@ -326,22 +530,17 @@ def split_test(
     for r in rates:
         crop_sizes.append(int(crop_size / r))
         gaps.append(int(gap / r))
-    save_dir = Path(save_dir) / "images" / "test"
+    save_dir = Path(save_dir) / ("shards" if shard_size > 0 else "images/test")
     save_dir.mkdir(parents=True, exist_ok=True)
 
     im_dir = Path(data_root) / "images" / "test"
     assert im_dir.exists(), f"Can't find {im_dir}, please check your data root."
     im_files = glob(str(im_dir / "*"))
-    for im_file in TQDM(im_files, total=len(im_files), desc="test"):
+    annos = []
+    for im_file in im_files:
         w, h = exif_size(Image.open(im_file))
-        windows = get_windows((h, w), crop_sizes=crop_sizes, gaps=gaps)
-        im = cv2.imread(im_file)
-        name = Path(im_file).stem
-        for window in windows:
-            x_start, y_start, x_stop, y_stop = window.tolist()
-            new_name = f"{name}__{x_stop - x_start}__{x_start}___{y_start}"
-            patch_im = im[y_start:y_stop, x_start:x_stop]
-            cv2.imwrite(str(save_dir / f"{new_name}.jpg"), patch_im)
+        annos.append(dict(ori_size=(h, w), filepath=im_file))
+    split_images(annos, "test", crop_sizes, gaps, save_dir, workers=workers, shard_size=shard_size)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,14 @@
 import json
 import os
 import random
+import struct
 import subprocess
 import time
 import zipfile
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from tarfile import is_tarfile
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -152,19 +153,123 @@ def exif_size(img: Image.Image) -> Tuple[int, int]:
     return s
 
 
+def _jpeg_size(f) -> Optional[Tuple[int, int]]:
+    """Return the exif-corrected (width, height) of an open JPEG file positioned after its SOI marker."""
+    rotation = None
+    while True:
+        marker = f.read(2)
+        while marker[:1] == b"\xff" and marker[1:] == b"\xff":  # fill bytes
+            marker = marker[1:] + f.read(1)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        m = marker[1]
+        if m == 0x01 or 0xD0 <= m <= 0xD7:  # standalone markers
+            continue
+        if m in {0xD9, 0xDA}:  # end of image or start of scan before any frame header
+            return None
+        (length,) = struct.unpack(">H", f.read(2))
+        data = f.read(length - 2)
+        if len(data) < length - 2:
+            return None
+        if 0xC0 <= m <= 0xCF and m not in {0xC4, 0xC8, 0xCC}:  # start of frame
+            h, w = struct.unpack(">HH", data[1:5])
+            return (h, w) if rotation in {6, 8} else (w, h)  # rotation 270 or 90
+        if m == 0xE1 and data[:6] == b"Exif\x00\x00" and rotation is None:  # APP1 EXIF, first one wins
+            tiff = data[6:]
+            e = "<" if tiff[:2] == b"II" else ">"
+            try:
+                (offset,) = struct.unpack(f"{e}I", tiff[4:8])
+                (n,) = struct.unpack(f"{e}H", tiff[offset : offset + 2])
+                for i in range(offset + 2, offset + 2 + 12 * n, 12):
+                    tag, _, _, value = struct.unpack(f"{e}HHIH", tiff[i : i + 10])
+                    if tag == 274:  # the EXIF key for the orientation tag is 274
+                        rotation = value
+                        break
+            except struct.error:
+                pass
+
+
+def image_size(im_file: str) -> Tuple[str, Tuple[int, int]]:
+    """
+    Return the lowercase format and exif-corrected (width, height) of an image.
+
+    JPEG and PNG sizes are read from the file header without decoding the image. Other formats, and headers that can
+    not be parsed, fall back to PIL verification.
+
+    Args:
+        im_file (str): Path to the image file.
+
+    Returns:
+        (str): Lowercase image format, e.g. 'jpeg' or 'png'.
+        (Tuple[int, int]): Image (width, height) after applying the EXIF orientation.
+
+    Examples:
+        >>> fmt, (w, h) = image_size("path/to/image.jpg")
+    """
+    with open(im_file, "rb") as f:
+        head = f.read(24)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+            return "png", struct.unpack(">II", head[16:24])
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            try:
+                if size := _jpeg_size(f):
+                    return "jpeg", size
+            except struct.error:
+                pass
+    im = Image.open(im_file)
+    im.verify()  # PIL verify
+    return im.format.lower(), exif_size(im)
+
+
+def file_signature(*files: str) -> Tuple:
+    """Return the (size, modification time) of each file, or None for files that do not exist."""
+    signature = []
+    for f in files:
+        try:
+            st = os.stat(f)
+            signature.append((st.st_size, st.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def parse_labels(texts: List[str]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Parse the contents of YOLO label files in bulk with a single float conversion.
+
+    Args:
+        texts (List[str]): Contents of the label files, one string per file.
+
+    Returns:
+        (List[Tuple[np.ndarray, np.ndarray]]): For each file the float32 values of all of its rows concatenated and the
+            number of values in each row.
+
+    Raises:
+        ValueError: If any value can not be converted to a float.
+
+    Examples:
+        >>> ((values, lengths),) = parse_labels(["0 0.5 0.5 0.2 0.2\\n1 0.1 0.1 0.1 0.1"])
+        >>> values.reshape(len(lengths), -1).shape
+        (2, 5)
+    """
+    rows = [[x.split() for x in t.strip().splitlines() if len(x)] for t in texts]
+    lengths = [np.array([len(x) for x in r], dtype=np.int64) for r in rows]
+    values = np.array([v for r in rows for x in r for v in x], dtype=np.float32)  # one conversion for all files
+    return list(zip(np.split(values, np.cumsum([n.sum() for n in lengths])[:-1]), lengths))
+
+
 def verify_image(args: Tuple) -> Tuple:
     """Verify one image."""
     (im_file, cls), prefix = args
     # Number (found, corrupt), message
     nf, nc, msg = 0, 0, ""
     try:
-        im = Image.open(im_file)
-        im.verify()  # PIL verify
-        shape = exif_size(im)  # image size
+        fmt, shape = image_size(im_file)  # format, image size
         shape = (shape[1], shape[0])  # hw
         assert (shape[0] > 9) & (shape[1] > 9), f"image size {shape} <10 pixels"
-        assert im.format.lower() in IMG_FORMATS, f"Invalid image format {im.format}. {FORMATS_HELP_MSG}"
-        if im.format.lower() in {"jpg", "jpeg"}:
+        assert fmt in IMG_FORMATS, f"Invalid image format {fmt}. {FORMATS_HELP_MSG}"
+        if fmt in {"jpg", "jpeg"}:
             with open(im_file, "rb") as f:
                 f.seek(-2, 2)
                 if f.read() != b"\xff\xd9":  # corrupt JPEG
@@ -177,20 +282,18 @@ def verify_image(args: Tuple) -> Tuple:
     return (im_file, cls), nf, nc, msg
 
 
-def verify_image_label(args: Tuple) -> List:
-    """Verify one image-label pair."""
+def verify_image_label(args: Tuple, label: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> List:
+    """Verify one image-label pair, optionally with its label file already parsed by parse_labels()."""
     im_file, lb_file, prefix, keypoint, num_cls, nkpt, ndim, single_cls = args
     # Number (missing, found, empty, corrupt), message, segments, keypoints
     nm, nf, ne, nc, msg, segments, keypoints = 0, 0, 0, 0, "", [], None
     try:
         # Verify images
-        im = Image.open(im_file)
-        im.verify()  # PIL verify
-        shape = exif_size(im)  # image size
+        fmt, shape = image_size(im_file)  # format, image size
         shape = (shape[1], shape[0])  # hw
         assert (shape[0] > 9) & (shape[1] > 9), f"image size {shape} <10 pixels"
-        assert im.format.lower() in IMG_FORMATS, f"invalid image format {im.format}. {FORMATS_HELP_MSG}"
-        if im.format.lower() in {"jpg", "jpeg"}:
+        assert fmt in IMG_FORMATS, f"invalid image format {fmt}. {FORMATS_HELP_MSG}"
+        if fmt in {"jpg", "jpeg"}:
             with open(im_file, "rb") as f:
                 f.seek(-2, 2)
                 if f.read() != b"\xff\xd9":  # corrupt JPEG
@@ -200,13 +303,20 @@ def verify_image_label(args: Tuple) -> List:
         # Verify labels
         if os.path.isfile(lb_file):
             nf = 1  # label found
-            with open(lb_file, encoding="utf-8") as f:
-                lb = [x.split() for x in f.read().strip().splitlines() if len(x)]
-                if any(len(x) > 6 for x in lb) and (not keypoint):  # is segment
-                    classes = np.array([x[0] for x in lb], dtype=np.float32)
-                    segments = [np.array(x[1:], dtype=np.float32).reshape(-1, 2) for x in lb]  # (cls, xy1...)
-                    lb = np.concatenate((classes.reshape(-1, 1), segments2boxes(segments)), 1)  # (cls, xywh)
-                lb = np.array(lb, dtype=np.float32)
+            if label is None:
+                with open(lb_file, encoding="utf-8") as f:
+                    label = parse_labels([f.read()])[0]
+            values, lengths = label
+            if (lengths > 6).any() and (not keypoint):  # is segment
+                rows = np.split(values, np.cumsum(lengths)[:-1])
+                classes = np.array([x[0] for x in rows], dtype=np.float32)
+                segments = [x[1:].reshape(-1, 2) for x in rows]  # (cls, xy1...)
+                lb = np.concatenate((classes.reshape(-1, 1), segments2boxes(segments)), 1)  # (cls, xywh)
+            elif len(lengths):
+                assert (lengths == lengths[0]).all(), "labels require the same number of columns in each row"
+                lb = values.reshape(len(lengths), -1)
+            else:
+                lb = values
             if nl := len(lb):
                 if keypoint:
                     assert lb.shape[1] == (5 + nkpt * ndim), f"labels require {(5 + nkpt * ndim)} columns each"
@@ -251,6 +361,34 @@ def verify_image_label(args: Tuple) -> List:
         return [None, None, None, None, None, nm, nf, ne, nc, msg]
 
 
+def verify_image_labels(args: List[Tuple]) -> List[List]:
+    """
+    Verify a chunk of image-label pairs, parsing all of their label files at once.
+
+    Label files that can not be read or parsed in bulk are verified individually, so that a single corrupt file only
+    marks its own image as corrupt.
+
+    Args:
+        args (List[Tuple]): verify_image_label() arguments for each image-label pair.
+
+    Returns:
+        (List[List]): verify_image_label() results in the same order as args.
+    """
+    texts = []
+    for a in args:
+        try:
+            with open(a[1], encoding="utf-8") as f:
+                texts.append(f.read())
+        except (OSError, UnicodeDecodeError):
+            texts.append(None)  # missing or unreadable, handled by verify_image_label()
+    try:
+        parsed = iter(parse_labels([t for t in texts if t is not None]))
+        labels = [None if t is None else next(parsed) for t in texts]
+    except ValueError:
+        labels = [None] * len(args)
+    return [verify_image_label(a, lb) for a, lb in zip(args, labels)]
+
+
 def visualize_image_annotations(image_path: str, txt_path: str, label_map: Dict[int, str]):
     """
     Visualize YOLO annotations (bounding boxes and class labels) on an image.
@@ -1,6 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import inspect
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
@@ -10,6 +11,7 @@ from PIL import Image
 
 from ultralytics.cfg import TASK2DATA, get_cfg, get_save_dir
 from ultralytics.engine.results import Results
+from ultralytics.nn.registry import MODEL_REGISTRY
 from ultralytics.nn.tasks import attempt_load_one_weight, guess_model_task, yaml_model_load
 from ultralytics.utils import (
     ARGV,
@@ -45,12 +47,14 @@ class Model(torch.nn.Module):
         session (HUBTrainingSession): The Ultralytics HUB session, if applicable.
         task (str): The type of task the model is intended for.
         model_name (str): The name of the model.
+        model_shared (bool): Whether `model` is a frozen checkpoint module shared through the model registry.
 
     Methods:
         __call__: Alias for the predict method, enabling the model instance to be callable.
         _new: Initialize a new model based on a configuration file.
         _load: Load a model from a checkpoint file.
         _check_is_pytorch_model: Ensure that the model is a PyTorch model.
+        _unshare_model: Replace a registry-shared checkpoint module with a private copy before mutating it.
         reset_weights: Reset the model's weights to their initial state.
         load: Load model weights from a specified file.
         save: Save the current state of the model to a file.
@@ -119,6 +123,7 @@ class Model(torch.nn.Module):
         self.ckpt = {}  # if loaded from *.pt
         self.cfg = None  # if loaded from *.yaml
         self.ckpt_path = None
+        self.model_shared = False  # model is a registry checkpoint shared with other Model instances
         self.overrides = {}  # overrides for trainer object
         self.metrics = None  # validation/training metrics
         self.session = None  # HUB session
@@ -292,9 +297,15 @@ class Model(torch.nn.Module):
         weights = checks.check_model_file_from_stem(weights)  # add suffix, i.e. yolo11n -> yolo11n.pt
 
         if str(weights).rpartition(".")[-1] == "pt":
-            self.model, self.ckpt = attempt_load_one_weight(weights)
+            self.model_shared = MODEL_REGISTRY.enabled  # shared frozen checkpoint, copied before any in-place change
+            if self.model_shared:
+                self.model, self.ckpt = MODEL_REGISTRY.load_checkpoint(weights)
+            else:
+                self.model, self.ckpt = attempt_load_one_weight(weights)
             self.task = self.model.task
             self.overrides = self.model.args = self._reset_ckpt_args(self.model.args)
+            if self.model_shared:
+                self.overrides = dict(self.overrides)  # per-instance overrides must not write into the shared module
             self.ckpt_path = self.model.pt_path
         else:
             weights = checks.check_file(weights)  # runs in all cases, not redundant with above call
@@ -333,6 +344,18 @@ class Model(torch.nn.Module):
                 f"argument directly in your inference command, i.e. 'model.predict(source=..., device=0)'"
             )
 
+    def _unshare_model(self, rekey: bool = False) -> None:
+        """
+        Replace a checkpoint module shared through the model registry with a private copy before changing it.
+
+        Args:
+            rekey (bool): Also copy a private module while the registry is enabled, so that backends cached for it by
+                identity are not reused after its classes change.
+        """
+        if self.model_shared or (rekey and MODEL_REGISTRY.enabled):
+            self.model = deepcopy(self.model)
+            self.model_shared = False
+
     def reset_weights(self) -> "Model":
         """
         Reset the model's weights to their initial state.
@@ -352,6 +375,7 @@ class Model(torch.nn.Module):
             >>> model.reset_weights()
         """
         self._check_is_pytorch_model()
+        self._unshare_model()
         for m in self.model.modules():
             if hasattr(m, "reset_parameters"):
                 m.reset_parameters()
@@ -384,6 +408,7 @@ class Model(torch.nn.Module):
         if isinstance(weights, (str, Path)):
             self.overrides["pretrained"] = weights  # remember the weights for DDP training
             weights, self.ckpt = attempt_load_one_weight(weights)
+        self._unshare_model()
         self.model.load(weights)
         return self
 
@@ -405,7 +430,6 @@ class Model(torch.nn.Module):
             >>> model.save("my_model.pt")
         """
         self._check_is_pytorch_model()
-        from copy import deepcopy
         from datetime import datetime
 
         from ultralytics import __version__
@@ -460,6 +484,7 @@ class Model(torch.nn.Module):
             >>> # Model is now fused and ready for optimized inference
         """
         self._check_is_pytorch_model()
+        self._unshare_model()
         self.model.fuse()
 
     def embed(
@@ -545,6 +570,8 @@ class Model(torch.nn.Module):
 
         if not self.predictor:
             self.predictor = (predictor or self._smart_load("predictor"))(overrides=args, _callbacks=self.callbacks)
+            if not MODEL_REGISTRY.enabled:  # an uncached backend moves and fuses the module it wraps
+                self._unshare_model()
             self.predictor.setup_model(model=self.model, verbose=is_cli)
         else:  # only update args if predictor is already setup
             self.predictor.args = get_cfg(self.predictor.args, args)
@@ -630,6 +657,7 @@ class Model(torch.nn.Module):
         args = {**self.overrides, **custom, **kwargs, "mode": "val"}  # highest priority args on the right
 
         validator = (validator or self._smart_load("validator"))(args=args, _callbacks=self.callbacks)
+        self._unshare_model()  # the validator backend moves and fuses the module in place
         validator(model=self.model)
         self.metrics = validator.metrics
         return validator.metrics
@@ -791,6 +819,7 @@ class Model(torch.nn.Module):
             args["resume"] = self.ckpt_path
 
         self.trainer = (trainer or self._smart_load("trainer"))(overrides=args, _callbacks=self.callbacks)
+        self._unshare_model()
         if not args.get("resume"):  # manually set model only if not resuming
             self.trainer.model = self.trainer.get_model(weights=self.model if self.ckpt else None, cfg=self.model.yaml)
             self.model = self.trainer.model
@@ -876,6 +905,7 @@ class Model(torch.nn.Module):
             >>> model = model._apply(lambda t: t.cuda())  # Move model to GPU
         """
         self._check_is_pytorch_model()
+        self._unshare_model()
         self = super()._apply(fn)  # noqa
         self.predictor = None  # reset predictor as device may have changed
         self.overrides["device"] = self.device  # was str(self.device) i.e. device(type='cuda', index=0) -> 'cuda:0'
@@ -45,7 +45,10 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox
+from ultralytics.data.split_dota import get_windows
+from ultralytics.engine.results import Results, RoiMasks
 from ultralytics.nn.autobackend import AutoBackend
+from ultralytics.nn.registry import MODEL_REGISTRY
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
@@ -63,6 +66,9 @@ Example:
         probs = r.probs  # Class probabilities for classification outputs
 """
 
+NORM_LUT = (np.arange(256, dtype=np.float32) / 255).reshape(1, 256)  # uint8 to float32 0.0 - 1.0 lookup table
+IM_BUFFERS = 2  # fused preprocessing buffer slots, i.e. number of preprocessed batches that stay valid at once
+
 
 class BasePredictor:
     """
@@ -87,14 +93,21 @@ class BasePredictor:
         batch (tuple): Current batch data.
         results (List[Any]): Current batch results.
         transforms (callable): Image transforms for classification.
+        im_buffers (List[list]): Ring of reusable [uint8 host, model input, CUDA copy event] fused preprocessing slots.
+        im_buffer_idx (int): Index of the `im_buffers` slot used by the next fused preprocessing call.
+        buckets (List[Tuple[int, int]]): Input (h, w) shapes that batches are snapped to, sorted by area.
         callbacks (Dict[str, List[callable]]): Callback functions for different events.
         txt_path (Path): Path to save text results.
         _lock (threading.Lock): Lock for thread-safe inference.
 
     Methods:
         preprocess: Prepare input image before inference.
+        fused_preprocess: Letterbox and normalize images straight into reusable batch buffers.
+        get_letterbox: Build the LetterBox transform for a batch.
         inference: Run inference on a given image.
         postprocess: Process raw predictions into structured results.
+        tile_inference: Run sliced inference on overlapping tiles of each image.
+        merge_tile_results: Map tile results to image coordinates and merge them across tile seams.
         predict_cli: Run prediction for command line interface.
         setup_source: Set up input source and inference mode.
         stream_inference: Stream inference on input source.
@@ -142,6 +155,9 @@ class BasePredictor:
         self.batch = None
         self.results = None
         self.transforms = None
+        self.im_buffers = [[None, None, None] for _ in range(IM_BUFFERS)]  # [uint8 host, input, copy event] slots
+        self.im_buffer_idx = 0
+        self.buckets = []  # input (h, w) shapes for dynamic-shape models, set up with the source
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
         self._lock = threading.Lock()  # for automatic thread-safe inference
@@ -159,6 +175,9 @@ class BasePredictor:
         """
         not_tensor = not isinstance(im, torch.Tensor)
         if not_tensor:
+            fused = self.fused_preprocess(im)
+            if fused is not None:
+                return fused
             im = np.stack(self.pre_transform(im))
             if im.shape[-1] == 3:
                 im = im[..., ::-1]  # BGR to RGB
@@ -172,6 +191,63 @@ class BasePredictor:
             im /= 255  # 0 - 255 to 0.0 - 1.0
         return im
 
+    def fused_preprocess(self, im: List[np.ndarray]) -> Optional[torch.Tensor]:
+        """
+        Letterbox, convert BGR to RGB, transpose and normalize images straight into reusable batch buffers.
+
+        This produces the same tensor as the generic `preprocess` path while skipping its intermediate full-frame copies.
+        Each resized image is split channel by channel in RGB order into a preallocated uint8 (N, 3, H, W) buffer, pinned
+        on CUDA, which is then converted and normalized in a single contiguous pass into a preallocated input tensor on
+        the inference device. Buffers come from a ring of `IM_BUFFERS` slots, so a returned tensor stays valid until
+        `IM_BUFFERS` further calls; clone it to keep it longer. On CUDA, a slot is only rewritten once the asynchronous
+        host-to-device copy of its previous batch has finished.
+
+        Args:
+            im (List[np.ndarray]): List of BGR images with shape [(H, W, 3) x N].
+
+        Returns:
+            (torch.Tensor | None): Preprocessed image tensor of shape (N, 3, H, W), or None if the fused path does not
+                apply, i.e. for predictors with a custom `pre_transform` or inputs that are not uint8 3-channel images.
+        """
+        if type(self).pre_transform is not BasePredictor.pre_transform or any(
+            x.dtype != np.uint8 or x.ndim != 3 or x.shape[2] != 3 for x in im
+        ):
+            return None
+        letterbox = self.get_letterbox(im)
+        params = [letterbox.get_params(x.shape[:2]) for x in im]
+        shapes = {(unpad[1] + pad[0] + pad[1], unpad[0] + pad[2] + pad[3]) for unpad, _, pad in params}
+        if len(shapes) != 1:
+            return None
+        h, w = shapes.pop()
+
+        shape = (len(im), 3, h, w)
+        dtype = torch.float16 if self.model.fp16 else torch.float32
+        slot = self.im_buffers[self.im_buffer_idx]
+        self.im_buffer_idx = (self.im_buffer_idx + 1) % len(self.im_buffers)
+        host, out, copied = slot
+        if copied is not None:
+            copied.synchronize()  # previous batch of this slot must be on the device before its host buffer is reused
+        if host is None or host.shape != shape:
+            host = torch.empty(shape, dtype=torch.uint8, pin_memory=self.device.type == "cuda")
+        if out is None or out.shape != shape or out.dtype != dtype or out.device != self.device:
+            out = torch.empty(shape, dtype=dtype, device=self.device)
+        slot[:] = host, out, None
+
+        for x, dst, (new_unpad, _, (top, bottom, left, right)) in zip(im, host.numpy(), params):
+            if x.shape[1::-1] != new_unpad:  # resize
+                x = cv2.resize(x, new_unpad, interpolation=cv2.INTER_LINEAR)
+            dst[:, :top], dst[:, h - bottom :], dst[..., :left], dst[..., w - right :] = 114, 114, 114, 114  # padding
+            for c in range(3):  # BGR to RGB and HWC to CHW
+                cv2.extractChannel(x, 2 - c, dst=dst[c, top : h - bottom, left : w - right])
+        if out.device.type == "cpu" and dtype == torch.float32:  # exact x / 255 lookup, faster than convert + divide
+            cv2.LUT(host.numpy().reshape(-1, w), NORM_LUT, dst=out.numpy().reshape(-1, w))
+            return out
+        out.copy_(host if self.device.type == "cpu" else host.to(self.device, non_blocking=True))  # uint8 to fp16/32
+        if self.device.type == "cuda":
+            slot[2] = torch.cuda.Event()
+            slot[2].record()
+        return out.div_(255)  # 0 - 255 to 0.0 - 1.0
+
     def inference(self, im: torch.Tensor, *args, **kwargs):
         """Run inference on a given image using the specified model and arguments."""
         visualize = (
@@ -191,20 +267,169 @@ class BasePredictor:
         Returns:
             (List[np.ndarray]): List of transformed images.
         """
+        letterbox = self.get_letterbox(im)
+        return [letterbox(image=x) for x in im]
+
+    def get_letterbox(self, im: List[np.ndarray]) -> LetterBox:
+        """
+        Build the LetterBox transform for a batch, using stride-aware minimum rectangles when shapes allow it.
+
+        When shape buckets are configured, the batch is instead padded to the smallest bucket that fits the minimum
+        rectangles of all its images, so dynamic-shape models only ever see a fixed set of warmed up input shapes.
+        Buckets never exceed `imgsz`, so images are resized with the same scale as without buckets.
+
+        Args:
+            im (List[np.ndarray]): List of images with shape [(H, W, 3) x N].
+
+        Returns:
+            (LetterBox): LetterBox transform to apply to every image in the batch.
+        """
+        if self.buckets:
+            rect = LetterBox(self.imgsz, auto=True, stride=self.model.stride)
+            params = [rect.get_params(x.shape[:2]) for x in im]
+            h = max(unpad[1] + top + bottom for unpad, _, (top, bottom, _, _) in params)
+            w = max(unpad[0] + left + right for unpad, _, (_, _, left, right) in params)
+            bucket = next(b for b in self.buckets if b[0] >= h and b[1] >= w)
+            return LetterBox(bucket, auto=False, stride=self.model.stride)
         same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(
+        return LetterBox(
             self.imgsz,
             auto=same_shapes
             and self.args.rect
             and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)),
             stride=self.model.stride,
         )
-        return [letterbox(image=x) for x in im]
 
     def postprocess(self, preds, img, orig_imgs):
         """Post-process predictions for an image and return them."""
         return preds
 
+    def tile_inference(self, im0s: List[np.ndarray], profilers: tuple, *args, **kwargs):
+        """
+        Run sliced inference on overlapping tiles of each image and merge the tile results into one result per image.
+
+        Each image is cut into square windows of `tile` pixels overlapping by a `tile_overlap` fraction, the same windows
+        as `split_dota.get_windows`. Tiles are views of the image, so nothing is copied or written to disk, and they go
+        through the usual preprocess, inference and postprocess steps `batch` tiles at a time. Small objects are thus
+        detected at full resolution instead of being letterboxed down with the whole image to `imgsz`.
+
+        Args:
+            im0s (List[np.ndarray]): Original images of the batch.
+            profilers (tuple): Preprocess, inference and postprocess profilers, their `dt` is set to the batch totals.
+            *args (Any): Additional arguments for the inference method.
+            **kwargs (Any): Additional keyword arguments for the inference method.
+
+        Returns:
+            im (torch.Tensor): The last preprocessed batch of tiles.
+            results (List[Results]): Merged Results objects, one per image, in image coordinates.
+        """
+        paths, _, s = self.batch
+        size = self.args.tile
+        t0 = [p.t for p in profilers]
+        results, im = [], None
+        for path, im0 in zip(paths, im0s):
+            windows = get_windows(im0.shape[:2], (size,), (int(size * self.args.tile_overlap),))
+            tiles = [im0[y0:y1, x0:x1] for x0, y0, x1, y1 in windows.tolist()]
+            tile_results = []
+            for i in range(0, len(tiles), self.args.batch):
+                batch = tiles[i : i + self.args.batch]
+                self.batch = ([path] * len(batch), batch, s)  # results are built from the paths of the current batch
+                with profilers[0]:
+                    im = self.preprocess(batch)
+                with profilers[1]:
+                    preds = self.inference(im, *args, **kwargs)
+                with profilers[2]:
+                    tile_results.extend(self.postprocess(preds, im, batch))
+            with profilers[2]:
+                results.append(self.merge_tile_results(tile_results, windows, im0, path))
+        self.batch = (paths, im0s, s)
+        for p, t in zip(profilers, t0):
+            p.dt = p.t - t
+        return im, results
+
+    def merge_tile_results(self, results: List[Results], windows: np.ndarray, orig_img: np.ndarray, path: str):
+        """
+        Map tile results to image coordinates and merge detections that are repeated across overlapping tiles.
+
+        Boxes, oriented boxes and keypoints are shifted by the tile offsets. Masks are resized to their tile and kept as
+        crops of their boxes in a `RoiMasks` object, so memory scales with object area rather than with the image area.
+        Detections of the same class are then merged with NMS at the `iou` threshold, or with weighted box fusion
+        (`tile_merge='wbf'`), which averages the coordinates of the merged boxes weighted by their confidence. Masks and
+        keypoints are those of the most confident detection of each group. Classification probabilities are averaged.
+
+        Args:
+            results (List[Results]): Results of each tile, in tile coordinates.
+            windows (np.ndarray): Tile windows in xyxy image coordinates with shape (N, 4).
+            orig_img (np.ndarray): The original image.
+            path (str): The path to the original image.
+
+        Returns:
+            (Results): The merged result in image coordinates.
+        """
+        shape = orig_img.shape[:2]
+        if results[0].probs is not None:
+            probs = torch.stack([r.probs.data for r in results]).mean(0)
+            return Results(orig_img, path=path, names=self.model.names, probs=probs)
+
+        dets, kpts, rois, offsets = [], [], [], []
+        for r, (x0, y0, x1, y1) in zip(results, windows.tolist()):
+            det = (r.obb if r.obb is not None else r.boxes).data.clone()
+            det[:, :2] += det.new_tensor([x0, y0])  # xywhr centers or xyxy top-left corners
+            if r.obb is None:
+                det[:, 2:4] += det.new_tensor([x0, y0])
+            dets.append(det)
+            if r.keypoints is not None:
+                k = r.keypoints.data.clone()
+                k[..., :2] += k.new_tensor([x0, y0])
+                kpts.append(k)
+            if r.masks is not None:
+                tile_rois, tile_offsets = self.tile_mask_rois(r, (min(y1, shape[0]) - y0, min(x1, shape[1]) - x0))
+                rois.extend(tile_rois)
+                offsets.append(tile_offsets + tile_offsets.new_tensor([x0, y0]))
+        det = torch.cat(dets)
+        rotated = results[0].obb is not None
+        keep, boxes = ops.merge_boxes(
+            det[:, :-2],
+            det[:, -2],
+            None if self.args.agnostic_nms else det[:, -1],
+            iou_thres=self.args.iou,
+            rotated=rotated,
+            weighted=self.args.tile_merge == "wbf",
+        )
+        det = torch.cat([boxes, det[keep, -2:]], dim=1)
+        masks = RoiMasks([rois[i] for i in keep.tolist()], torch.cat(offsets)[keep], shape, shape) if rois else None
+        keypoints = torch.cat(kpts)[keep] if kpts else None
+        if rotated:
+            return Results(orig_img, path=path, names=self.model.names, obb=det)
+        return Results(orig_img, path=path, names=self.model.names, boxes=det, masks=masks, keypoints=keypoints)
+
+    @staticmethod
+    def tile_mask_rois(result: Results, shape: tuple):
+        """
+        Return the masks of a tile result as binary crops of their boxes at the tile resolution.
+
+        Args:
+            result (Results): Result of a tile with masks at the model input or the tile resolution.
+            shape (tuple): Tile height and width as (height, width).
+
+        Returns:
+            rois (List[torch.Tensor]): Binary mask crops, one per detection.
+            offsets (torch.Tensor): Top-left (x, y) offsets of the crops in the tile with shape (N, 2).
+        """
+        masks = result.masks
+        if isinstance(masks, RoiMasks):
+            if masks.mask_shape == tuple(shape):
+                return masks.rois, masks.offsets
+            return ops.scale_masks_roi(masks.rois, masks.offsets, masks.mask_shape, shape)
+        data = masks.data
+        if tuple(data.shape[1:]) != tuple(shape):
+            data = ops.scale_masks(data[None].float(), shape)[0] > 0.5
+        xy = result.boxes.xyxy
+        offsets = xy[:, :2].floor().clamp(min=0).long()
+        ends = xy[:, 2:].ceil().long()
+        rois = [m[y0:y1, x0:x1] > 0 for m, (x0, y0), (x1, y1) in zip(data, offsets.tolist(), ends.tolist())]
+        return rois, offsets
+
     def __call__(self, source=None, model=None, stream: bool = False, *args, **kwargs):
         """
         Perform inference on an image or stream.
@@ -256,9 +481,18 @@ class BasePredictor:
                 Source for inference.
         """
         self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)  # check image size
+        if self.args.tile and self.args.tile_merge not in {"nms", "wbf"}:
+            raise ValueError(f"Invalid tile_merge='{self.args.tile_merge}', valid options are 'nms' and 'wbf'.")
+        self.buckets = []
+        if self.args.buckets and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)):
+            buckets = {tuple(check_imgsz(b, stride=self.model.stride, min_dim=2)) for b in self.args.buckets}
+            if any(h > self.imgsz[0] or w > self.imgsz[1] for h, w in buckets):
+                LOGGER.warning(f"Ignoring 'buckets' larger than imgsz={self.imgsz}.")
+            buckets = {(h, w) for h, w in buckets if h <= self.imgsz[0] and w <= self.imgsz[1]}
+            self.buckets = sorted(buckets | {tuple(self.imgsz)}, key=lambda b: (b[0] * b[1], b))  # imgsz fits all
         self.dataset = load_inference_source(
             source=source,
-            batch=self.args.batch,
+            batch=1 if self.args.tile else self.args.batch,  # with tiles, batch is the number of tiles per batch
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
             channels=getattr(self.model, "ch", 3),
@@ -305,9 +539,10 @@ class BasePredictor:
 
             # Warmup model
             if not self.done_warmup:
-                self.model.warmup(
-                    imgsz=(1 if self.model.pt or self.model.triton else self.dataset.bs, self.model.ch, *self.imgsz)
-                )
+                bs = 1 if self.model.pt or self.model.triton else self.args.batch if self.args.tile else self.dataset.bs
+                self.model.warmup(imgsz=(bs, self.model.ch, *self.imgsz))
+                for h, w in self.buckets:  # compile every bucket shape ahead of time, on any device
+                    self.model.warmup(imgsz=(bs, self.model.ch, h, w), force=True)
                 self.done_warmup = True
 
             self.seen, self.windows, self.batch = 0, [], None
@@ -321,20 +556,23 @@ class BasePredictor:
                 self.run_callbacks("on_predict_batch_start")
                 paths, im0s, s = self.batch
 
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
-
-                # Postprocess
-                with profilers[2]:
-                    self.results = self.postprocess(preds, im, im0s)
+                if self.args.tile:  # sliced inference, profiled per stage over all tiles of the batch
+                    im, self.results = self.tile_inference(im0s, profilers, *args, **kwargs)
+                else:
+                    # Preprocess
+                    with profilers[0]:
+                        im = self.preprocess(im0s)
+
+                    # Inference
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                        if self.args.embed:
+                            yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                            continue
+
+                    # Postprocess
+                    with profilers[2]:
+                        self.results = self.postprocess(preds, im, im0s)
                 self.run_callbacks("on_predict_postprocess_end")
 
                 # Visualize, save, write results
@@ -384,19 +622,29 @@ class BasePredictor:
         """
         Initialize YOLO model with given parameters and set it to evaluation mode.
 
+        When the process-wide `MODEL_REGISTRY` is enabled, a cached backend for the same weights and arguments is reused.
+
         Args:
             model (str | Path | torch.nn.Module, optional): Model to load or use.
             verbose (bool): Whether to print verbose output.
         """
-        self.model = AutoBackend(
-            weights=model or self.args.model,
-            device=select_device(self.args.device, verbose=verbose),
+        weights = model or self.args.model
+        device = select_device(self.args.device, verbose=verbose)
+        kwargs = dict(
             dnn=self.args.dnn,
             data=self.args.data,
             fp16=self.args.half,
             fuse=True,
             verbose=verbose,
+            threads=self.args.threads,
+            inter_threads=self.args.inter_threads,
+            streams=self.args.streams,
+            cpus=self.args.cpus,
         )
+        if MODEL_REGISTRY.enabled:  # reuse a loaded and warmed backend shared with other predictors
+            self.model = MODEL_REGISTRY.get(weights, device=device, **kwargs)
+        else:
+            self.model = AutoBackend(weights=weights, device=device, **kwargs)
 
         self.device = self.model.device  # update device
         self.args.half = self.model.fp16  # update half
@@ -440,7 +688,7 @@ class BasePredictor:
                 boxes=self.args.show_boxes,
                 conf=self.args.show_conf,
                 labels=self.args.show_labels,
-                im_gpu=None if self.args.retina_masks else im[i],
+                im_gpu=None if self.args.retina_masks or self.args.tile else im[i],
             )
 
         # Save results
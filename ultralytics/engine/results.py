@@ -6,7 +6,7 @@ Usage: See https://docs.ultralytics.com/modes/predict/
 """
 
 from copy import deepcopy
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -270,7 +270,13 @@ class Results(SimpleClass, DataExportMixin):
             >>> boxes = result.boxes  # Get the boxes for the first result
             >>> masks = result.masks  # Get the masks for the first result
 
+            Defer computing masks until they are first accessed
+            >>> result = Results(orig_img, path, names, boxes=boxes, masks=lambda: upsample(proto_masks))
+
         Notes:
+            `masks` and `keypoints` may be given as functions returning the tensor, which are called and memoized the
+            first time the attribute is accessed, so consumers that never read them do not pay for computing them.
+
             For the default pose model, keypoint indices for human body pose estimation are:
             0: Nose, 1: Left Eye, 2: Right Eye, 3: Left Ear, 4: Right Ear
             5: Left Shoulder, 6: Right Shoulder, 7: Left Elbow, 8: Right Elbow
@@ -279,10 +285,11 @@ class Results(SimpleClass, DataExportMixin):
         """
         self.orig_img = orig_img
         self.orig_shape = orig_img.shape[:2]
+        self._lazy = {}  # {attribute: function} of fields computed and memoized on first access, see __getattr__
         self.boxes = Boxes(boxes, self.orig_shape) if boxes is not None else None  # native size boxes
-        self.masks = Masks(masks, self.orig_shape) if masks is not None else None  # native size or imgsz masks
+        self._set_field("masks", masks, Masks)  # native size or imgsz masks
         self.probs = Probs(probs) if probs is not None else None
-        self.keypoints = Keypoints(keypoints, self.orig_shape) if keypoints is not None else None
+        self._set_field("keypoints", keypoints, Keypoints)
         self.obb = OBB(obb, self.orig_shape) if obb is not None else None
         self.speed = speed if speed is not None else {"preprocess": None, "inference": None, "postprocess": None}
         self.names = names
@@ -290,6 +297,36 @@ class Results(SimpleClass, DataExportMixin):
         self.save_dir = None
         self._keys = "boxes", "masks", "probs", "keypoints", "obb"
 
+    def _set_field(self, name: str, value: Any, cls: type) -> None:
+        """Set a field from a tensor or an instance of `cls`, or defer it if given a function returning one of them."""
+        if callable(value):
+
+            def compute():
+                data = value()
+                return cls(data, self.orig_shape) if isinstance(data, (torch.Tensor, np.ndarray)) else data
+
+            self._lazy[name] = compute
+        else:
+            setattr(self, name, cls(value, self.orig_shape) if isinstance(value, (torch.Tensor, np.ndarray)) else value)
+
+    def __getattr__(self, attr: str):
+        """Compute and memoize a deferred field on first access."""
+        lazy = self.__dict__.get("_lazy")
+        if lazy and attr in lazy:
+            value = lazy.pop(attr)()
+            setattr(self, attr, value)
+            return value
+        return super().__getattr__(attr)
+
+    def __dir__(self):
+        """Include deferred fields in the attribute list."""
+        return sorted({*super().__dir__(), *self.__dict__.get("_lazy", ())})
+
+    def _apply_deferred(self, key: str, fn: str, *args, **kwargs):
+        """Compute a deferred field and apply a function to it, used to keep fields deferred through `_apply`."""
+        v = getattr(self, key)
+        return getattr(v, fn)(*args, **kwargs) if v is not None else None
+
     def __getitem__(self, idx):
         """
         Return a Results object for a specific index of inference results.
@@ -355,13 +392,15 @@ class Results(SimpleClass, DataExportMixin):
         if boxes is not None:
             self.boxes = Boxes(ops.clip_boxes(boxes, self.orig_shape), self.orig_shape)
         if masks is not None:
-            self.masks = Masks(masks, self.orig_shape)
+            self._lazy.pop("masks", None)
+            self._set_field("masks", masks, Masks)
         if probs is not None:
             self.probs = probs
         if obb is not None:
             self.obb = OBB(obb, self.orig_shape)
         if keypoints is not None:
-            self.keypoints = Keypoints(keypoints, self.orig_shape)
+            self._lazy.pop("keypoints", None)
+            self._set_field("keypoints", keypoints, Keypoints)
 
     def _apply(self, fn: str, *args, **kwargs):
         """
@@ -385,6 +424,10 @@ class Results(SimpleClass, DataExportMixin):
         """
         r = self.new()
         for k in self._keys:
+            if k in self._lazy:  # keep deferred, computing the field of this object first when accessed
+                r._lazy[k] = partial(self._apply_deferred, k, fn, *args, **kwargs)
+                vars(r).pop(k, None)
+                continue
             v = getattr(self, k)
             if v is not None:
                 setattr(r, k, getattr(v, fn)(*args, **kwargs))
@@ -1170,6 +1213,172 @@ class Masks(BaseTensor):
         ]
 
 
+class RoiMasks(Masks):
+    """
+    A class for storing segmentation masks as binary crops of their regions of interest (ROIs).
+
+    Each mask is kept as a crop of its bounding box region and the offset of that crop in the mask image, so memory
+    scales with object area instead of the number of masks times the image area. Segments, areas and run-length
+    encodings are computed from the crops, and the dense (N, H, W) `data` tensor is only built when first accessed.
+
+    Attributes:
+        rois (List[torch.Tensor | np.ndarray]): Binary mask crops, each with shape (h, w).
+        offsets (torch.Tensor | np.ndarray): Top-left (x, y) offsets of the crops in the mask image with shape (N, 2).
+        mask_shape (Tuple[int, int]): Shape of the mask image as (height, width), the inference or original image size.
+        orig_shape (Tuple[int, int]): Original image shape in (height, width) format.
+        data (torch.Tensor | np.ndarray): Dense masks with shape (N, H, W), built on first access.
+        area (torch.Tensor | np.ndarray): Number of mask pixels of each mask.
+        xy (List[np.ndarray]): A list of segments in pixel coordinates.
+        xyn (List[np.ndarray]): A list of normalized segments.
+
+    Methods:
+        rle: Return uncompressed COCO run-length encodings of the masks.
+        cpu: Return a copy of the RoiMasks object with the crops on CPU memory.
+        numpy: Return a copy of the RoiMasks object with the crops as numpy arrays.
+        cuda: Return a copy of the RoiMasks object with the crops on GPU memory.
+        to: Return a copy of the RoiMasks object with the crops on the specified device and dtype.
+
+    Examples:
+        >>> crops, offsets = ops.process_mask_roi(protos, coeffs, boxes, (1080, 1920), native=True)
+        >>> masks = RoiMasks(crops, offsets, (1080, 1920), orig_shape=(1080, 1920))
+        >>> segments, rles = masks.xy, masks.rle()  # computed from the crops
+        >>> dense = masks.data  # (N, 1080, 1920) tensor
+    """
+
+    def __init__(
+        self,
+        rois: List[Union[torch.Tensor, np.ndarray]],
+        offsets: Union[torch.Tensor, np.ndarray],
+        mask_shape: Tuple[int, int],
+        orig_shape: Tuple[int, int],
+    ) -> None:
+        """
+        Initialize the RoiMasks class with mask crops, their offsets and the shape of the mask image.
+
+        Args:
+            rois (List[torch.Tensor | np.ndarray]): Binary mask crops, each with shape (h, w).
+            offsets (torch.Tensor | np.ndarray): Top-left (x, y) offsets of the crops with shape (N, 2).
+            mask_shape (Tuple[int, int]): Shape of the mask image as (height, width).
+            orig_shape (Tuple[int, int]): The original image shape as (height, width). Used for normalization.
+        """
+        self.rois = list(rois)
+        self.offsets = offsets
+        self.mask_shape = tuple(mask_shape)
+        self.orig_shape = orig_shape
+        self._data = None
+
+    @property
+    def data(self) -> Union[torch.Tensor, np.ndarray]:
+        """Return the dense masks with shape (N, H, W), building them from the crops on first access."""
+        if self._data is None:
+            if isinstance(self.offsets, np.ndarray):
+                data = np.zeros((len(self.rois), *self.mask_shape), dtype=np.float32)
+            else:
+                data = torch.zeros((len(self.rois), *self.mask_shape), device=self.offsets.device)
+            for d, roi, (x, y) in zip(data, self.rois, self.offsets.tolist()):
+                d[y : y + roi.shape[0], x : x + roi.shape[1]] = roi
+            self._data = data
+        return self._data
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Return the shape of the dense masks without building them."""
+        return (len(self.rois), *self.mask_shape)
+
+    @property
+    def area(self) -> Union[torch.Tensor, np.ndarray]:
+        """Return the number of mask pixels of each mask."""
+        if isinstance(self.offsets, np.ndarray):
+            return np.array([int(roi.sum()) for roi in self.rois], dtype=np.int64)
+        if not self.rois:
+            return torch.zeros(0, dtype=torch.int64, device=self.offsets.device)
+        return torch.stack([roi.sum() for roi in self.rois])
+
+    def rle(self) -> List[Dict[str, Any]]:
+        """
+        Return uncompressed COCO run-length encodings of the masks in the mask image, computed from the crops.
+
+        Returns:
+            (List[Dict[str, Any]]): One {'size': [h, w], 'counts': [...]} dictionary per mask, with counts of
+                alternating background and mask pixels in column-major order, starting with background.
+
+        Examples:
+            >>> from pycocotools import mask as mask_utils
+            >>> rles = results[0].masks.rle()
+            >>> binary = mask_utils.decode(mask_utils.frPyObjects(rles, *rles[0]["size"]))
+        """
+        h, w = self.mask_shape
+        rles = []
+        for roi, (x, y) in zip(self.rois, self.offsets.tolist()):
+            roi = roi.cpu().numpy() if isinstance(roi, torch.Tensor) else np.asarray(roi)
+            columns = np.zeros((roi.shape[1], h + 2), dtype=bool)  # crop columns padded to image height
+            columns[:, y + 1 : y + 1 + roi.shape[0]] = roi.T
+            flat = columns[:, 1:-1].ravel()
+            change = np.flatnonzero(np.diff(flat, prepend=False, append=False))  # run starts within the columns
+            bounds = np.concatenate([[0], change + x * h, [h * w]])
+            rles.append({"size": [h, w], "counts": np.diff(bounds).tolist()})
+        return rles
+
+    def _segments(self, normalize: bool) -> List[np.ndarray]:
+        """Return segments of each mask traced on its crop and scaled to the original image."""
+        segments = []
+        for roi, offset in zip(self.rois, self.offsets.tolist()):
+            s = ops.masks2segments(torch.as_tensor(roi)[None])[0] if min(roi.shape) else np.zeros((0, 2), np.float32)
+            segments.append(
+                ops.scale_coords(
+                    self.mask_shape, s + np.array(offset, dtype=np.float32), self.orig_shape, normalize=normalize
+                )
+            )
+        return segments
+
+    @property
+    @lru_cache(maxsize=1)
+    def xyn(self) -> List[np.ndarray]:
+        """Return normalized xy-coordinates of the segmentation masks, traced on their crops."""
+        return self._segments(normalize=True)
+
+    @property
+    @lru_cache(maxsize=1)
+    def xy(self) -> List[np.ndarray]:
+        """Return the [x, y] pixel coordinates of the segmentation masks, traced on their crops."""
+        return self._segments(normalize=False)
+
+    def _new(self, fn) -> "RoiMasks":
+        """Return a copy with a function applied to the crops and offsets."""
+        return self.__class__([fn(roi) for roi in self.rois], fn(self.offsets), self.mask_shape, self.orig_shape)
+
+    def cpu(self) -> "RoiMasks":
+        """Return a copy of the RoiMasks object with the crops on CPU memory."""
+        return self if isinstance(self.offsets, np.ndarray) else self._new(lambda x: x.cpu())
+
+    def numpy(self) -> "RoiMasks":
+        """Return a copy of the RoiMasks object with the crops as numpy arrays."""
+        return self if isinstance(self.offsets, np.ndarray) else self._new(lambda x: x.cpu().numpy())
+
+    def cuda(self) -> "RoiMasks":
+        """Return a copy of the RoiMasks object with the crops on GPU memory."""
+        return self._new(lambda x: torch.as_tensor(x).cuda())
+
+    def to(self, *args, **kwargs) -> "RoiMasks":
+        """Return a copy of the RoiMasks object with the crops on the specified device and dtype."""
+        rois = [torch.as_tensor(roi).to(*args, **kwargs) for roi in self.rois]
+        offsets = torch.as_tensor(self.offsets).to(device=rois[0].device if rois else None)
+        return self.__class__(rois, offsets, self.mask_shape, self.orig_shape)
+
+    def __len__(self) -> int:
+        """Return the number of masks."""
+        return len(self.rois)
+
+    def __getitem__(self, idx) -> "RoiMasks":
+        """Return a new RoiMasks object with the masks selected by an index, slice, list or boolean mask."""
+        idx = np.arange(len(self.rois))[idx.cpu().numpy() if isinstance(idx, torch.Tensor) else idx]
+        idx = np.atleast_1d(idx)
+        offsets = self.offsets[
+            torch.as_tensor(idx, device=self.offsets.device) if isinstance(self.offsets, torch.Tensor) else idx
+        ]
+        return self.__class__([self.rois[i] for i in idx], offsets, self.mask_shape, self.orig_shape)
+
+
 class Keypoints(BaseTensor):
     """
     A class for storing and manipulating detection keypoints.
@@ -1655,3 +1864,245 @@ class OBB(BaseTensor):
             if isinstance(x, torch.Tensor)
             else np.stack([x.min(1), y.min(1), x.max(1), y.max(1)], -1)
         )
+
+
+class ResultsWriter:
+    """
+    Stream detections of many Results objects to a columnar Parquet file or a numpy record array file.
+
+    Unlike `Results.summary` and the `DataExportMixin` methods, detections are never converted to per-detection
+    dictionaries. Each Results object contributes whole columns sliced from its tensors, which are buffered and written
+    as one Parquet row group, or appended to a `.npy` structured array, every `row_group_size` rows. Every detection is a
+    row with the image index, class, confidence, box coordinates and track ID, optionally followed by its keypoints and
+    its mask polygon. Classification results contribute one row with their top-1 class and NaN box coordinates.
+
+    Box columns are x1, y1, x2, y2 for detection, segmentation and pose results, and cx, cy, w, h, angle for OBB results.
+    Parquet files also hold a dictionary-encoded `path` column, while `.npy` files get a `.paths.txt` sidecar file with
+    one image path per line, in image index order.
+
+    Attributes:
+        file (Path): Output file, with a `.parquet` or `.npy` suffix.
+        row_group_size (int): Number of buffered rows that triggers a write.
+        segments (bool): Whether to write mask polygons, Parquet only.
+        keypoints (bool): Whether to write keypoints.
+        normalize (bool): Whether to normalize coordinates by the image size.
+        images (int): Number of images appended so far.
+        rows (int): Number of rows written so far.
+
+    Methods:
+        append: Buffer the detections of one or more Results objects, writing a row group when the buffer is full.
+        flush: Write all buffered rows.
+        close: Flush and finalize the output file.
+        on_predict_batch_end: Predictor callback appending the results of each batch.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> model = YOLO("yolo11n.pt")
+        >>> with ResultsWriter("detections.parquet") as writer:
+        ...     model.add_callback("on_predict_batch_end", writer.on_predict_batch_end)
+        ...     for _ in model.predict("path/to/images", stream=True):
+        ...         pass
+        >>> import pyarrow.parquet as pq
+        >>> table = pq.read_table("detections.parquet")
+    """
+
+    def __init__(
+        self,
+        file: Union[str, Path],
+        row_group_size: int = 1 << 20,
+        segments: bool = False,
+        keypoints: bool = True,
+        normalize: bool = False,
+    ) -> None:
+        """
+        Initialize the writer, the output file is created when the first rows are written.
+
+        Args:
+            file (str | Path): Output file, `.parquet` for Apache Parquet (requires `pyarrow`) or `.npy` for a numpy
+                structured array.
+            row_group_size (int): Number of buffered rows that triggers a write.
+            segments (bool): Whether to write mask polygons, Parquet only.
+            keypoints (bool): Whether to write keypoints.
+            normalize (bool): Whether to normalize coordinates by the image size.
+        """
+        self.file = Path(file)
+        if self.file.suffix not in {".parquet", ".npy"}:
+            raise ValueError(f"Unsupported ResultsWriter file '{file}', use a '.parquet' or '.npy' suffix.")
+        if segments and self.file.suffix == ".npy":
+            raise ValueError("Variable-length mask polygons are only supported for '.parquet' files.")
+        if self.file.suffix == ".parquet":
+            from ultralytics.utils.checks import check_requirements
+
+            check_requirements("pyarrow")
+        self.row_group_size = row_group_size
+        self.segments = segments
+        self.keypoints = keypoints
+        self.normalize = normalize
+        self.images = 0
+        self.rows = 0
+        self.buffer: Dict[str, List[Any]] = {}
+        self.buffered = 0
+        self.paths: List[str] = []  # paths of buffered images
+        self.kind = None  # 'boxes', 'obb' or 'probs', set by the first appended result
+        self.kpt_shape = None
+        self.writer = None  # open pyarrow.parquet.ParquetWriter or .npy file handle
+        self.paths_file = None
+        self.header_size = 0  # .npy header length in bytes, fixed on first write
+
+    def _columns(self, r: "Results") -> Dict[str, np.ndarray]:
+        """Slice the columns of all detections of a Results object from its tensors."""
+        if self.kind is None:
+            self.kind = "obb" if r.obb is not None else "probs" if r.probs is not None else "boxes"
+            if self.keypoints and r.keypoints is not None:
+                self.kpt_shape = tuple(r.keypoints.shape[1:])
+        h, w = r.orig_shape
+        if self.kind == "probs":
+            data = np.array([[np.nan] * 4 + [-1, float(r.probs.top1conf), r.probs.top1]], dtype=np.float32)
+        else:
+            b = r.obb if self.kind == "obb" else r.boxes
+            data = b.data.cpu().numpy().astype(np.float32) if b is not None else np.zeros((0, 7), dtype=np.float32)
+        n, nc = len(data), 5 if self.kind == "obb" else 4  # rows, coordinate columns
+        coords = data[:, :nc]
+        if self.normalize:
+            coords = coords / np.array([w, h, w, h, 1][:nc], dtype=np.float32)
+        names = ("cx", "cy", "w", "h", "angle") if self.kind == "obb" else ("x1", "y1", "x2", "y2")
+        columns = {
+            "image": np.full(n, self.images + len(self.paths), dtype=np.int64),
+            "class": data[:, -1].astype(np.int32),
+            "conf": data[:, -2],
+            **{name: coords[:, i] for i, name in enumerate(names)},
+            "track_id": data[:, -3].astype(np.int64) if data.shape[1] == nc + 3 else np.full(n, -1, dtype=np.int64),
+        }
+        if self.kpt_shape:
+            kpts = r.keypoints.data.cpu().numpy().astype(np.float32) if r.keypoints is not None else None
+            if kpts is None or len(kpts) != n:
+                kpts = np.full((n, *self.kpt_shape), np.nan, dtype=np.float32)
+            elif self.normalize:
+                kpts[..., :2] /= np.array([w, h], dtype=np.float32)
+            columns["keypoints"] = kpts  # x, y and visibility, if predicted
+        if self.segments:
+            polygons = (r.masks.xyn if self.normalize else r.masks.xy) if r.masks is not None else [None] * n
+            columns["polygon"] = polygons
+        return columns
+
+    def append(self, results: Union["Results", List["Results"]]) -> None:
+        """
+        Buffer the detections of one or more Results objects, writing them once `row_group_size` rows are buffered.
+
+        Args:
+            results (Results | List[Results]): Results to append, each assigned the next image index.
+        """
+        for r in [results] if isinstance(results, Results) else results:
+            columns = self._columns(r)
+            for k, v in columns.items():
+                self.buffer.setdefault(k, []).append(v)
+            self.buffered += len(columns["image"])
+            self.paths.append(str(r.path))
+            if self.buffered >= self.row_group_size:
+                self.flush()
+
+    def on_predict_batch_end(self, predictor) -> None:
+        """Append the results of the current predictor batch, for use with `model.add_callback`."""
+        self.append(predictor.results)
+
+    def flush(self) -> None:
+        """Write all buffered rows as one Parquet row group or one `.npy` chunk."""
+        if not self.paths:
+            return
+        columns = {k: v for k, v in self.buffer.items() if k != "polygon"}
+        columns = {k: np.concatenate(v) for k, v in columns.items()}
+        if self.file.suffix == ".parquet":
+            self._write_parquet(columns, [p for chunk in self.buffer.get("polygon", []) for p in chunk])
+        else:
+            self._write_npy(columns)
+        self.images += len(self.paths)
+        self.rows += self.buffered
+        self.buffer, self.buffered, self.paths = {}, 0, []
+
+    def _write_parquet(self, columns: Dict[str, np.ndarray], polygons: List[Optional[np.ndarray]]) -> None:
+        """Write buffered columns as one Parquet row group."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = {
+            "image": pa.array(columns["image"]),
+            "path": pa.DictionaryArray.from_arrays(
+                pa.array(columns["image"] - self.images, type=pa.int32()), pa.array(self.paths, type=pa.string())
+            ),
+            **{k: pa.array(v) for k, v in columns.items() if k not in {"image", "keypoints"}},
+        }
+        if "keypoints" in columns:
+            kpts = columns["keypoints"]
+            values = pa.FixedSizeListArray.from_arrays(pa.array(kpts.reshape(-1)), kpts.shape[2])
+            arrays["keypoints"] = pa.FixedSizeListArray.from_arrays(values, kpts.shape[1])
+        if self.segments:
+            lengths = np.array([0 if p is None else p.size for p in polygons], dtype=np.int32)
+            offsets = pa.array(np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32))
+            values = [p.reshape(-1).astype(np.float32) for p in polygons if p is not None]
+            values = pa.array(np.concatenate(values) if values else np.zeros(0, dtype=np.float32))
+            mask = pa.array([p is None for p in polygons])
+            arrays["polygon"] = pa.ListArray.from_arrays(offsets, values, mask=mask)  # flattened x, y pairs
+        table = pa.table(arrays)
+        if self.writer is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(self.file, table.schema)
+        self.writer.write_table(table, row_group_size=len(table))
+
+    def _write_npy(self, columns: Dict[str, np.ndarray]) -> None:
+        """Append buffered columns to the `.npy` structured array, reserving space for its header on first write."""
+        dtype = np.dtype([(k, v.dtype, v.shape[1:]) for k, v in columns.items()])
+        if self.writer is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = open(self.file, "wb")
+            header = self._npy_header(dtype, 0)
+            self.header_size = len(header)
+            self.writer.write(header)
+            self.paths_file = open(self.file.with_suffix(".paths.txt"), "w", encoding="utf-8")
+        records = np.empty(len(columns["image"]), dtype=dtype)
+        for k, v in columns.items():
+            records[k] = v
+        self.writer.write(records.tobytes())
+        self.paths_file.write("".join(f"{p}\n" for p in self.paths))
+        self.dtype = dtype
+
+    @staticmethod
+    def _npy_header(dtype: np.dtype, rows: int, size: Optional[int] = None) -> bytes:
+        """
+        Return a `.npy` version 1.0 header padded to `size` bytes, so it can be rewritten with the final row count.
+
+        Args:
+            dtype (np.dtype): Structured dtype of the records.
+            rows (int): Number of records.
+            size (int, optional): Header length in bytes, by default the aligned length that fits any int64 row count.
+
+        Returns:
+            (bytes): Magic string, version, header length and the padded header dictionary.
+        """
+        descr = np.lib.format.dtype_to_descr(dtype)
+        if size is None:  # size for the widest row count, the shape string grows with the number of digits
+            widest = repr({"descr": descr, "fortran_order": False, "shape": (2**63 - 1,)})
+            size = -(-(len(widest) + 11) // 64) * 64  # magic, version, length and newline, aligned to 64 bytes
+        header = repr({"descr": descr, "fortran_order": False, "shape": (rows,)}).ljust(size - 11)
+        return b"\x93NUMPY\x01\x00" + (size - 10).to_bytes(2, "little") + header.encode("latin1") + b"\n"
+
+    def close(self) -> None:
+        """Flush buffered rows and finalize the output file."""
+        self.flush()
+        if self.writer is None:
+            return
+        if self.file.suffix == ".parquet":
+            self.writer.close()
+        else:
+            self.writer.seek(0)
+            self.writer.write(self._npy_header(self.dtype, self.rows, self.header_size))  # final row count
+            self.writer.close()
+            self.paths_file.close()
+        self.writer = None
+
+    def __enter__(self) -> "ResultsWriter":
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the writer when leaving the context."""
+        self.close()
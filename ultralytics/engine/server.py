@@ -0,0 +1,330 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+"""
+Serve a YOLO model over HTTP with dynamic request batching.
+
+Usage - CLI:
+    $ yolo serve model=yolo11n.pt port=8000 workers=2 max_batch=8 max_delay=5
+    $ yolo serve model=yolo11n.onnx unix=/tmp/yolo.sock conf=0.5
+
+Usage - Python:
+    >>> from ultralytics.engine.server import InferenceServer
+    >>> InferenceServer("yolo11n.pt", workers=2, max_batch=8, conf=0.5).run(port=8000)
+
+Usage - requests:
+    $ curl --data-binary @bus.jpg http://127.0.0.1:8000/predict
+    $ curl --unix-socket /tmp/yolo.sock --data-binary @bus.jpg http://localhost/predict
+    $ curl http://127.0.0.1:8000/health
+"""
+
+import asyncio
+import json
+import multiprocessing as mp
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from ultralytics.utils import LOGGER
+
+HTTP_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+_MODEL = None  # model loaded by each inference worker
+_ARGS: Dict[str, Any] = {}  # predict arguments of each inference worker
+
+
+def _init_worker(model: Any, args: Dict[str, Any]) -> None:
+    """Load and warm up the model of an inference worker."""
+    global _MODEL, _ARGS
+    from ultralytics import YOLO
+
+    _MODEL, _ARGS = YOLO(model) if isinstance(model, (str, Path)) else model, args
+    imgsz = args.get("imgsz", 640)
+    h, w = (imgsz, imgsz) if isinstance(imgsz, int) else imgsz
+    _MODEL.predict(np.zeros((h, w, 3), dtype=np.uint8), verbose=False, **args)  # sets up and warms up the predictor
+
+
+def _predict(images: List[bytes]) -> List[Dict[str, Any]]:
+    """
+    Decode a batch of encoded images and run them through the worker's predictor as a single batch.
+
+    Args:
+        images (List[bytes]): Encoded images, i.e. JPEG or PNG file contents.
+
+    Returns:
+        (List[Dict[str, Any]]): One response per image, with its `Results.summary` or an error message.
+    """
+    import cv2
+
+    ims = [cv2.imdecode(np.frombuffer(b, dtype=np.uint8), cv2.IMREAD_COLOR) for b in images]
+    valid = [im for im in ims if im is not None]
+    results = iter(_MODEL.predict(valid, verbose=False, **_ARGS) if valid else [])
+    responses = []
+    for im in ims:
+        if im is None:
+            responses.append({"error": "Unable to decode image, expected an encoded image such as a JPEG or PNG."})
+        else:
+            r = next(results)
+            responses.append({"results": r.summary(), "shape": list(r.orig_shape), "speed": r.speed})
+    return responses
+
+
+class InferenceServer:
+    """
+    HTTP inference server that batches concurrent requests dynamically across a pool of predictor workers.
+
+    An asyncio front end accepts HTTP/1.1 requests over TCP or a Unix socket and queues them. A batcher collects queued
+    requests into batches of up to `max_batch` images, waiting at most `max_delay` milliseconds after the first one, and
+    dispatches each batch to a free worker as a single `Model.predict` call. Workers are separate processes, each with
+    its own model and `BasePredictor`, or a thread of the server process when `workers=0`. New batches are only formed
+    when a worker is free, so requests keep accumulating into larger batches under load. When `max_queue` requests are
+    already waiting, new requests are rejected with HTTP 503 instead of growing latency without bound, and bodies larger
+    than `max_body` bytes are rejected with HTTP 413 before they are read. Worker processes are spawned, so scripts
+    that serve with `workers > 0` must guard their entry point with `if __name__ == "__main__":`.
+
+    Endpoints:
+        POST /predict: Encoded image in the request body, returns its `Results.summary`, shape and speed as JSON.
+        GET /health: Returns the server status, queue depth and request counters as JSON.
+
+    Attributes:
+        model (str | Path | Model): Model to serve, loaded by every worker.
+        workers (int): Number of worker processes, 0 to run inference in a thread of the server process.
+        max_batch (int): Maximum number of images per batch.
+        max_delay (float): Maximum time to wait for a batch to fill up after its first request, in milliseconds.
+        max_queue (int): Maximum number of queued requests before new requests are rejected.
+        max_body (int): Maximum request body size in bytes.
+        args (Dict[str, Any]): Predict arguments used by every worker, i.e. conf or imgsz.
+        stats (Dict[str, int]): Counters of served requests, rejected requests and dispatched batches.
+        server (asyncio.AbstractServer | None): The listening server while serving.
+
+    Methods:
+        predict: Queue an encoded image for batched inference and await its response.
+        serve: Start the workers and serve requests until cancelled.
+        run: Blocking entry point that serves requests until interrupted.
+
+    Examples:
+        >>> server = InferenceServer("yolo11n.pt", workers=2, max_batch=8, max_delay=5, conf=0.5)
+        >>> server.run(host="0.0.0.0", port=8000)
+    """
+
+    def __init__(
+        self,
+        model: Union[str, Path, Any] = "yolo11n.pt",
+        workers: int = 1,
+        max_batch: int = 8,
+        max_delay: float = 5.0,
+        max_queue: int = 256,
+        max_body: int = 32 << 20,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the server configuration.
+
+        Args:
+            model (str | Path | Model): Model weights to serve, or a loaded Model. Worker processes load a Model from
+                its checkpoint path, so a Model built from a YAML file can only be served with `workers=0`.
+            workers (int): Number of worker processes, 0 to run inference in a thread of the server process.
+            max_batch (int): Maximum number of images per batch.
+            max_delay (float): Maximum time to wait for a batch to fill up after its first request, in milliseconds.
+            max_queue (int): Maximum number of queued requests before new requests are rejected.
+            max_body (int): Maximum request body size in bytes, larger requests are rejected with HTTP 413.
+            **kwargs (Any): Predict arguments used by every worker, i.e. conf=0.5 or imgsz=640.
+        """
+        from ultralytics.utils.cpu import cpu_count
+
+        if workers > 0 and not isinstance(model, (str, Path)):
+            if not getattr(model, "ckpt_path", None):
+                raise ValueError(
+                    f"Serving a {type(model).__name__} without a checkpoint path requires workers=0, as worker "
+                    "processes load the model from its weights file."
+                )
+            model = model.ckpt_path  # loaded by each worker process
+        if workers > 1:
+            kwargs.setdefault("threads", max(cpu_count() // workers, 1))  # split CPU cores between worker processes
+        self.model = model
+        self.workers = workers
+        self.max_batch = max(max_batch, 1)
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.max_body = max_body
+        self.args = kwargs
+        self.stats = {"requests": 0, "rejected": 0, "batches": 0}
+        self.server = None
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor: Optional[Executor] = None
+
+    async def predict(self, image: bytes) -> Dict[str, Any]:
+        """
+        Queue an encoded image for batched inference and await its response.
+
+        Args:
+            image (bytes): Encoded image, i.e. JPEG or PNG file contents.
+
+        Returns:
+            (Dict[str, Any]): Response with the `Results.summary`, shape and speed of the image, or an error message.
+
+        Raises:
+            asyncio.QueueFull: If `max_queue` requests are already waiting.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((image, future))
+        return await future
+
+    async def _batcher(self) -> None:
+        """Collect queued requests into batches and dispatch each batch to a free worker."""
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max(self.workers, 1))
+        while True:
+            await slots.acquire()  # wait for a free worker, requests keep queueing meanwhile
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay / 1000
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), max(deadline - loop.time(), 0)))
+                except asyncio.TimeoutError:
+                    break
+            task = loop.create_task(self._dispatch(batch))
+            task.add_done_callback(lambda _: slots.release())
+
+    async def _dispatch(self, batch: List[Tuple[bytes, asyncio.Future]]) -> None:
+        """Run a batch on a worker and resolve the futures of its requests."""
+        images, futures = zip(*batch)
+        self.stats["batches"] += 1
+        try:
+            responses = await asyncio.get_running_loop().run_in_executor(self.executor, _predict, list(images))
+        except Exception as e:
+            LOGGER.warning(f"Inference failed for a batch of {len(batch)} images: {e}")
+            responses = [e] * len(batch)
+        for future, response in zip(futures, responses):
+            if future.done():  # client disconnected
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Handle a request and return its HTTP status code and JSON payload."""
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok", "queue": self.queue.qsize(), "workers": self.workers, **self.stats}
+        if method != "POST" or path != "/predict":
+            return 404, {"error": f"Unknown endpoint '{method} {path}', use 'POST /predict' or 'GET /health'."}
+        if not body:
+            return 400, {"error": "Empty request body, expected an encoded image such as a JPEG or PNG."}
+        try:
+            response = await self.predict(body)
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            return 503, {"error": f"Server busy, {self.max_queue} requests already queued."}
+        except Exception as e:
+            return 500, {"error": str(e)}
+        self.stats["requests"] += 1
+        return (400 if "error" in response else 200), response
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the HTTP/1.1 requests of a client connection, keeping it alive unless asked to close."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in {b"\r\n", b"\n", b""}:
+                        break
+                    key, _, value = header.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                close = headers.get("connection", "").lower() == "close"
+                length = headers.get("content-length", "0")
+                if not length.isdigit():
+                    close, status, payload = True, 400, {"error": f"Invalid Content-Length '{length}'."}
+                elif int(length) > self.max_body:  # reject before reading, the unread body ends the connection
+                    close, status = True, 413
+                    payload = {"error": f"Request body of {length} bytes exceeds the {self.max_body} bytes limit."}
+                else:
+                    body = await reader.readexactly(int(length))
+                    status, payload = await self._route(method.upper(), urlsplit(target).path, body)
+
+                data = json.dumps(payload).encode()
+                head = [f"HTTP/1.1 {status} {HTTP_STATUS[status]}", "Content-Type: application/json"]
+                head += [f"Content-Length: {len(data)}"] + (["Connection: close"] if close else [])
+                if status == 503:
+                    head.append("Retry-After: 1")
+                writer.write("\r\n".join(head).encode() + b"\r\n\r\n" + data)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # malformed request or client disconnected
+        finally:
+            writer.close()
+
+    def _start_workers(self) -> Executor:
+        """Start the inference workers, loading and warming up the model in each of them."""
+        if self.workers == 0:
+            executor = ThreadPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(self.model, self.args))
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=mp.get_context("spawn"),  # safe with CUDA and threaded runtimes
+                initializer=_init_worker,
+                initargs=(str(self.model), self.args),  # a path, loaded Models are replaced by their ckpt_path
+            )
+        for f in [executor.submit(int) for _ in range(max(self.workers, 1))]:  # wait until workers are ready
+            f.result()
+        return executor
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000, unix: Optional[str] = None) -> None:
+        """
+        Start the workers and serve requests until cancelled.
+
+        Args:
+            host (str): Host address to listen on.
+            port (int): Port to listen on, 0 to pick a free port.
+            unix (str, optional): Unix socket path to listen on instead of a TCP host and port.
+        """
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(self.max_queue)
+        self.executor = await loop.run_in_executor(None, self._start_workers)
+        batcher = loop.create_task(self._batcher())
+        if unix:
+            self.server = await asyncio.start_unix_server(self._handle, path=unix)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+            host, port = self.server.sockets[0].getsockname()[:2]
+        name = self.model if isinstance(self.model, (str, Path)) else type(self.model).__name__
+        LOGGER.info(
+            f"Serving {name} at {unix or f'http://{host}:{port}'} with {self.workers} workers, "
+            f"max_batch={self.max_batch}, max_delay={self.max_delay}ms, max_queue={self.max_queue}"
+        )
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            batcher.cancel()
+            self.executor.shutdown(wait=False)
+            self.server = None
+
+    def run(self, host: str = "127.0.0.1", port: int = 8000, unix: Optional[str] = None) -> None:
+        """
+        Serve requests until interrupted, i.e. with Ctrl+C.
+
+        Args:
+            host (str): Host address to listen on.
+            port (int): Port to listen on.
+            unix (str, optional): Unix socket path to listen on instead of a TCP host and port.
+        """
+        try:
+            asyncio.run(self.serve(host=host, port=port, unix=unix))
+        except KeyboardInterrupt:
+            LOGGER.info("Server stopped.")
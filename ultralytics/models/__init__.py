@@ -1,9 +1,37 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from .fastsam import FastSAM
-from .nas import NAS
-from .rtdetr import RTDETR
-from .sam import SAM
-from .yolo import YOLO, YOLOE, YOLOWorld
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .fastsam import FastSAM
+    from .nas import NAS
+    from .rtdetr import RTDETR
+    from .sam import SAM
+    from .yolo import YOLO, YOLOE, YOLOWorld
+
+MODEL_FAMILIES = {  # model class: subpackage, imported on first access so each family only loads its own modules
+    "YOLO": "yolo",
+    "YOLOE": "yolo",
+    "YOLOWorld": "yolo",
+    "RTDETR": "rtdetr",
+    "SAM": "sam",
+    "FastSAM": "fastsam",
+    "NAS": "nas",
+}
 
 __all__ = "YOLO", "RTDETR", "SAM", "FastSAM", "NAS", "YOLOWorld", "YOLOE"  # allow simpler import
+
+
+def __getattr__(name: str):
+    """Import a model class from its subpackage on first access."""
+    if name in MODEL_FAMILIES:
+        value = getattr(importlib.import_module(f".{MODEL_FAMILIES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily imported model classes in the attribute list."""
+    return sorted({*globals(), *__all__})
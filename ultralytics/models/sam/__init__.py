@@ -1,6 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from .cache import FeatureCache
 from .model import SAM
 from .predict import Predictor, SAM2Predictor, SAM2VideoPredictor
 
-__all__ = "SAM", "Predictor", "SAM2Predictor", "SAM2VideoPredictor"  # tuple or list of exportable items
+__all__ = "SAM", "FeatureCache", "Predictor", "SAM2Predictor", "SAM2VideoPredictor"  # tuple or list of exportable items
@@ -0,0 +1,201 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+from ultralytics.utils import LOGGER
+
+
+def _flatten(features: Any, tensors: List[torch.Tensor]) -> Any:
+    """Append the tensors of a nested features structure to a list and return a spec to rebuild the structure."""
+    if isinstance(features, torch.Tensor):
+        tensors.append(features)
+        return tuple(features.shape), features.dtype
+    if isinstance(features, dict):
+        return {k: _flatten(v, tensors) for k, v in features.items()}
+    return [_flatten(v, tensors) for v in features]
+
+
+def _unflatten(spec: Any, tensors: Iterator[torch.Tensor]) -> Any:
+    """Rebuild a nested features structure from its spec and an iterator over its tensors."""
+    if isinstance(spec, tuple):
+        return next(tensors)
+    if isinstance(spec, dict):
+        return {k: _unflatten(v, tensors) for k, v in spec.items()}
+    return [_unflatten(v, tensors) for v in spec]
+
+
+def _nbytes(features: Any) -> int:
+    """Return the memory held by the tensors of a nested features structure, in bytes."""
+    tensors = []
+    _flatten(features, tensors)
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class FeatureCache:
+    """
+    LRU cache of SAM and SAM 2 image encoder features, keyed by image content.
+
+    Interactive annotation prompts the same images many times while moving between them. Caching the encoder output of
+    every image seen in a session lets prompts on any of them run the prompt encoder and mask decoder only. Features are
+    kept on their device up to a byte budget, then least recently used entries are dropped, or spilled as float16
+    memory-mapped files to a disk directory when one is given and loaded back on their next use.
+
+    Attributes:
+        max_bytes (int): Maximum memory of features kept on device, in bytes.
+        disk (Path | None): Directory for spilled features, None to drop evicted features.
+        disk_bytes (int | None): Maximum size of spilled features, in bytes, None for no limit.
+        memory (OrderedDict): Features kept on device as {key: (features, nbytes)}, least recently used first.
+        spilled (OrderedDict): Features spilled to disk as {key: (file, spec, nbytes)}, least recently used first.
+        hits (int): Number of lookups answered from memory or disk.
+        misses (int): Number of lookups that required running the image encoder.
+
+    Methods:
+        key: Return the cache key of an image at an inference size.
+        get: Return cached features, loading them back from disk if spilled.
+        put: Cache the features of an image, evicting entries beyond the budgets.
+        clear: Remove all cached features, deleting spilled files.
+
+    Examples:
+        >>> from ultralytics.models.sam import FeatureCache, SAM2Predictor
+        >>> predictor = SAM2Predictor(overrides=dict(model="sam2.1_b.pt"))
+        >>> predictor.feature_cache = FeatureCache(max_bytes=2 << 30, disk="sam_features")
+        >>> for image in ["a.jpg", "b.jpg", "a.jpg"]:  # the second "a.jpg" skips the image encoder
+        ...     predictor.set_image(image)
+        ...     results = predictor(points=[[500, 375]])
+    """
+
+    def __init__(
+        self, max_bytes: int = 1 << 30, disk: Optional[Union[str, Path]] = None, disk_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the cache with its memory budget and optional disk spill directory.
+
+        Args:
+            max_bytes (int): Maximum memory of features kept on device, in bytes.
+            disk (str | Path, optional): Directory to spill evicted features to as float16 memory-mapped files.
+            disk_bytes (int, optional): Maximum size of spilled features, in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.disk = Path(disk) if disk is not None else None
+        self.disk_bytes = disk_bytes
+        self.memory: OrderedDict = OrderedDict()
+        self.spilled: OrderedDict = OrderedDict()
+        self.hits = self.misses = 0
+        if self.disk is not None:
+            self.disk.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(image: np.ndarray, imgsz: Sequence[int]) -> str:
+        """
+        Return the cache key of an image at an inference size, a hash of its pixels, shape and dtype.
+
+        Args:
+            image (np.ndarray): Original image as loaded by the predictor.
+            imgsz (Sequence[int]): Inference image size, since features depend on it.
+
+        Returns:
+            (str): Hexadecimal key.
+        """
+        h = hashlib.blake2b(np.ascontiguousarray(image).data, digest_size=16)
+        h.update(repr((image.shape, image.dtype.str, tuple(imgsz))).encode())
+        return h.hexdigest()
+
+    def get(self, key: str, device: Optional[torch.device] = None) -> Any:
+        """
+        Return cached features, loading them back to `device` if they were spilled to disk.
+
+        Args:
+            key (str): Cache key from `FeatureCache.key`.
+            device (torch.device, optional): Device to load spilled features to.
+
+        Returns:
+            (Any): Cached features with the structure passed to `put`, or None on a miss.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key][0]
+        if key in self.spilled:
+            file, spec, _ = self.spilled.pop(key)
+            data = np.load(file, mmap_mode="r")
+            tensors, offset = [], 0
+            for shape, dtype in self._specs(spec):
+                n = int(np.prod(shape))
+                tensors.append(torch.from_numpy(np.array(data[offset : offset + n])).view(shape).to(device, dtype))
+                offset += n
+            del data
+            file.unlink(missing_ok=True)
+            features = _unflatten(spec, iter(tensors))
+            self.hits += 1
+            self.put(key, features)
+            return features
+        self.misses += 1
+        return None
+
+    def put(self, key: str, features: Any) -> None:
+        """
+        Cache the features of an image, evicting least recently used entries beyond the memory budget.
+
+        Args:
+            key (str): Cache key from `FeatureCache.key`.
+            features (Any): Image encoder output, a tensor or a dict or list of tensors.
+        """
+        self.memory[key] = (features, _nbytes(features))
+        self.memory.move_to_end(key)
+        while len(self.memory) > 1 and sum(n for _, n in self.memory.values()) > self.max_bytes:
+            evicted, (f, _) = self.memory.popitem(last=False)
+            if self.disk is not None:
+                self._spill(evicted, f)
+        while self.disk_bytes is not None and self.spilled:
+            if sum(n for _, _, n in self.spilled.values()) <= self.disk_bytes:
+                break
+            _, (file, _, _) = self.spilled.popitem(last=False)
+            file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _specs(spec: Any) -> List[Tuple[Tuple[int, ...], torch.dtype]]:
+        """Return the (shape, dtype) of each tensor of a features spec, in flattening order."""
+        if isinstance(spec, tuple):
+            return [spec]
+        return [s for v in (spec.values() if isinstance(spec, dict) else spec) for s in FeatureCache._specs(v)]
+
+    def _spill(self, key: str, features: Any) -> None:
+        """Write features to a float16 memory-mapped file in the disk directory."""
+        tensors = []
+        spec = _flatten(features, tensors)
+        file = self.disk / f"{key}.npy"
+        try:
+            data = np.lib.format.open_memmap(
+                file, mode="w+", dtype=np.float16, shape=(sum(t.numel() for t in tensors),)
+            )
+            offset = 0
+            for t in tensors:
+                data[offset : offset + t.numel()] = t.detach().flatten().float().cpu().numpy()
+                offset += t.numel()
+            data.flush()
+            del data
+        except OSError as e:
+            LOGGER.warning(f"Failed to spill SAM features to {file}: {e}")
+            return
+        self.spilled[key] = (file, spec, file.stat().st_size)
+
+    def clear(self) -> None:
+        """Remove all cached features, deleting spilled files."""
+        self.memory.clear()
+        for file, _, _ in self.spilled.values():
+            file.unlink(missing_ok=True)
+        self.spilled.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached images, in memory or on disk."""
+        return len(self.memory) + len(self.spilled)
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether features of a key are cached, in memory or on disk."""
+        return key in self.memory or key in self.spilled
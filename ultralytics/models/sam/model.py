@@ -17,6 +17,7 @@ Key Features:
 from pathlib import Path
 from typing import Dict, Type
 
+from ultralytics.cfg import get_cfg
 from ultralytics.engine.model import Model
 from ultralytics.utils.torch_utils import model_info
 
@@ -135,6 +136,36 @@ class SAM(Model):
         """
         return self.predict(source, stream, bboxes, points, labels, **kwargs)
 
+    def predict_batch(self, images, bboxes=None, points=None, labels=None, batch=8, prompt_batch=64, **kwargs):
+        """
+        Segment a list of images, each with its own prompts, batching the image encoder and mask decoder calls.
+
+        Args:
+            images (List[str | np.ndarray]): Image paths or BGR images as read by cv2.
+            bboxes (List | None): Boxes of each image, in XYXY pixels, None for images without boxes.
+            points (List | None): Points of each image, in pixels, None for images without points.
+            labels (List | None): Point labels of each image.
+            batch (int): Number of images encoded per image encoder call.
+            prompt_batch (int): Number of prompts decoded per mask decoder call.
+            **kwargs (Any): Additional keyword arguments for prediction, such as `imgsz` or `device`.
+
+        Returns:
+            (List[Results]): One Results object per image, with one mask per prompt.
+
+        Examples:
+            >>> sam = SAM("sam_b.pt")
+            >>> results = sam.predict_batch(
+            ...     ["bus.jpg", "zidane.jpg"], bboxes=[[[22, 231, 805, 756]], [[747, 41, 1148, 711]]]
+            ... )
+        """
+        args = {**self.overrides, "conf": 0.25, "task": "segment", "mode": "predict", "imgsz": 1024, **kwargs}
+        if not self.predictor:
+            self.predictor = self._smart_load("predictor")(overrides=args, _callbacks=self.callbacks)
+            self.predictor.setup_model(model=self.model, verbose=False)
+        else:
+            self.predictor.args = get_cfg(self.predictor.args, args)
+        return self.predictor.predict_batch(images, bboxes, points, labels, batch=batch, prompt_batch=prompt_batch)
+
     def info(self, detailed: bool = False, verbose: bool = True):
         """
         Log information about the SAM model.
@@ -98,7 +98,8 @@ class MaskDecoder(nn.Module):
         Predict masks given image and prompt embeddings.
 
         Args:
-            image_embeddings (torch.Tensor): Embeddings from the image encoder.
+            image_embeddings (torch.Tensor): Embeddings from the image encoder, of one image shared by all prompts or
+                of one image per prompt.
             image_pe (torch.Tensor): Positional encoding with the shape of image_embeddings.
             sparse_prompt_embeddings (torch.Tensor): Embeddings of the points and boxes.
             dense_prompt_embeddings (torch.Tensor): Embeddings of the mask inputs.
@@ -144,8 +145,12 @@ class MaskDecoder(nn.Module):
         output_tokens = output_tokens.unsqueeze(0).expand(sparse_prompt_embeddings.shape[0], -1, -1)
         tokens = torch.cat((output_tokens, sparse_prompt_embeddings), dim=1)
 
-        # Expand per-image data in batch direction to be per-mask
-        src = torch.repeat_interleave(image_embeddings, tokens.shape[0], dim=0)
+        # Expand per-image data in batch direction to be per-mask, unless embeddings are already given per mask
+        if image_embeddings.shape[0] == 1:
+            src = torch.repeat_interleave(image_embeddings, tokens.shape[0], dim=0)
+        else:
+            assert image_embeddings.shape[0] == tokens.shape[0]
+            src = image_embeddings
         src = src + dense_prompt_embeddings
         pos_src = torch.repeat_interleave(image_pe, tokens.shape[0], dim=0)
         b, c, h, w = src.shape
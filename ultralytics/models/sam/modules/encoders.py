@@ -427,6 +427,8 @@ class MemoryEncoder(nn.Module):
 
         # Fuse pix_feats and downsampled masks, in case the visual features are on CPU, cast them to CUDA
         pix_feat = pix_feat.to(masks.device)
+        if pix_feat.shape[0] > 1 and pix_feat.stride(0) == 0:  # one frame expanded to several objects, project once
+            pix_feat = pix_feat[:1]
 
         x = self.pix_feat_proj(pix_feat)
         x = x + masks
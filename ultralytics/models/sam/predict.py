@@ -9,15 +9,18 @@ segmentation tasks.
 """
 
 from collections import OrderedDict
+from pathlib import Path
 
+import cv2
 import numpy as np
 import torch
 import torch.nn.functional as F
 
 from ultralytics.data.augment import LetterBox
 from ultralytics.engine.predictor import BasePredictor
-from ultralytics.engine.results import Results
+from ultralytics.engine.results import Results, RoiMasks
 from ultralytics.utils import DEFAULT_CFG, ops
+from ultralytics.utils.checks import check_imgsz
 from ultralytics.utils.torch_utils import select_device, smart_inference_mode
 
 from .amg import (
@@ -29,10 +32,18 @@ from .amg import (
     is_box_near_crop_edge,
     remove_small_regions,
     uncrop_boxes_xyxy,
-    uncrop_masks,
 )
 
 
+def _map_tensors(fn, *features):
+    """Apply a function to the matching tensors of one or more image features structures (tensor, dict or list)."""
+    if isinstance(features[0], torch.Tensor):
+        return fn(*features)
+    if isinstance(features[0], dict):
+        return {k: _map_tensors(fn, *(f[k] for f in features)) for k in features[0]}
+    return [_map_tensors(fn, *x) for x in zip(*features)]
+
+
 class Predictor(BasePredictor):
     """
     Predictor class for SAM, enabling real-time image segmentation with promptable capabilities.
@@ -47,6 +58,7 @@ class Predictor(BasePredictor):
         device (torch.device): The device (CPU or GPU) on which the model is loaded.
         im (torch.Tensor): The preprocessed input image.
         features (torch.Tensor): Extracted image features.
+        feature_cache (FeatureCache | None): Optional cache of image features keyed by image content.
         prompts (Dict[str, Any]): Dictionary to store various types of prompts (e.g., bboxes, points, masks).
         segment_all (bool): Flag to indicate if full image segmentation should be performed.
         mean (torch.Tensor): Mean values for image normalization.
@@ -64,6 +76,7 @@ class Predictor(BasePredictor):
         setup_source: Set up the data source for inference.
         set_image: Set and preprocess a single image for inference.
         get_im_features: Extract image features using the SAM image encoder.
+        cached_im_features: Return image features from the feature cache, encoding the image on a miss.
         set_prompts: Set prompts for subsequent inference.
         reset_image: Reset the current image and its features.
         remove_small_regions: Remove small disconnected regions and holes from masks.
@@ -101,6 +114,7 @@ class Predictor(BasePredictor):
         self.args.retina_masks = True
         self.im = None
         self.features = None
+        self.feature_cache = None  # optional FeatureCache of image features, shared across images
         self.prompts = {}
         self.segment_all = False
 
@@ -201,6 +215,12 @@ class Predictor(BasePredictor):
         if all(i is None for i in [bboxes, points, masks]):
             return self.generate(im, *args, **kwargs)
 
+        if self.features is None and self.feature_cache is not None and self.batch is not None:
+            self.features = self.cached_im_features(im, self.batch[1][0])  # features of this image only
+            try:
+                return self.prompt_inference(im, bboxes, points, labels, masks, multimask_output)
+            finally:
+                self.features = None
         return self.prompt_inference(im, bboxes, points, labels, masks, multimask_output)
 
     def prompt_inference(self, im, bboxes=None, points=None, labels=None, masks=None, multimask_output=False):
@@ -248,7 +268,7 @@ class Predictor(BasePredictor):
         # `d` could be 1 or 3 depends on `multimask_output`.
         return pred_masks.flatten(0, 1), pred_scores.flatten(0, 1)
 
-    def _prepare_prompts(self, dst_shape, bboxes=None, points=None, labels=None, masks=None):
+    def _prepare_prompts(self, dst_shape, bboxes=None, points=None, labels=None, masks=None, src_shape=None):
         """
         Prepare and transform the input prompts for processing based on the destination shape.
 
@@ -258,6 +278,7 @@ class Predictor(BasePredictor):
             points (np.ndarray | List | None): Points indicating object locations with shape (N, 2) or (N, num_points, 2), in pixels.
             labels (np.ndarray | List | None): Point prompt labels with shape (N) or (N, num_points). 1 for foreground, 0 for background.
             masks (List | np.ndarray | None): Masks for the objects, where each mask is a 2D array.
+            src_shape (tuple, optional): The original image shape (height, width), defaults to the current image.
 
         Returns:
             bboxes (torch.Tensor | None): Transformed bounding boxes.
@@ -268,7 +289,7 @@ class Predictor(BasePredictor):
         Raises:
             AssertionError: If the number of points don't match the number of labels, in case labels were passed.
         """
-        src_shape = self.batch[1][0].shape[:2]
+        src_shape = self.batch[1][0].shape[:2] if src_shape is None else src_shape
         r = 1.0 if self.segment_all else min(dst_shape[0] / src_shape[0], dst_shape[1] / src_shape[1])
         # Transform input prompts
         if points is not None:
@@ -293,6 +314,142 @@ class Predictor(BasePredictor):
             masks = torch.as_tensor(masks, dtype=torch.float32, device=self.device).unsqueeze(1)
         return bboxes, points, labels, masks
 
+    @smart_inference_mode()
+    def predict_batch(
+        self, images, bboxes=None, points=None, labels=None, multimask_output=False, batch=8, prompt_batch=64
+    ):
+        """
+        Segment a list of images, each with its own box or point prompts, batching the encoder and decoder calls.
+
+        Images are encoded `batch` at a time, then the prompts of all images are decoded together in chunks of
+        `prompt_batch`, each prompt attending to the features of its own image. Images may have any number of prompts,
+        including none. Prompts are grouped by shape (with or without a box, number of points) rather than padded, as
+        SAM's padding tokens change the decoded masks, so results match prompting each image on its own.
+
+        Args:
+            images (List[str | np.ndarray]): Image paths or BGR images as read by cv2.
+            bboxes (List[np.ndarray | List | None] | None): Boxes of each image in XYXY format with shape (N, 4).
+            points (List[np.ndarray | List | None] | None): Points of each image with shape (N, 2) or
+                (N, num_points, 2), in pixels.
+            labels (List[np.ndarray | List | None] | None): Point labels of each image with shape (N,) or
+                (N, num_points). 1 for foreground, 0 for background.
+            multimask_output (bool): Flag to return multiple masks for ambiguous prompts.
+            batch (int): Number of images encoded per image encoder call.
+            prompt_batch (int): Number of prompts decoded per mask decoder call.
+
+        Returns:
+            (List[Results]): One Results object per image, with one mask per prompt, or three if `multimask_output`.
+
+        Examples:
+            >>> predictor = Predictor(overrides=dict(model="sam_b.pt"))
+            >>> results = predictor.predict_batch(
+            ...     ["bus.jpg", "zidane.jpg"],
+            ...     bboxes=[[[22, 231, 805, 756]], [[747, 41, 1148, 711], [143, 200, 1100, 711]]],
+            ... )
+        """
+        if self.model is None:
+            self.setup_model(model=None)
+        self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)
+        self.im, self.features, self.segment_all = None, None, False
+        n = len(images)
+        bboxes, points, labels = (x if x is not None else [None] * n for x in (bboxes, points, labels))
+        assert len(bboxes) == len(points) == len(labels) == n, "prompts must be given as one entry per image"
+        paths = [str(x) if isinstance(x, (str, Path)) else f"image{i}.jpg" for i, x in enumerate(images)]
+        images = [cv2.imread(str(x)) if isinstance(x, (str, Path)) else x for x in images]
+        ims = [self.preprocess([image]) for image in images]
+
+        # Encode images, looking up the feature cache first
+        features = [None] * n
+        if self.feature_cache is not None:
+            keys = [self.feature_cache.key(image, self.imgsz) for image in images]
+            features = [self.feature_cache.get(key, self.device) for key in keys]
+        misses = [i for i, f in enumerate(features) if f is None]
+        for i in range(0, len(misses), batch):
+            chunk = misses[i : i + batch]
+            encoded = self.get_im_features(torch.cat([ims[j] for j in chunk]))
+            for k, j in enumerate(chunk):
+                features[j] = _map_tensors(lambda t: t[k : k + 1], encoded)
+                if self.feature_cache is not None:  # cache copies, views would keep the whole batch alive
+                    features[j] = _map_tensors(lambda t: t.clone(), features[j])
+                    self.feature_cache.put(keys[j], features[j])
+        self.model.set_imgsz(self.imgsz)
+
+        # Group the prompts of all images by shape, recording the image and input position of each prompt
+        groups, j = {}, 0
+        for i, image in enumerate(images):
+            if bboxes[i] is None and points[i] is None:
+                continue
+            # NOTE: base method on purpose, SAM 2 overrides it to merge boxes into points, done in `_decode_batch`
+            b, p, lb, _ = Predictor._prepare_prompts(
+                self, ims[i].shape[2:], bboxes[i], points[i], labels[i], src_shape=image.shape[:2]
+            )
+            n = len(b) if b is not None else len(p)
+            group = groups.setdefault((b is not None, 0 if p is None else p.shape[1]), [])
+            group.append((b, p, lb, torch.full((n,), i, device=self.device), torch.arange(j, j + n)))
+            j += n
+        if not groups:
+            empty = torch.zeros((0, *self.imgsz), device=self.device)
+            return [
+                self.construct_result(empty, empty[:, 0, 0], im, image, path)
+                for im, image, path in zip(ims, images, paths)
+            ]
+
+        # Decode each group in chunks, every prompt attending to the features of its own image
+        features = _map_tensors(lambda *t: torch.cat(t), *features)
+        pred_masks, pred_scores, idx, order = [], [], [], []
+        for group in groups.values():
+            b, p, lb, g_idx, g_order = (None if x[0] is None else torch.cat(x) for x in zip(*group))
+            for k in range(0, len(g_idx), prompt_batch):
+                s = slice(k, k + prompt_batch)
+                masks, scores = self._decode_batch(
+                    features,
+                    g_idx[s],
+                    b[s] if b is not None else None,
+                    p[s] if p is not None else None,
+                    lb[s] if lb is not None else None,
+                    multimask_output,
+                )
+                pred_masks.append(masks)
+                pred_scores.append(scores)
+            idx.append(g_idx)
+            order.append(g_order)
+        order = torch.cat(order).argsort().to(self.device)
+        idx = torch.cat(idx)[order].repeat_interleave(pred_masks[0].shape[1])  # `d` masks per prompt, 1 or 3
+        pred_masks, pred_scores = (
+            torch.cat(pred_masks)[order].flatten(0, 1),
+            torch.cat(pred_scores)[order].flatten(0, 1),
+        )
+        return [
+            self.construct_result(pred_masks[idx == i], pred_scores[idx == i], im, image, path)
+            for i, (im, image, path) in enumerate(zip(ims, images, paths))
+        ]
+
+    def _decode_batch(self, features, idx, bboxes=None, points=None, labels=None, multimask_output=False):
+        """
+        Decode batched prompts of several images, each prompt attending to the features of its own image.
+
+        Args:
+            features (torch.Tensor): Image features of all images with shape (B, C, H, W).
+            idx (torch.Tensor): Index of the image of each prompt with shape (N,).
+            bboxes (torch.Tensor | None): Boxes with shape (N, 4).
+            points (torch.Tensor | None): Points with shape (N, num_points, 2).
+            labels (torch.Tensor | None): Point labels with shape (N, num_points).
+            multimask_output (bool): Flag to return multiple masks for ambiguous prompts.
+
+        Returns:
+            pred_masks (torch.Tensor): Mask logits with shape (N, d, H, W), where d is 1 or 3.
+            pred_scores (torch.Tensor): Quality scores with shape (N, d).
+        """
+        points = (points, labels) if points is not None else None
+        sparse_embeddings, dense_embeddings = self.model.prompt_encoder(points=points, boxes=bboxes, masks=None)
+        return self.model.mask_decoder(
+            image_embeddings=features[idx],
+            image_pe=self.model.prompt_encoder.get_dense_pe(),
+            sparse_prompt_embeddings=sparse_embeddings,
+            dense_prompt_embeddings=dense_embeddings,
+            multimask_output=multimask_output,
+        )
+
     def generate(
         self,
         im,
@@ -327,10 +484,15 @@ class Predictor(BasePredictor):
             crop_nms_thresh (float): IoU cutoff for NMS to remove duplicate masks between crops.
 
         Returns:
-            pred_masks (torch.Tensor): Segmented masks with shape (N, H, W).
+            pred_masks (torch.Tensor | RoiMasks): Segmented masks with shape (N, H, W), or their crops with `roi_masks`.
             pred_scores (torch.Tensor): Confidence scores for each mask with shape (N,).
             pred_bboxes (torch.Tensor): Bounding boxes for each mask with shape (N, 4).
 
+        Notes:
+            - Masks are filtered by predicted quality before being interpolated to crop size, and kept masks are stored
+              as crops of their boxes, so memory grows with the area of the kept masks rather than with their number.
+            - Each crop is encoded once for all of its point batches.
+
         Examples:
             >>> predictor = Predictor()
             >>> im = torch.rand(1, 3, 1024, 1024)  # Example input image
@@ -343,7 +505,8 @@ class Predictor(BasePredictor):
         crop_regions, layer_idxs = generate_crop_boxes((ih, iw), crop_n_layers, crop_overlap_ratio)
         if point_grids is None:
             point_grids = build_all_layer_point_grids(points_stride, crop_n_layers, crop_downscale_factor)
-        pred_masks, pred_scores, pred_bboxes, region_areas = [], [], [], []
+        pred_masks, pred_offsets, pred_scores, pred_bboxes, region_areas = [], [], [], [], []
+        features = self.features
         for crop_region, layer_idx in zip(crop_regions, layer_idxs):
             x1, y1, x2, y2 = crop_region
             w, h = x2 - x1, y2 - y1
@@ -351,48 +514,62 @@ class Predictor(BasePredictor):
             points_scale = np.array([[w, h]])  # w, h
             # Crop image and interpolate to input size
             crop_im = F.interpolate(im[..., y1:y2, x1:x2], (ih, iw), mode="bilinear", align_corners=False)
+            # Encode each crop once for all its point batches, reusing the image features for the full image crop
+            full = features is not None and crop_region == [0, 0, iw, ih]
+            self.features = features if full else self.get_im_features(crop_im)
             # (num_points, 2)
             points_for_image = point_grids[layer_idx] * points_scale
-            crop_masks, crop_scores, crop_bboxes = [], [], []
-            for (points,) in batch_iterator(points_batch_size, points_for_image):
-                pred_mask, pred_score = self.prompt_inference(crop_im, points=points, multimask_output=True)
-                # Interpolate predicted masks to input size
-                pred_mask = F.interpolate(pred_mask[None], (h, w), mode="bilinear", align_corners=False)[0]
-                idx = pred_score > conf_thres
-                pred_mask, pred_score = pred_mask[idx], pred_score[idx]
-
-                stability_score = calculate_stability_score(
-                    pred_mask, self.model.mask_threshold, stability_score_offset
-                )
-                idx = stability_score > stability_score_thresh
-                pred_mask, pred_score = pred_mask[idx], pred_score[idx]
-                # Bool type is much more memory-efficient.
-                pred_mask = pred_mask > self.model.mask_threshold
-                # (N, 4)
-                pred_bbox = batched_mask_to_box(pred_mask).float()
-                keep_mask = ~is_box_near_crop_edge(pred_bbox, crop_region, [0, 0, iw, ih])
-                if not torch.all(keep_mask):
-                    pred_bbox, pred_mask, pred_score = pred_bbox[keep_mask], pred_mask[keep_mask], pred_score[keep_mask]
-
-                crop_masks.append(pred_mask)
-                crop_bboxes.append(pred_bbox)
-                crop_scores.append(pred_score)
+            crop_masks, crop_offsets, crop_scores, crop_bboxes = [], [], [], []
+            try:
+                for (points,) in batch_iterator(points_batch_size, points_for_image):
+                    pred_mask, pred_score = self.prompt_inference(crop_im, points=points, multimask_output=True)
+                    # Filter by predicted quality first, so only kept masks are interpolated to crop size
+                    idx = pred_score > conf_thres
+                    pred_mask, pred_score = pred_mask[idx], pred_score[idx]
+                    pred_mask = F.interpolate(pred_mask[None], (h, w), mode="bilinear", align_corners=False)[0]
+
+                    stability_score = calculate_stability_score(
+                        pred_mask, self.model.mask_threshold, stability_score_offset
+                    )
+                    idx = stability_score > stability_score_thresh
+                    pred_mask, pred_score = pred_mask[idx], pred_score[idx]
+                    # Bool type is much more memory-efficient.
+                    pred_mask = pred_mask > self.model.mask_threshold
+                    # (N, 4)
+                    pred_bbox = batched_mask_to_box(pred_mask).float()
+                    keep_mask = ~is_box_near_crop_edge(pred_bbox, crop_region, [0, 0, iw, ih])
+                    if not torch.all(keep_mask):
+                        pred_bbox, pred_mask, pred_score = (
+                            pred_bbox[keep_mask],
+                            pred_mask[keep_mask],
+                            pred_score[keep_mask],
+                        )
+
+                    # Keep masks as crops of their boxes, so dense masks of a batch are freed before the next one
+                    boxes = pred_bbox.int().tolist()
+                    crop_masks.extend(m[b[1] : b[3] + 1, b[0] : b[2] + 1].clone() for m, b in zip(pred_mask, boxes))
+                    crop_offsets.append(pred_bbox[:, :2].long())
+                    crop_bboxes.append(pred_bbox)
+                    crop_scores.append(pred_score)
+            finally:
+                self.features = features
 
             # Do nms within this crop
-            crop_masks = torch.cat(crop_masks)
+            crop_offsets = torch.cat(crop_offsets)
             crop_bboxes = torch.cat(crop_bboxes)
             crop_scores = torch.cat(crop_scores)
             keep = torchvision.ops.nms(crop_bboxes, crop_scores, self.args.iou)  # NMS
             crop_bboxes = uncrop_boxes_xyxy(crop_bboxes[keep], crop_region)
-            crop_masks = uncrop_masks(crop_masks[keep], crop_region, ih, iw)
+            crop_offsets = crop_offsets[keep] + torch.tensor([x1, y1], device=crop_offsets.device)
             crop_scores = crop_scores[keep]
 
-            pred_masks.append(crop_masks)
+            pred_masks.extend(crop_masks[i] for i in keep.tolist())
+            pred_offsets.append(crop_offsets)
             pred_bboxes.append(crop_bboxes)
             pred_scores.append(crop_scores)
-            region_areas.append(area.expand(len(crop_masks)))
+            region_areas.append(area.expand(len(crop_offsets)))
 
-        pred_masks = torch.cat(pred_masks)
+        pred_offsets = torch.cat(pred_offsets)
         pred_bboxes = torch.cat(pred_bboxes)
         pred_scores = torch.cat(pred_scores)
         region_areas = torch.cat(region_areas)
@@ -401,9 +578,15 @@ class Predictor(BasePredictor):
         if len(crop_regions) > 1:
             scores = 1 / region_areas
             keep = torchvision.ops.nms(pred_bboxes, scores, crop_nms_thresh)
-            pred_masks, pred_bboxes, pred_scores = pred_masks[keep], pred_bboxes[keep], pred_scores[keep]
+            pred_masks = [pred_masks[i] for i in keep.tolist()]
+            pred_offsets, pred_bboxes, pred_scores = pred_offsets[keep], pred_bboxes[keep], pred_scores[keep]
 
-        return pred_masks, pred_scores, pred_bboxes
+        if self.args.roi_masks:  # masks stay crops, scaled to the original image in `construct_result`
+            return RoiMasks(pred_masks, pred_offsets, (ih, iw), (ih, iw)), pred_scores, pred_bboxes
+        masks = torch.zeros((len(pred_masks), ih, iw), dtype=torch.bool, device=im.device)
+        for mask, roi, (x, y) in zip(masks, pred_masks, pred_offsets.tolist()):
+            mask[y : y + roi.shape[0], x : x + roi.shape[1]] = roi
+        return masks, pred_scores, pred_bboxes
 
     def setup_model(self, model=None, verbose=True):
         """
@@ -469,30 +652,54 @@ class Predictor(BasePredictor):
         # (N, 1, H, W), (N, 1)
         pred_masks, pred_scores = preds[:2]
         pred_bboxes = preds[2] if self.segment_all else None
-        names = dict(enumerate(str(i) for i in range(len(pred_masks))))
 
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
 
-        results = []
-        for masks, orig_img, img_path in zip([pred_masks], orig_imgs, self.batch[0]):
-            if len(masks) == 0:
-                masks, pred_bboxes = None, torch.zeros((0, 6), device=pred_masks.device)
-            else:
-                masks = ops.scale_masks(masks[None].float(), orig_img.shape[:2], padding=False)[0]
-                masks = masks > self.model.mask_threshold  # to bool
-                if pred_bboxes is not None:
-                    pred_bboxes = ops.scale_boxes(img.shape[2:], pred_bboxes.float(), orig_img.shape, padding=False)
-                else:
-                    pred_bboxes = batched_mask_to_box(masks)
-                # NOTE: SAM models do not return cls info. This `cls` here is just a placeholder for consistency.
-                cls = torch.arange(len(pred_masks), dtype=torch.int32, device=pred_masks.device)
-                pred_bboxes = torch.cat([pred_bboxes, pred_scores[:, None], cls[:, None]], dim=-1)
-            results.append(Results(orig_img, path=img_path, names=names, masks=masks, boxes=pred_bboxes))
+        results = [
+            self.construct_result(masks, pred_scores, img, orig_img, img_path, pred_bboxes)
+            for masks, orig_img, img_path in zip([pred_masks], orig_imgs, self.batch[0])
+        ]
         # Reset segment-all mode.
         self.segment_all = False
         return results
 
+    def construct_result(self, pred_masks, pred_scores, img, orig_img, img_path, pred_bboxes=None):
+        """
+        Construct a Results object from the predicted masks of one image.
+
+        Args:
+            pred_masks (torch.Tensor): Predicted mask logits with shape (N, H, W) at the inference size.
+            pred_scores (torch.Tensor): Confidence scores for each mask with shape (N,).
+            img (torch.Tensor): The processed input image tensor with shape (1, C, H, W).
+            orig_img (np.ndarray): The original image before processing.
+            img_path (str): Path to the original image.
+            pred_bboxes (torch.Tensor, optional): Predicted boxes in `img` coordinates, boxes are derived from the
+                masks if not given.
+
+        Returns:
+            (Results): Results object with the masks and boxes scaled to the original image.
+        """
+        names = dict(enumerate(str(i) for i in range(len(pred_masks))))
+        if len(pred_masks) == 0:
+            masks, pred_bboxes = None, torch.zeros((0, 6), device=pred_scores.device)
+        else:
+            if isinstance(pred_masks, RoiMasks):  # binary crops, scaled without building dense masks
+                shape = orig_img.shape[:2]
+                crops, offsets = ops.scale_masks_roi(pred_masks.rois, pred_masks.offsets, img.shape[2:], shape, False)
+                masks = RoiMasks(crops, offsets, shape, shape)
+            else:
+                masks = ops.scale_masks(pred_masks[None].float(), orig_img.shape[:2], padding=False)[0]
+                masks = masks > self.model.mask_threshold  # to bool
+            if pred_bboxes is not None:
+                pred_bboxes = ops.scale_boxes(img.shape[2:], pred_bboxes.float(), orig_img.shape, padding=False)
+            else:
+                pred_bboxes = batched_mask_to_box(masks)
+            # NOTE: SAM models do not return cls info. This `cls` here is just a placeholder for consistency.
+            cls = torch.arange(len(pred_masks), dtype=torch.int32, device=pred_scores.device)
+            pred_bboxes = torch.cat([pred_bboxes, pred_scores[:, None], cls[:, None]], dim=-1)
+        return Results(orig_img, path=img_path, names=names, masks=masks, boxes=pred_bboxes)
+
     def setup_source(self, source):
         """
         Set up the data source for inference.
@@ -548,7 +755,7 @@ class Predictor(BasePredictor):
         assert len(self.dataset) == 1, "`set_image` only supports setting one image!"
         for batch in self.dataset:
             im = self.preprocess(batch[1])
-            self.features = self.get_im_features(im)
+            self.features = self.cached_im_features(im, batch[1][0])
             break
 
     def get_im_features(self, im):
@@ -559,6 +766,28 @@ class Predictor(BasePredictor):
         self.model.set_imgsz(self.imgsz)
         return self.model.image_encoder(im)
 
+    def cached_im_features(self, im, image):
+        """
+        Return the image features of an image from `feature_cache`, running the image encoder on a miss.
+
+        Args:
+            im (torch.Tensor): The preprocessed input image with shape (1, C, H, W).
+            image (np.ndarray): The original image, whose content keys the cache.
+
+        Returns:
+            (torch.Tensor | dict): Image features as returned by `get_im_features`.
+        """
+        if self.feature_cache is None:
+            return self.get_im_features(im)
+        key = self.feature_cache.key(image, self.imgsz)
+        features = self.feature_cache.get(key, self.device)
+        if features is None:
+            features = self.get_im_features(im)
+            self.feature_cache.put(key, features)
+        else:
+            self.model.set_imgsz(self.imgsz)  # prompt encoders must match the size the features were computed at
+        return features
+
     def set_prompts(self, prompts):
         """Set prompts for subsequent inference operations."""
         self.prompts = prompts
@@ -731,7 +960,7 @@ class SAM2Predictor(Predictor):
         # `d` could be 1 or 3 depends on `multimask_output`.
         return pred_masks.flatten(0, 1), pred_scores.flatten(0, 1)
 
-    def _prepare_prompts(self, dst_shape, bboxes=None, points=None, labels=None, masks=None):
+    def _prepare_prompts(self, dst_shape, bboxes=None, points=None, labels=None, masks=None, src_shape=None):
         """
         Prepare and transform the input prompts for processing based on the destination shape.
 
@@ -741,6 +970,7 @@ class SAM2Predictor(Predictor):
             points (np.ndarray | List | None): Points indicating object locations with shape (N, 2) or (N, num_points, 2), in pixels.
             labels (np.ndarray | List | None): Point prompt labels with shape (N,) or (N, num_points). 1 for foreground, 0 for background.
             masks (List | np.ndarray | None): Masks for the objects, where each mask is a 2D array.
+            src_shape (tuple, optional): The original image shape (height, width), defaults to the current image.
 
         Returns:
             points (torch.Tensor | None): Transformed points.
@@ -750,7 +980,13 @@ class SAM2Predictor(Predictor):
         Raises:
             AssertionError: If the number of points don't match the number of labels, in case labels were passed.
         """
-        bboxes, points, labels, masks = super()._prepare_prompts(dst_shape, bboxes, points, labels, masks)
+        bboxes, points, labels, masks = super()._prepare_prompts(dst_shape, bboxes, points, labels, masks, src_shape)
+        points, labels = self._merge_boxes(bboxes, points, labels)
+        return points, labels, masks
+
+    @staticmethod
+    def _merge_boxes(bboxes, points, labels):
+        """Merge boxes into points as their two corners with labels 2 and 3, the only box input of SAM 2."""
         if bboxes is not None:
             bboxes = bboxes.view(-1, 2, 2)
             bbox_labels = torch.tensor([[2, 3]], dtype=torch.int32, device=bboxes.device).expand(len(bboxes), -1)
@@ -761,7 +997,24 @@ class SAM2Predictor(Predictor):
                 labels = torch.cat([bbox_labels, labels], dim=1)
             else:
                 points, labels = bboxes, bbox_labels
-        return points, labels, masks
+        return points, labels
+
+    def _decode_batch(self, features, idx, bboxes=None, points=None, labels=None, multimask_output=False):
+        """Decode batched prompts of several images with the SAM 2 prompt encoder and mask decoder."""
+        points, labels = self._merge_boxes(bboxes, points, labels)
+        sparse_embeddings, dense_embeddings = self.model.sam_prompt_encoder(
+            points=(points, labels), boxes=None, masks=None
+        )
+        pred_masks, pred_scores, _, _ = self.model.sam_mask_decoder(
+            image_embeddings=features["image_embed"][idx],
+            image_pe=self.model.sam_prompt_encoder.get_dense_pe(),
+            sparse_prompt_embeddings=sparse_embeddings,
+            dense_prompt_embeddings=dense_embeddings,
+            multimask_output=multimask_output,
+            repeat_image=False,
+            high_res_features=[feat_level[idx] for feat_level in features["high_res_feats"]],
+        )
+        return pred_masks, pred_scores
 
     def set_image(self, image):
         """
@@ -792,7 +1045,7 @@ class SAM2Predictor(Predictor):
         assert len(self.dataset) == 1, "`set_image` only supports setting one image!"
         for batch in self.dataset:
             im = self.preprocess(batch[1])
-            self.features = self.get_im_features(im)
+            self.features = self.cached_im_features(im, batch[1][0])
             break
 
     def get_im_features(self, im):
@@ -808,7 +1061,7 @@ class SAM2Predictor(Predictor):
         if self.model.directly_add_no_mem_embed:
             vision_feats[-1] = vision_feats[-1] + self.model.no_mem_embed
         feats = [
-            feat.permute(1, 2, 0).view(1, -1, *feat_size)
+            feat.permute(1, 2, 0).view(im.shape[0], -1, *feat_size)
             for feat, feat_size in zip(vision_feats[::-1], self._bb_feat_sizes[::-1])
         ][::-1]
         return {"image_embed": feats[-1], "high_res_feats": feats[:-1]}
@@ -827,13 +1080,17 @@ class SAM2VideoPredictor(SAM2Predictor):
         non_overlap_masks (bool): A flag indicating whether masks should be non-overlapping.
         clear_non_cond_mem_around_input (bool): A flag to control clearing non-conditional memory around inputs.
         clear_non_cond_mem_for_multi_obj (bool): A flag to control clearing non-conditional memory for multi-object scenarios.
+        trim_non_cond_memory (bool): A flag to drop non-conditioning frame outputs once memory attention no longer
+            reads them, keeping memory flat on long videos.
+        offload_state_to_cpu (bool): A flag to store mask memories and low-resolution masks on CPU between frames.
+        keep_high_res_masks (bool): A flag to keep the high-resolution masks of each frame in the inference state.
         callbacks (dict): A dictionary of callbacks for various prediction lifecycle events.
 
     Methods:
         get_model: Retrieve and configure the model with binarization enabled.
         inference: Perform image segmentation inference based on the given input cues.
         postprocess: Post-process the predictions to apply non-overlapping constraints if required.
-        add_new_prompts: Add new points or masks to a specific frame for a given object ID.
+        add_new_prompts: Add new points or masks to a specific frame for one or several object IDs.
         propagate_in_video_preflight: Prepare inference_state and consolidate temporary outputs before tracking.
         init_state: Initialize an inference state for the predictor.
         get_im_features: Extract and process image features using SAM2's image encoder for subsequent segmentation tasks.
@@ -873,6 +1130,9 @@ class SAM2VideoPredictor(SAM2Predictor):
         self.non_overlap_masks = True
         self.clear_non_cond_mem_around_input = False
         self.clear_non_cond_mem_for_multi_obj = False
+        self.trim_non_cond_memory = True
+        self.offload_state_to_cpu = False
+        self.keep_high_res_masks = False
         self.callbacks["on_predict_start"].append(self.init_state)
 
     def get_model(self):
@@ -913,12 +1173,10 @@ class SAM2VideoPredictor(SAM2Predictor):
         output_dict = self.inference_state["output_dict"]
         if len(output_dict["cond_frame_outputs"]) == 0:  # initialize prompts
             points, labels, masks = self._prepare_prompts(im.shape[2:], bboxes, points, labels, masks)
-            if points is not None:
-                for i in range(len(points)):
-                    self.add_new_prompts(obj_id=i, points=points[[i]], labels=labels[[i]], frame_idx=frame)
+            if points is not None:  # all objects are decoded together in one batch
+                self.add_new_prompts(obj_id=list(range(len(points))), points=points, labels=labels, frame_idx=frame)
             elif masks is not None:
-                for i in range(len(masks)):
-                    self.add_new_prompts(obj_id=i, masks=masks[[i]], frame_idx=frame)
+                self.add_new_prompts(obj_id=list(range(len(masks))), masks=masks, frame_idx=frame)
         self.propagate_in_video_preflight()
 
         consolidated_frame_inds = self.inference_state["consolidated_frame_inds"]
@@ -952,7 +1210,9 @@ class SAM2VideoPredictor(SAM2Predictor):
         # individual object after tracking.
         self._add_output_per_object(frame, current_out, storage_key)
         self.inference_state["frames_already_tracked"].append(frame)
-        pred_masks = current_out["pred_masks"].flatten(0, 1)
+        if self.trim_non_cond_memory:
+            self._trim_non_cond_memory(frame)
+        pred_masks = current_out["pred_masks"].to(self.device, non_blocking=True).flatten(0, 1)
         pred_masks = pred_masks[(pred_masks > self.model.mask_threshold).sum((1, 2)) > 0]  # filter blank masks
 
         return pred_masks, torch.ones(len(pred_masks), dtype=pred_masks.dtype, device=pred_masks.device)
@@ -994,15 +1254,17 @@ class SAM2VideoPredictor(SAM2Predictor):
         frame_idx=0,
     ):
         """
-        Add new points or masks to a specific frame for a given object ID.
+        Add new points or masks to a specific frame for a given object ID, or for several objects at once.
 
         This method updates the inference state with new prompts (points or masks) for a specified
         object and frame index. It ensures that the prompts are either points or masks, but not both,
         and updates the internal state accordingly. It also handles the generation of new segmentations
-        based on the provided prompts and the existing state.
+        based on the provided prompts and the existing state. Prompts of several objects on a frame that
+        has not been tracked yet run through the mask decoder in a single batch.
 
         Args:
-            obj_id (int): The ID of the object to which the prompts are associated.
+            obj_id (int | List[int]): The ID of the object to which the prompts are associated, or a list of IDs
+                with one prompt per object along the first dimension of `points`, `labels` or `masks`.
             points (torch.Tensor, optional): The coordinates of the points of interest.
             labels (torch.Tensor, optional): The labels corresponding to the points.
             masks (torch.Tensor, optional): Binary masks for the object.
@@ -1021,48 +1283,62 @@ class SAM2VideoPredictor(SAM2Predictor):
             - The method handles the consolidation of outputs and resizing of masks to the original video resolution.
         """
         assert (masks is None) ^ (points is None), "'masks' and 'points' prompts are not compatible with each other."
-        obj_idx = self._obj_id_to_idx(obj_id)
-
-        point_inputs = None
-        pop_key = "point_inputs_per_obj"
-        if points is not None:
-            point_inputs = {"point_coords": points, "point_labels": labels}
-            self.inference_state["point_inputs_per_obj"][obj_idx][frame_idx] = point_inputs
-            pop_key = "mask_inputs_per_obj"
-        self.inference_state["mask_inputs_per_obj"][obj_idx][frame_idx] = masks
-        self.inference_state[pop_key][obj_idx].pop(frame_idx, None)
+        obj_ids = obj_id if isinstance(obj_id, (list, tuple)) else [obj_id]
+        obj_idxs = [self._obj_id_to_idx(i) for i in obj_ids]
         # If this frame hasn't been tracked before, we treat it as an initial conditioning
         # frame, meaning that the inputs points are to generate segments on this frame without
         # using any memory from other frames, like in SAM. Otherwise (if it has been tracked),
         # the input points will be used to correct the already tracked masks.
         is_init_cond_frame = frame_idx not in self.inference_state["frames_already_tracked"]
-        obj_output_dict = self.inference_state["output_dict_per_obj"][obj_idx]
-        obj_temp_output_dict = self.inference_state["temp_output_dict_per_obj"][obj_idx]
         # Add a frame to conditioning output if it's an initial conditioning frame or
         # if the model sees all frames receiving clicks/mask as conditioning frames.
         is_cond = is_init_cond_frame or self.model.add_all_frames_to_correct_as_cond
         storage_key = "cond_frame_outputs" if is_cond else "non_cond_frame_outputs"
 
-        # Get any previously predicted mask logits on this object and feed it along with
+        # Get any previously predicted mask logits on each object, to feed them along with
         # the new clicks into the SAM mask decoder.
-        prev_sam_mask_logits = None
         # lookup temporary output dict first, which contains the most recent output
         # (if not found, then lookup conditioning and non-conditioning frame output)
-        if point_inputs is not None:
-            prev_out = (
-                obj_temp_output_dict[storage_key].get(frame_idx)
-                or obj_output_dict["cond_frame_outputs"].get(frame_idx)
-                or obj_output_dict["non_cond_frame_outputs"].get(frame_idx)
-            )
+        prev_outs = [None] * len(obj_idxs)
+        if points is not None:
+            for i, obj_idx in enumerate(obj_idxs):
+                obj_output_dict = self.inference_state["output_dict_per_obj"][obj_idx]
+                prev_outs[i] = (
+                    self.inference_state["temp_output_dict_per_obj"][obj_idx][storage_key].get(frame_idx)
+                    or obj_output_dict["cond_frame_outputs"].get(frame_idx)
+                    or obj_output_dict["non_cond_frame_outputs"].get(frame_idx)
+                )
+        if len(obj_idxs) > 1 and (
+            not is_init_cond_frame or len(set(obj_idxs)) < len(obj_idxs) or any(o is not None for o in prev_outs)
+        ):
+            # corrections read the memory and previous masks of each object, so they are decoded one at a time
+            for i, obj_id in enumerate(obj_ids):
+                prompts = dict(points=points[[i]], labels=labels[[i]]) if points is not None else dict(masks=masks[[i]])
+                pred_masks, _ = self.add_new_prompts(obj_id=obj_id, frame_idx=frame_idx, **prompts)
+            return pred_masks, torch.ones(len(obj_ids), dtype=pred_masks.dtype, device=pred_masks.device)
+
+        point_inputs = None
+        for i, obj_idx in enumerate(obj_idxs):
+            pop_key = "point_inputs_per_obj"
+            if points is not None:
+                obj_point_inputs = {"point_coords": points[[i]], "point_labels": labels[[i]]}
+                self.inference_state["point_inputs_per_obj"][obj_idx][frame_idx] = obj_point_inputs
+                pop_key = "mask_inputs_per_obj"
+            self.inference_state["mask_inputs_per_obj"][obj_idx][frame_idx] = masks[[i]] if masks is not None else None
+            self.inference_state[pop_key][obj_idx].pop(frame_idx, None)
+        if points is not None:
+            point_inputs = {"point_coords": points, "point_labels": labels}
 
-            if prev_out is not None and prev_out.get("pred_masks") is not None:
-                prev_sam_mask_logits = prev_out["pred_masks"].to(device=self.device, non_blocking=True)
-                # Clamp the scale of prev_sam_mask_logits to avoid rare numerical issues.
-                prev_sam_mask_logits.clamp_(-32.0, 32.0)
+        prev_sam_mask_logits = None
+        if prev_outs[0] is not None and prev_outs[0].get("pred_masks") is not None:
+            prev_sam_mask_logits = prev_outs[0]["pred_masks"].to(device=self.device, non_blocking=True)
+            # Clamp the scale of prev_sam_mask_logits to avoid rare numerical issues.
+            prev_sam_mask_logits.clamp_(-32.0, 32.0)
         current_out = self._run_single_frame_inference(
-            output_dict=obj_output_dict,  # run on the slice of a single object
+            # run on the slice of a single object, several objects only on frames without memory to read
+            output_dict=self.inference_state["output_dict_per_obj"][obj_idxs[0]],
             frame_idx=frame_idx,
-            batch_size=1,  # run on the slice of a single object
+            batch_size=len(obj_idxs),
             is_init_cond_frame=is_init_cond_frame,
             point_inputs=point_inputs,
             mask_inputs=masks,
@@ -1074,8 +1350,10 @@ class SAM2VideoPredictor(SAM2Predictor):
             run_mem_encoder=False,
             prev_sam_mask_logits=prev_sam_mask_logits,
         )
-        # Add the output to the output dict (to be used as future memory)
-        obj_temp_output_dict[storage_key][frame_idx] = current_out
+        # Add the output of each object to the output dict (to be used as future memory)
+        for i, obj_idx in enumerate(obj_idxs):
+            obj_out = {k: v[i : i + 1] if isinstance(v, torch.Tensor) else v for k, v in current_out.items()}
+            self.inference_state["temp_output_dict_per_obj"][obj_idx][storage_key][frame_idx] = obj_out
 
         # Resize the output mask to the original video resolution
         consolidated_out = self._consolidate_temp_output_across_obj(
@@ -1084,7 +1362,7 @@ class SAM2VideoPredictor(SAM2Predictor):
             run_mem_encoder=False,
         )
         pred_masks = consolidated_out["pred_masks"].flatten(0, 1)
-        return pred_masks.flatten(0, 1), torch.ones(1, dtype=pred_masks.dtype, device=pred_masks.device)
+        return pred_masks.flatten(0, 1), torch.ones(len(obj_idxs), dtype=pred_masks.dtype, device=pred_masks.device)
 
     @smart_inference_mode()
     def propagate_in_video_preflight(self):
@@ -1221,14 +1499,17 @@ class SAM2VideoPredictor(SAM2Predictor):
         Note:
             - If `batch` is greater than 1, the features are expanded to fit the batch size.
             - The method leverages the model's `_prepare_backbone_features` method to prepare the backbone features.
+            - The image encoder runs once per frame, its output is reused by every call on the same `im`.
         """
-        backbone_out = self.model.forward_image(im)
-        if batch > 1:  # expand features if there's more than one prompt
-            for i, feat in enumerate(backbone_out["backbone_fpn"]):
-                backbone_out["backbone_fpn"][i] = feat.expand(batch, -1, -1, -1)
-            for i, pos in enumerate(backbone_out["vision_pos_enc"]):
-                pos = pos.expand(batch, -1, -1, -1)
-                backbone_out["vision_pos_enc"][i] = pos
+        cached_im, backbone_out = self.inference_state.get("backbone_out", (None, None))
+        if cached_im is not im:
+            backbone_out = self.model.forward_image(im)
+            self.inference_state["backbone_out"] = (im, backbone_out)
+        backbone_out = {  # expand features if there's more than one object, views keep a single copy in memory
+            **backbone_out,
+            "backbone_fpn": [feat.expand(batch, -1, -1, -1) for feat in backbone_out["backbone_fpn"]],
+            "vision_pos_enc": [pos.expand(batch, -1, -1, -1) for pos in backbone_out["vision_pos_enc"]],
+        }
         _, vis_feats, vis_pos_embed, feat_sizes = self.model._prepare_backbone_features(backbone_out)
         return vis_feats, vis_pos_embed, feat_sizes
 
@@ -1344,11 +1625,16 @@ class SAM2VideoPredictor(SAM2Predictor):
             prev_sam_mask_logits=prev_sam_mask_logits,
         )
 
+        # offload the state of this frame if requested, memory attention loads it back to the device when read
+        storage_device = torch.device("cpu") if self.offload_state_to_cpu else self.device
         maskmem_features = current_out["maskmem_features"]
         if maskmem_features is not None:
             current_out["maskmem_features"] = maskmem_features.to(
-                dtype=torch.float16, device=self.device, non_blocking=True
+                dtype=torch.float16, device=storage_device, non_blocking=True
             )
+        current_out["pred_masks"] = current_out["pred_masks"].to(storage_device, non_blocking=True)
+        if not self.keep_high_res_masks:  # only used to encode the memory of this frame, already done above
+            current_out.pop("pred_masks_high_res", None)
         # NOTE: Do not support the `fill_holes_in_mask_scores` function since it needs cuda extensions
         # potentially fill holes in the predicted masks
         # if self.fill_hole_area > 0:
@@ -1459,6 +1745,7 @@ class SAM2VideoPredictor(SAM2Predictor):
                 device=self.device,
             ),
         }
+        found, missing = [], []
         for obj_idx in range(batch_size):
             obj_temp_output_dict = self.inference_state["temp_output_dict_per_obj"][obj_idx]
             obj_output_dict = self.inference_state["output_dict_per_obj"][obj_idx]
@@ -1475,16 +1762,20 @@ class SAM2VideoPredictor(SAM2Predictor):
             # and leave its mask scores to the default scores (i.e. the NO_OBJ_SCORE
             # placeholder above) and set its object pointer to be a dummy pointer.
             if out is None:
-                # Fill in dummy object pointers for those objects without any inputs or
-                # tracking outcomes on this frame (only do it under `run_mem_encoder=True`,
-                # i.e. when we need to build the memory for tracking).
-                if run_mem_encoder:
-                    # fill object pointer with a dummy pointer (based on an empty mask)
-                    consolidated_out["obj_ptr"][obj_idx : obj_idx + 1] = self._get_empty_mask_ptr(frame_idx)
-                continue
-            # Add the temporary object output mask to consolidated output mask
-            consolidated_out["pred_masks"][obj_idx : obj_idx + 1] = out["pred_masks"]
-            consolidated_out["obj_ptr"][obj_idx : obj_idx + 1] = out["obj_ptr"]
+                missing.append(obj_idx)
+            else:
+                found.append((obj_idx, out))
+        # Add the object outputs to the consolidated output in one indexed copy per key
+        if found:
+            idx = torch.tensor([obj_idx for obj_idx, _ in found], device=self.device)
+            for k in ("pred_masks", "obj_ptr"):
+                consolidated_out[k][idx] = torch.cat([out[k].to(self.device, non_blocking=True) for _, out in found])
+        # Fill in dummy object pointers for those objects without any inputs or
+        # tracking outcomes on this frame (only do it under `run_mem_encoder=True`,
+        # i.e. when we need to build the memory for tracking).
+        if missing and run_mem_encoder:
+            # fill object pointer with a dummy pointer (based on an empty mask), the same for every object
+            consolidated_out["obj_ptr"][missing] = self._get_empty_mask_ptr(frame_idx)
 
         # Optionally, apply non-overlapping constraints on the consolidated scores and rerun the memory encoder
         if run_mem_encoder:
@@ -1565,7 +1856,8 @@ class SAM2VideoPredictor(SAM2Predictor):
 
         # "maskmem_pos_enc" is the same across frames, so we only need to store one copy of it
         maskmem_pos_enc = self._get_maskmem_pos_enc(maskmem_pos_enc)
-        return maskmem_features.to(dtype=torch.float16, device=self.device, non_blocking=True), maskmem_pos_enc
+        storage_device = torch.device("cpu") if self.offload_state_to_cpu else self.device
+        return maskmem_features.to(dtype=torch.float16, device=storage_device, non_blocking=True), maskmem_pos_enc
 
     def _add_output_per_object(self, frame_idx, current_out, storage_key):
         """
@@ -1598,6 +1890,29 @@ class SAM2VideoPredictor(SAM2Predictor):
                 obj_out["maskmem_pos_enc"] = [x[obj_slice] for x in maskmem_pos_enc]
             obj_output_dict[storage_key][frame_idx] = obj_out
 
+    def _trim_non_cond_memory(self, frame_idx):
+        """
+        Remove the non-conditioning outputs that memory attention no longer reads when tracking after a frame.
+
+        Tracking a frame attends to the mask memories of the last `num_maskmem - 1` non-conditioning frames (every
+        `memory_temporal_stride_for_eval`-th frame beyond the previous one) and to the object pointers of the last
+        `max_obj_ptrs_in_encoder - 1` frames. Older non-conditioning outputs are never read again while tracking forward,
+        so they are dropped to keep memory flat on long videos. Conditioning frames and frames with user inputs are kept.
+
+        Args:
+            frame_idx (int): The index of the frame that was just tracked.
+        """
+        r = self.model.memory_temporal_stride_for_eval
+        window = 1 + max(self.model.num_maskmem - 2, 0) * r
+        if self.model.use_obj_ptrs_in_encoder:
+            window = max(window, self.model.max_obj_ptrs_in_encoder - 1)
+        oldest = frame_idx + 1 - window  # oldest frame read when tracking the next frame
+        keep = self.inference_state["consolidated_frame_inds"]["non_cond_frame_outputs"]
+        output_dicts = [self.inference_state["output_dict"], *self.inference_state["output_dict_per_obj"].values()]
+        for t in [t for t in output_dicts[0]["non_cond_frame_outputs"] if t < oldest and t not in keep]:
+            for output_dict in output_dicts:
+                output_dict["non_cond_frame_outputs"].pop(t, None)
+
     def _clear_non_cond_mem_around_input(self, frame_idx):
         """
         Remove the non-conditioning memory around the input frame.
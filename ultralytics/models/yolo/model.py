@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 from ultralytics.data.build import load_inference_source
 from ultralytics.engine.model import Model
 from ultralytics.models import yolo
+from ultralytics.nn.registry import MODEL_REGISTRY
 from ultralytics.nn.tasks import (
     ClassificationModel,
     DetectionModel,
@@ -183,6 +184,7 @@ class YOLOWorld(Model):
         Args:
             classes (List[str]): A list of categories i.e. ["person"].
         """
+        self._unshare_model(rekey=True)
         self.model.set_classes(classes)
         # Remove background if it's given
         background = " "
@@ -192,7 +194,10 @@ class YOLOWorld(Model):
 
         # Reset method class names
         if self.predictor:
-            self.predictor.model.names = classes
+            if MODEL_REGISTRY.enabled:  # cached backends are shared, set up a new one for the new classes
+                self.predictor = None
+            else:
+                self.predictor.model.names = classes
 
 
 class YOLOE(Model):
@@ -308,7 +313,10 @@ class YOLOE(Model):
             >>> model.set_vocab(["person", "car", "dog"], ["person", "car", "dog"])
         """
         assert isinstance(self.model, YOLOEModel)
+        self._unshare_model(rekey=True)
         self.model.set_vocab(vocab, names=names)
+        if MODEL_REGISTRY.enabled:
+            self.predictor = None  # cached backends are shared, set up a new one for the new vocabulary
 
     def get_vocab(self, names):
         """Get vocabulary for the given class names."""
@@ -324,6 +332,7 @@ class YOLOE(Model):
             embeddings (torch.Tensor): Embeddings corresponding to the classes.
         """
         assert isinstance(self.model, YOLOEModel)
+        self._unshare_model(rekey=True)
         self.model.set_classes(classes, embeddings)
         # Verify no background class is present
         assert " " not in classes
@@ -331,7 +340,10 @@ class YOLOE(Model):
 
         # Reset method class names
         if self.predictor:
-            self.predictor.model.names = classes
+            if MODEL_REGISTRY.enabled:  # cached backends are shared, set up a new one for the new classes
+                self.predictor = None
+            else:
+                self.predictor.model.names = classes
 
     def val(
         self,
@@ -419,6 +431,7 @@ class YOLOE(Model):
                 if isinstance(source, list) and refer_image is None  # means multiple images
                 else len(set(visual_prompts["cls"]))
             )
+            self._unshare_model(rekey=True)
             self.model.model[-1].nc = num_cls
             self.model.names = [f"object{i}" for i in range(num_cls)]
             self.predictor.set_prompts(visual_prompts.copy())
@@ -431,6 +444,7 @@ class YOLOE(Model):
                     refer_image = next(iter(dataset))[1][0]
             if refer_image is not None:
                 vpe = self.predictor.get_vpe(refer_image)
+                self._unshare_model(rekey=True)  # the prompt predictor's cached backend must not be reused below
                 self.model.set_classes(self.model.names, vpe)
                 self.task = "segment" if isinstance(self.predictor, yolo.segment.SegmentationPredictor) else "detect"
                 self.predictor = None  # reset predictor
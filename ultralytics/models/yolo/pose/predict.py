@@ -1,5 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from functools import partial
+
 from ultralytics.models.yolo.detect.predict import DetectionPredictor
 from ultralytics.utils import DEFAULT_CFG, LOGGER, ops
 
@@ -74,7 +76,7 @@ class PosePredictor(DetectionPredictor):
         result = super().construct_result(pred, img, orig_img, img_path)
         # Extract keypoints from prediction and reshape according to model's keypoint shape
         pred_kpts = pred[:, 6:].view(len(pred), *self.model.kpt_shape)
-        # Scale keypoints coordinates to match the original image dimensions
-        pred_kpts = ops.scale_coords(img.shape[2:], pred_kpts, orig_img.shape)
-        result.update(keypoints=pred_kpts)
+        # Scale keypoints coordinates to match the original image dimensions, on first access if lazy
+        scale = partial(ops.scale_coords, img.shape[2:], pred_kpts, orig_img.shape)
+        result.update(keypoints=scale if self.args.lazy else scale())
         return result
@@ -1,6 +1,6 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from ultralytics.engine.results import Results
+from ultralytics.engine.results import Results, RoiMasks
 from ultralytics.models.yolo.detect.predict import DetectionPredictor
 from ultralytics.utils import DEFAULT_CFG, ops
 
@@ -21,6 +21,7 @@ class SegmentationPredictor(DetectionPredictor):
         postprocess: Apply non-max suppression and process segmentation detections.
         construct_results: Construct a list of result objects from predictions.
         construct_result: Construct a single result object from a prediction.
+        process_roi_masks: Upsample masks inside their boxes and return them as crops.
 
     Examples:
         >>> from ultralytics.utils import ASSETS
@@ -101,6 +102,13 @@ class SegmentationPredictor(DetectionPredictor):
         """
         if not len(pred):  # save empty boxes
             masks = None
+        elif self.args.lazy:
+            return self.construct_lazy_result(pred, img, orig_img, img_path, proto)
+        elif self.args.roi_masks:
+            boxes = pred[:, :4].clone()  # boxes in model input space
+            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+            boxes = pred[:, :4] if self.args.retina_masks else boxes
+            masks = self.process_roi_masks(proto, pred[:, 6:], boxes, img, orig_img)
         elif self.args.retina_masks:
             pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
             masks = ops.process_mask_native(proto, pred[:, 6:], pred[:, :4], orig_img.shape[:2])  # HWC
@@ -108,6 +116,69 @@ class SegmentationPredictor(DetectionPredictor):
             masks = ops.process_mask(proto, pred[:, 6:], pred[:, :4], img.shape[2:], upsample=True)  # HWC
             pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
         if masks is not None:
-            keep = masks.sum((-2, -1)) > 0  # only keep predictions with masks
+            area = masks.area if isinstance(masks, RoiMasks) else masks.sum((-2, -1))
+            keep = area > 0  # only keep predictions with masks
             pred, masks = pred[keep], masks[keep]
         return Results(orig_img, path=img_path, names=self.model.names, boxes=pred[:, :6], masks=masks)
+
+    def construct_lazy_result(self, pred, img, orig_img, img_path, proto):
+        """
+        Construct a single result object whose masks are only upsampled when `Results.masks` is first accessed.
+
+        Predictions with empty masks are filtered using masks at prototype resolution, which are cheap to compute, so
+        results that are only used for their boxes never pay for mask upsampling. For tiny objects this check can differ
+        from the full-resolution one, keeping or dropping a slightly different set of boxes. The prototypes are copied,
+        since exported backends overwrite their output buffers with the next batch, and the mask options are read when
+        the result is built.
+
+        Args:
+            pred (torch.Tensor): The predicted bounding boxes, scores, and mask coefficients.
+            img (torch.Tensor): The image after preprocessing.
+            orig_img (np.ndarray): The original image before preprocessing.
+            img_path (str): The path to the original image.
+            proto (torch.Tensor): The prototype masks.
+
+        Returns:
+            (Results): Result object with boxes scaled to the original image and deferred masks.
+        """
+        keep = ops.process_mask(proto, pred[:, 6:], pred[:, :4], img.shape[2:]).sum((-2, -1)) > 0  # prototype size
+        pred = pred[keep]
+        coeffs, boxes = pred[:, 6:], pred[:, :4].clone()  # boxes in model input space
+        pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+        roi, retina = self.args.roi_masks, self.args.retina_masks  # args of a later predict call must not apply
+        shape, orig_shape = orig_img.shape[:2] if retina else img.shape[2:], orig_img.shape[:2]
+        native = pred[:, :4].clone()  # boxes in original image space
+        if len(coeffs):
+            proto = proto.clone()  # exported backends overwrite their output buffers with the next batch
+
+        def masks():
+            """Upsample the deferred masks, only using values captured when the result was built."""
+            if roi:
+                crops, offsets = ops.process_mask_roi(proto, coeffs, native if retina else boxes, shape, native=retina)
+                return RoiMasks(crops, offsets, shape, orig_shape)
+            if not len(coeffs):  # all masks were empty
+                return proto.new_zeros((0, *shape))
+            if retina:
+                return ops.process_mask_native(proto, coeffs, native, shape)  # HWC
+            return ops.process_mask(proto, coeffs, boxes, shape, upsample=True)  # HWC
+
+        masks = masks if len(coeffs) else masks()  # nothing to defer, and no prototypes to keep, for empty results
+        return Results(orig_img, path=img_path, names=self.model.names, boxes=pred[:, :6], masks=masks)
+
+    def process_roi_masks(self, proto, coeffs, boxes, img, orig_img):
+        """
+        Upsample masks only inside their boxes and return them as crops, see `ops.process_mask_roi`.
+
+        Args:
+            proto (torch.Tensor): The prototype masks.
+            coeffs (torch.Tensor): The mask coefficients of each prediction.
+            boxes (torch.Tensor): Boxes in original image space with `retina_masks`, in model input space otherwise.
+            img (torch.Tensor): The image after preprocessing.
+            orig_img (np.ndarray): The original image before preprocessing.
+
+        Returns:
+            (RoiMasks): Mask crops of the original image size with `retina_masks`, of the model input size otherwise.
+        """
+        shape = orig_img.shape[:2] if self.args.retina_masks else img.shape[2:]
+        crops, offsets = ops.process_mask_roi(proto, coeffs, boxes, shape, native=self.args.retina_masks)
+        return RoiMasks(crops, offsets, shape, orig_img.shape[:2])
@@ -2,10 +2,13 @@
 
 import ast
 import json
+import os
 import platform
 import zipfile
 from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
@@ -16,6 +19,7 @@ from PIL import Image
 
 from ultralytics.utils import ARM64, IS_JETSON, LINUX, LOGGER, PYTHON_VERSION, ROOT, YAML
 from ultralytics.utils.checks import check_requirements, check_suffix, check_version, check_yaml, is_rockchip
+from ultralytics.utils.cpu import cpu_count, set_cpu_config
 from ultralytics.utils.downloads import attempt_download_asset, is_url
 
 
@@ -122,6 +126,7 @@ class AutoBackend(nn.Module):
 
     Methods:
         forward: Run inference on an input image.
+        submit: Submit a batch for inference without blocking and return a future.
         from_numpy: Convert numpy array to tensor.
         warmup: Warm up the model with a dummy input.
         _model_type: Determine the model type from file path.
@@ -141,6 +146,11 @@ class AutoBackend(nn.Module):
         fp16: bool = False,
         fuse: bool = True,
         verbose: bool = True,
+        workers: int = 0,
+        threads: Optional[int] = None,
+        inter_threads: Optional[int] = None,
+        streams: Optional[int] = None,
+        cpus: Optional[Union[str, int, List[int]]] = None,
     ):
         """
         Initialize the AutoBackend for inference.
@@ -153,6 +163,12 @@ class AutoBackend(nn.Module):
             fp16 (bool): Enable half-precision inference. Supported only on specific backends.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization.
             verbose (bool): Enable verbose logging.
+            workers (int): Number of inference requests `submit` keeps in flight for ONNX Runtime and OpenVINO. 0 uses
+                a single ONNX Runtime request and the optimal number of OpenVINO requests for the performance hint.
+            threads (int, optional): Number of intra-op CPU threads for PyTorch, ONNX Runtime and OpenVINO.
+            inter_threads (int, optional): Number of inter-op CPU threads for PyTorch and ONNX Runtime.
+            streams (int, optional): Number of OpenVINO CPU inference streams.
+            cpus (str | int | List[int], optional): CPU cores to pin this process to, i.e. '0-15' or [0, 1, 2, 3].
         """
         super().__init__()
         w = str(weights[0] if isinstance(weights, list) else weights)
@@ -182,6 +198,13 @@ class AutoBackend(nn.Module):
         end2end, dynamic = False, False
         model, metadata, task = None, None, None
 
+        # Set CPU threads and core affinity
+        cpu_threads = None
+        if threads or inter_threads or cpus is not None:
+            cpu_threads = set_cpu_config(threads, inter_threads, cpus)  # number of pinned cores if threads is not set
+        # Default runtimes to the pinned cores, shared between concurrent requests, instead of all machine cores
+        threads = threads or (max(1, (cpu_threads or cpu_count()) // workers) if workers > 1 else cpu_threads)
+
         # Set device
         cuda = isinstance(device, torch.device) and torch.cuda.is_available() and device.type != "cpu"  # use CUDA
         if cuda and not any([nn_module, pt, jit, engine, onnx, paddle]):  # GPU dataloader formats
@@ -254,7 +277,13 @@ class AutoBackend(nn.Module):
                     cuda = False
             LOGGER.info(f"Using ONNX Runtime {providers[0]}")
             if onnx:
-                session = onnxruntime.InferenceSession(w, providers=providers)
+                session_options = onnxruntime.SessionOptions()
+                if threads:
+                    session_options.intra_op_num_threads = threads
+                if inter_threads:
+                    session_options.inter_op_num_threads = inter_threads
+                    session_options.execution_mode = onnxruntime.ExecutionMode.ORT_PARALLEL
+                session = onnxruntime.InferenceSession(w, session_options, providers=providers)
             else:
                 check_requirements(
                     ["model-compression-toolkit>=2.4.1", "sony-custom-layers[torch]>=0.3.0", "onnxruntime-extensions"]
@@ -273,20 +302,24 @@ class AutoBackend(nn.Module):
             dynamic = isinstance(session.get_outputs()[0].shape[0], str)
             fp16 = "float16" in session.get_inputs()[0].type
             if not dynamic:
-                io = session.io_binding()
-                bindings = []
-                for output in session.get_outputs():
-                    out_fp16 = "float16" in output.type
-                    y_tensor = torch.empty(output.shape, dtype=torch.float16 if out_fp16 else torch.float32).to(device)
-                    io.bind_output(
-                        name=output.name,
-                        device_type=device.type,
-                        device_id=device.index if cuda else 0,
-                        element_type=np.float16 if out_fp16 else np.float32,
-                        shape=tuple(y_tensor.shape),
-                        buffer_ptr=y_tensor.data_ptr(),
-                    )
-                    bindings.append(y_tensor)
+                io_pool = Queue()  # one IO binding with reusable output buffers per concurrent request
+                for _ in range(max(workers, 1)):
+                    io = session.io_binding()
+                    bindings = []
+                    for output in session.get_outputs():
+                        out_fp16 = "float16" in output.type
+                        dtype = torch.float16 if out_fp16 else torch.float32
+                        y_tensor = torch.empty(output.shape, dtype=dtype).to(device)
+                        io.bind_output(
+                            name=output.name,
+                            device_type=device.type,
+                            device_id=device.index if cuda else 0,
+                            element_type=np.float16 if out_fp16 else np.float32,
+                            shape=tuple(y_tensor.shape),
+                            buffer_ptr=y_tensor.data_ptr(),
+                        )
+                        bindings.append(y_tensor)
+                    io_pool.put((io, bindings))
 
         # OpenVINO
         elif xml:
@@ -316,15 +349,18 @@ class AutoBackend(nn.Module):
                 dynamic = metadata.get("args", {}).get("dynamic", dynamic)
             # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (not recommended), or 'CUMULATIVE_THROUGHPUT'
             inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 and dynamic else "LATENCY"
-            ov_compiled_model = core.compile_model(
-                ov_model,
-                device_name=device_name,
-                config={"PERFORMANCE_HINT": inference_mode},
-            )
+            ov_config = {"PERFORMANCE_HINT": inference_mode}
+            if threads:
+                ov_config["INFERENCE_NUM_THREADS"] = threads
+            if streams:
+                ov_config["NUM_STREAMS"] = streams
+            ov_compiled_model = core.compile_model(ov_model, device_name=device_name, config=ov_config)
             LOGGER.info(
                 f"Using OpenVINO {inference_mode} mode for batch={batch} inference on {', '.join(ov_compiled_model.get_property('EXECUTION_DEVICES'))}..."
             )
             input_name = ov_compiled_model.input().get_any_name()
+            ov_queue = ov.AsyncInferQueue(ov_compiled_model, workers)  # long-lived request pool, 0 for optimal size
+            ov_queue.set_callback(lambda request, userdata: userdata(request.results))  # userdata handles results
 
         # TensorRT
         elif engine:
@@ -518,11 +554,9 @@ class AutoBackend(nn.Module):
         elif mnn:
             LOGGER.info(f"Loading {w} for MNN inference...")
             check_requirements("MNN")  # requires MNN
-            import os
-
             import MNN
 
-            config = {"precision": "low", "backend": "CPU", "numThread": (os.cpu_count() + 1) // 2}
+            config = {"precision": "low", "backend": "CPU", "numThread": threads or (os.cpu_count() + 1) // 2}
             rt = MNN.nn.create_runtime_manager((config,))
             net = MNN.nn.load_module_from_file(w, [], [], runtime_manager=rt, rearrange=True)
 
@@ -610,6 +644,8 @@ class AutoBackend(nn.Module):
             for p in model.parameters():
                 p.requires_grad = False
 
+        executor = None  # ONNX Runtime thread pool for `submit`, created on first use
+        warmed_shapes = set()  # input shapes the backend has been warmed up with
         self.__dict__.update(locals())  # assign all variables to self
 
     def forward(
@@ -618,6 +654,7 @@ class AutoBackend(nn.Module):
         augment: bool = False,
         visualize: bool = False,
         embed: Optional[List] = None,
+        own_outputs: bool = False,
         **kwargs: Any,
     ) -> Union[torch.Tensor, List[torch.Tensor]]:
         """
@@ -628,6 +665,8 @@ class AutoBackend(nn.Module):
             augment (bool): Whether to perform data augmentation during inference.
             visualize (bool): Whether to visualize the output predictions.
             embed (list, optional): A list of feature vectors/embeddings to return.
+            own_outputs (bool): Copy ONNX Runtime outputs out of the reusable IO binding buffers before the binding is
+                released to other requests, otherwise the outputs are only valid until the binding is used again.
             **kwargs (Any): Additional keyword arguments for model configuration.
 
         Returns:
@@ -661,16 +700,21 @@ class AutoBackend(nn.Module):
             else:
                 if not self.cuda:
                     im = im.cpu()
-                self.io.bind_input(
-                    name="images",
-                    device_type=im.device.type,
-                    device_id=im.device.index if im.device.type == "cuda" else 0,
-                    element_type=np.float16 if self.fp16 else np.float32,
-                    shape=tuple(im.shape),
-                    buffer_ptr=im.data_ptr(),
-                )
-                self.session.run_with_iobinding(self.io)
-                y = self.bindings
+                io, bindings = self.io_pool.get()  # wait for an idle IO binding
+                try:
+                    io.bind_input(
+                        name="images",
+                        device_type=im.device.type,
+                        device_id=im.device.index if im.device.type == "cuda" else 0,
+                        element_type=np.float16 if self.fp16 else np.float32,
+                        shape=tuple(im.shape),
+                        buffer_ptr=im.data_ptr(),
+                    )
+                    self.session.run_with_iobinding(io)
+                    # Copy outputs before the binding can be taken by another request if the caller keeps them
+                    y = [x.clone() for x in bindings] if own_outputs else bindings
+                finally:
+                    self.io_pool.put((io, bindings))
             if self.imx:
                 if self.task == "detect":
                     # boxes, conf, cls
@@ -687,17 +731,14 @@ class AutoBackend(nn.Module):
                 n = im.shape[0]  # number of images in batch
                 results = [None] * n  # preallocate list with None to match the number of images
 
-                def callback(request, userdata):
-                    """Place result in preallocated list using userdata index."""
-                    results[userdata] = request.results
-
-                # Create AsyncInferQueue, set the callback and start asynchronous inference for each input image
-                async_queue = self.ov.AsyncInferQueue(self.ov_compiled_model)
-                async_queue.set_callback(callback)
+                # Start asynchronous inference for each input image on the request pool, placing each result in the
+                # preallocated list at its image index
                 for i in range(n):
-                    # Start async inference with userdata=i to specify the position in results list
-                    async_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=i)  # keep image as BCHW
-                async_queue.wait_all()  # wait for all inference requests to complete
+                    self.ov_queue.start_async(
+                        inputs={self.input_name: im[i : i + 1]},  # keep image as BCHW
+                        userdata=lambda r, i=i: results.__setitem__(i, r),
+                    )
+                self.ov_queue.wait_all()  # wait for all inference requests to complete
                 y = [list(r.values()) for r in results]
                 y = [np.concatenate(x) for x in zip(*y)]
             else:  # inference_mode = "LATENCY", optimized for fastest first result at batch-size 1
@@ -826,6 +867,52 @@ class AutoBackend(nn.Module):
                     y[1] = np.transpose(y[1], (0, 3, 1, 2))  # should be y = (1, 116, 8400), (1, 32, 160, 160)
             y = [x if isinstance(x, np.ndarray) else x.numpy() for x in y]
 
+        return self._to_tensors(y)
+
+    def submit(self, im: torch.Tensor, **kwargs: Any) -> Future:
+        """
+        Submit a batch for inference without blocking and return a future resolving to the outputs of `forward`.
+
+        OpenVINO batches run on the long-lived request pool and ONNX Runtime batches on a thread pool of `workers`
+        requests, each with its own IO binding, so several batches can be kept in flight. Other backends run the batch
+        synchronously and return a completed future. The input tensor must not be modified until the future is done.
+
+        Args:
+            im (torch.Tensor): The image tensor to perform inference on.
+            **kwargs (Any): Additional keyword arguments passed to `forward`.
+
+        Returns:
+            (Future): Future resolving to the raw output tensor(s) of the model.
+
+        Examples:
+            >>> model = AutoBackend(weights="yolo11n.onnx", workers=4)
+            >>> futures = [model.submit(batch) for batch in batches]
+            >>> outputs = [f.result() for f in futures]
+        """
+        if self.xml:
+            future = Future()
+
+            def done(results):
+                """Resolve the future with the converted outputs of a finished request."""
+                try:
+                    future.set_result(self._to_tensors(list(results.values())))
+                except Exception as e:
+                    future.set_exception(e)
+
+            if self.fp16 and im.dtype != torch.float16:
+                im = im.half()
+            self.ov_queue.start_async(inputs={self.input_name: im.cpu().numpy()}, userdata=done)
+            return future
+        if self.onnx and not self.imx:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=max(self.workers, 1), thread_name_prefix="onnxruntime")
+            return self.executor.submit(self.forward, im, own_outputs=True, **kwargs)
+        future = Future()
+        future.set_result(self.forward(im, **kwargs))
+        return future
+
+    def _to_tensors(self, y: Any) -> Union[torch.Tensor, List[torch.Tensor]]:
+        """Convert raw backend outputs to a tensor or list of tensors on the model device."""
         # for x in y:
         #     print(type(x), len(x)) if isinstance(x, (list, tuple)) else print(type(x), x.shape)  # debug shapes
         if isinstance(y, (list, tuple)):
@@ -848,20 +935,27 @@ class AutoBackend(nn.Module):
         """
         return torch.tensor(x).to(self.device) if isinstance(x, np.ndarray) else x
 
-    def warmup(self, imgsz: Tuple[int, int, int, int] = (1, 3, 640, 640)) -> None:
+    def warmup(self, imgsz: Tuple[int, int, int, int] = (1, 3, 640, 640), force: bool = False) -> None:
         """
         Warm up the model by running one forward pass with a dummy input.
 
         Args:
             imgsz (tuple): The shape of the dummy input tensor in the format (batch_size, channels, height, width)
+            force (bool): Run the forward pass on every backend and device, i.e. to compile the kernels of a
+                dynamic-shape model for a new input shape ahead of time.
         """
         import torchvision  # noqa (import here so torchvision import time not recorded in postprocess time)
 
+        imgsz = tuple(imgsz)
+        if imgsz in self.warmed_shapes:  # already warmed up, i.e. a backend shared through the model registry
+            return
+
         warmup_types = self.pt, self.jit, self.onnx, self.engine, self.saved_model, self.pb, self.triton, self.nn_module
-        if any(warmup_types) and (self.device.type != "cpu" or self.triton):
+        if force or (any(warmup_types) and (self.device.type != "cpu" or self.triton)):
             im = torch.empty(*imgsz, dtype=torch.half if self.fp16 else torch.float, device=self.device)  # input
             for _ in range(2 if self.jit else 1):
                 self.forward(im)  # warmup
+            self.warmed_shapes.add(imgsz)
 
     @staticmethod
     def _model_type(p: str = "path/to/model.pt") -> List[bool]:
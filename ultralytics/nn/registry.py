@@ -0,0 +1,232 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import inspect
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import torch
+
+from ultralytics.utils import LOGGER
+from ultralytics.utils.torch_utils import select_device
+
+
+def memory_size(obj: Any) -> int:
+    """
+    Estimate the memory held by a cached model, in bytes.
+
+    PyTorch modules and PyTorch AutoBackends are measured by their parameters and buffers, other backends by the size
+    of their weights on disk.
+
+    Args:
+        obj (Any): A torch.nn.Module, an AutoBackend or a (model, ckpt) checkpoint tuple.
+
+    Returns:
+        (int): Estimated size in bytes.
+    """
+    if isinstance(obj, tuple):  # (model, ckpt) checkpoint
+        obj = obj[0]
+    if getattr(obj, "pt", False) or getattr(obj, "nn_module", False):
+        obj = obj.model
+    if isinstance(obj, torch.nn.Module) and not hasattr(obj, "w"):
+        return sum(t.numel() * t.element_size() for t in (*obj.parameters(), *obj.buffers()))
+    path = Path(str(getattr(obj, "w", "")))
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return path.stat().st_size if path.is_file() else 0
+
+
+class ModelRegistry:
+    """
+    Process-wide LRU cache of loaded checkpoints and warmed AutoBackend instances.
+
+    When enabled, `Model` reuses cached PyTorch checkpoints instead of reading weights again, and predictors reuse
+    cached AutoBackends, skipping weight loading, layer fusion, session compilation and warmup. Backends are keyed by
+    weights, device and backend arguments, and are shared read-only between all predictors using the same key. Least
+    recently used entries are evicted when the number of cached entries or their estimated memory exceeds the limits.
+
+    Attributes:
+        max_models (int): Maximum number of cached entries, 0 disables the registry.
+        max_memory (int | None): Maximum estimated memory of cached entries in bytes, None for no limit.
+        entries (OrderedDict): Cached entries as {key: (obj, size, source)}, ordered from least to most recently used.
+        lock (threading.Lock): Lock guarding the cache across threads.
+
+    Methods:
+        configure: Set the cache limits, enabling or disabling the registry.
+        load_checkpoint: Return a cached PyTorch checkpoint, loading it on a miss.
+        get: Return a cached AutoBackend, building it on a miss.
+        preload: Load and warm up a list of models ahead of time.
+        clear: Remove all cached entries.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> from ultralytics.nn.registry import MODEL_REGISTRY
+        >>> MODEL_REGISTRY.configure(max_models=20, max_memory=8 << 30)
+        >>> MODEL_REGISTRY.preload(["yolo11n.pt", "yolo11s.onnx"], device="cpu")
+        >>> results = YOLO("yolo11n.pt")("image.jpg")  # reuses the preloaded backend
+    """
+
+    def __init__(self, max_models: int = 0, max_memory: Optional[int] = None):
+        """
+        Initialize the registry with its cache limits.
+
+        Args:
+            max_models (int): Maximum number of cached entries, 0 disables the registry.
+            max_memory (int, optional): Maximum estimated memory of cached entries in bytes.
+        """
+        self.max_models = max_models
+        self.max_memory = max_memory
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the registry caches models."""
+        return self.max_models > 0
+
+    def configure(self, max_models: int = 16, max_memory: Optional[int] = None) -> "ModelRegistry":
+        """
+        Set the cache limits, enabling the registry when `max_models` is positive and disabling it otherwise.
+
+        Args:
+            max_models (int): Maximum number of cached entries, 0 disables the registry and clears it.
+            max_memory (int, optional): Maximum estimated memory of cached entries in bytes.
+
+        Returns:
+            (ModelRegistry): The registry itself.
+        """
+        with self.lock:
+            self.max_models, self.max_memory = max_models, max_memory
+            self._evict()
+        return self
+
+    @staticmethod
+    def _path_key(weights: Union[str, Path]) -> Tuple[str, float]:
+        """Return a key for a weights path that changes when the file is modified."""
+        path = Path(weights).resolve()
+        return str(path), path.stat().st_mtime if path.exists() else 0.0
+
+    def _lookup(self, key: Tuple):
+        """Return the cached object for a key and mark it most recently used, or None on a miss."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+        return None
+
+    def _insert(self, key: Tuple, obj: Any, source: Any = None) -> None:
+        """Cache an object and the source it was built from under a key, evicting entries beyond the limits."""
+        self.entries[key] = (obj, memory_size(obj), source)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until the cache fits its limits, keeping the newest entry."""
+        while self.entries and (
+            len(self.entries) > self.max_models
+            or (
+                self.max_memory is not None
+                and len(self.entries) > 1
+                and sum(entry[1] for entry in self.entries.values()) > self.max_memory
+            )
+        ):
+            key, _ = self.entries.popitem(last=False)
+            LOGGER.debug(f"Model registry evicted {key[1]}")
+
+    def load_checkpoint(self, weights: Union[str, Path]) -> Tuple[torch.nn.Module, Dict]:
+        """
+        Return a cached PyTorch checkpoint, loading it from disk on a miss.
+
+        The returned model is shared by every caller, so it is frozen in eval mode with gradients disabled. Callers must
+        deep-copy it before changing it in place, as `Model` does before training, fusing, validating or moving it.
+
+        Args:
+            weights (str | Path): Path to a *.pt checkpoint.
+
+        Returns:
+            model (torch.nn.Module): The loaded model.
+            ckpt (dict): The loaded checkpoint dictionary.
+        """
+        from ultralytics.nn.tasks import attempt_load_one_weight
+
+        key = ("checkpoint", *self._path_key(weights))
+        with self.lock:
+            ckpt = self._lookup(key)
+            if ckpt is None:
+                ckpt = attempt_load_one_weight(weights)
+                ckpt[0].eval().requires_grad_(False)  # shared read-only module
+                self._insert(key, ckpt)
+        return ckpt
+
+    def get(self, weights: Union[str, Path, torch.nn.Module], device: torch.device, **kwargs: Any):
+        """
+        Return a cached AutoBackend for the given weights and arguments, building it on a miss.
+
+        In-memory modules are keyed by identity and copied before wrapping, so the cached backend never moves, casts or
+        fuses a module that other models still use. Arguments that only affect logging or class names, i.e. `verbose`
+        and `data`, are not part of the cache key.
+
+        Args:
+            weights (str | Path | torch.nn.Module): Path to the model weights or an in-memory model.
+            device (torch.device): Device to run the model on.
+            **kwargs (Any): Additional AutoBackend arguments.
+
+        Returns:
+            (AutoBackend): The cached backend, shared by every predictor using the same key.
+        """
+        from ultralytics.nn.autobackend import AutoBackend
+
+        is_module = isinstance(weights, torch.nn.Module)
+        params = inspect.signature(AutoBackend.__init__).parameters
+        args = {k: p.default for k, p in params.items() if k not in {"self", "weights", "device", "verbose", "data"}}
+        args.update((k, v) for k, v in kwargs.items() if k in args)
+        source = ("module", id(weights)) if is_module else self._path_key(weights)
+        key = ("backend", *source, str(device), *((k, str(v)) for k, v in sorted(args.items())))
+        with self.lock:
+            backend = self._lookup(key)
+            if backend is None:
+                backend = AutoBackend(weights=deepcopy(weights) if is_module else weights, device=device, **kwargs)
+                self._insert(key, backend, source=weights)  # keep modules alive so their id is not reused while cached
+        return backend
+
+    def preload(
+        self,
+        models: List[Union[str, Path]],
+        device: str = "",
+        imgsz: Union[int, Tuple[int, int]] = 640,
+        batch: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Load and warm up a list of models ahead of time, typically at service startup.
+
+        Args:
+            models (List[str | Path]): Model weights to preload.
+            device (str): Device to load the models on, i.e. 'cpu' or '0'.
+            imgsz (int | Tuple[int, int]): Inference image size used for warmup.
+            batch (int): Batch size used for warmup.
+            **kwargs (Any): Additional AutoBackend arguments, which must match those used at inference to be reused.
+        """
+        if not self.enabled:
+            self.configure(max_models=max(16, len(models)))
+        imgsz = (imgsz, imgsz) if isinstance(imgsz, int) else tuple(imgsz)
+        device = select_device(device, verbose=False)
+        for weights in models:
+            if str(weights).endswith(".pt"):
+                model, _ = self.load_checkpoint(weights)
+                weights = model  # predictors of a registry-loaded Model wrap this shared checkpoint module
+                kwargs.setdefault("fuse", True)
+            backend = self.get(weights, device=device, **kwargs)
+            backend.warmup(imgsz=(1 if backend.pt or backend.triton else batch, backend.ch, *imgsz))
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self.entries)
+
+
+MODEL_REGISTRY = ModelRegistry()  # process-wide registry, disabled until configured
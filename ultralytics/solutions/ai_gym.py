@@ -3,7 +3,7 @@
 from collections import defaultdict
 from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 
 
 class AIGym(BaseSolution):
@@ -72,7 +72,7 @@ class AIGym(BaseSolution):
             >>> results = gym.process(image)
             >>> processed_image = results.plot_im
         """
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
 
         self.extract_tracks(im0)  # Extract tracks (bounding boxes, classes, and masks)
 
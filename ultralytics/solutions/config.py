@@ -23,6 +23,9 @@ class SolutionConfig:
         show_labels (bool): Whether to display class labels on visual output.
         region (List[Tuple[int, int]], optional): Polygonal region or line for object counting.
         colormap (int, optional): OpenCV colormap constant for visual overlays (e.g., cv2.COLORMAP_JET).
+        heatmap_decay (float): Factor applied to the accumulated heatmap every frame, 1.0 keeps all history.
+        heatmap_interval (int): Number of frames between heatmap colormap renders.
+        heatmap_scale (float): Resolution of the accumulated heatmap relative to the input frame (0.0 to 1.0).
         show_in (bool): Whether to display count number for objects entering the region.
         show_out (bool): Whether to display count number for objects leaving the region.
         up_angle (float): Upper angle threshold used in pose-based workouts monitoring.
@@ -41,6 +44,7 @@ class SolutionConfig:
         meter_per_pixel (float): Scale for real-world measurement, used in speed or distance calculations.
         max_speed (int): Maximum speed limit (e.g., km/h or mph) used in visual alerts or constraints.
         show (bool): Whether to display the visual output on screen.
+        headless (bool): Whether to skip all drawing and display, returning only the solution analytics.
         iou (float): Intersection-over-Union threshold for detection filtering.
         conf (float): Confidence threshold for keeping predictions.
         device (str, optional): Device to run inference on (e.g., 'cpu', '0' for CUDA GPU).
@@ -67,6 +71,9 @@ class SolutionConfig:
     show_labels: bool = True
     region: Optional[List[Tuple[int, int]]] = None
     colormap: Optional[int] = cv2.COLORMAP_DEEPGREEN
+    heatmap_decay: float = 1.0
+    heatmap_interval: int = 1
+    heatmap_scale: float = 1.0
     show_in: bool = True
     show_out: bool = True
     up_angle: float = 145.0
@@ -85,6 +92,7 @@ class SolutionConfig:
     meter_per_pixel: float = 0.05
     max_speed: int = 120
     show: bool = False
+    headless: bool = False
     iou: float = 0.7
     conf: float = 0.25
     device: Optional[str] = None
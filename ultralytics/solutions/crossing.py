@@ -0,0 +1,184 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def segments_intersect(a0: np.ndarray, a1: np.ndarray, b0: np.ndarray, b1: np.ndarray) -> np.ndarray:
+    """
+    Test every segment a0->a1 against every segment b0->b1 for intersection, including touching endpoints.
+
+    Args:
+        a0 (np.ndarray): Start points of the first set of segments with shape (N, 2).
+        a1 (np.ndarray): End points of the first set of segments with shape (N, 2).
+        b0 (np.ndarray): Start points of the second set of segments with shape (M, 2).
+        b1 (np.ndarray): End points of the second set of segments with shape (M, 2).
+
+    Returns:
+        (np.ndarray): Boolean array of shape (N, M), True where segment i of the first set intersects segment j.
+
+    Examples:
+        >>> a0, a1 = np.array([[0, 0]]), np.array([[10, 10]])
+        >>> b0, b1 = np.array([[0, 10], [20, 0]]), np.array([[10, 0], [30, 0]])
+        >>> segments_intersect(a0, a1, b0, b1)  # array([[ True, False]])
+    """
+    a0, a1 = np.asarray(a0, dtype=np.float64)[:, None], np.asarray(a1, dtype=np.float64)[:, None]  # (N, 1, 2)
+    b0, b1 = np.asarray(b0, dtype=np.float64)[None], np.asarray(b1, dtype=np.float64)[None]  # (1, M, 2)
+
+    def cross(o, p, q):
+        """Z component of the cross product (p - o) x (q - o)."""
+        return (p[..., 0] - o[..., 0]) * (q[..., 1] - o[..., 1]) - (p[..., 1] - o[..., 1]) * (q[..., 0] - o[..., 0])
+
+    d1, d2 = cross(b0, b1, a0), cross(b0, b1, a1)  # sides of a's endpoints relative to b
+    d3, d4 = cross(a0, a1, b0), cross(a0, a1, b1)  # sides of b's endpoints relative to a
+    intersect = (d1 * d2 <= 0) & (d3 * d4 <= 0)
+
+    # Collinear segments only intersect if their extents overlap on both axes
+    collinear = (d1 == 0) & (d2 == 0)
+    overlap = (np.minimum(a0, a1) <= np.maximum(b0, b1)).all(-1) & (np.minimum(b0, b1) <= np.maximum(a0, a1)).all(-1)
+    return np.where(collinear, overlap, intersect)
+
+
+def points_in_polygons(points: np.ndarray, polygons: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Test every point against every polygon with a vectorized even-odd ray casting rule.
+
+    Polygons with fewer vertices are padded by repeating their last vertex, which only adds zero-length edges.
+
+    Args:
+        points (np.ndarray): Points of shape (N, 2).
+        polygons (Sequence[np.ndarray]): Polygons, each an array of shape (V, 2) with V >= 3 vertices.
+
+    Returns:
+        (np.ndarray): Boolean array of shape (N, P), True where point i lies inside polygon j.
+
+    Examples:
+        >>> points = np.array([[5, 5], [15, 5]])
+        >>> polygons = [np.array([[0, 0], [10, 0], [10, 10], [0, 10]])]
+        >>> points_in_polygons(points, polygons)  # array([[ True], [False]])
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if not len(polygons):
+        return np.zeros((len(points), 0), dtype=bool)
+    nv = max(len(p) for p in polygons)
+    vertices = np.stack(
+        [np.concatenate([p, np.repeat(p[-1:], nv - len(p), axis=0)]) for p in map(np.asarray, polygons)]
+    ).astype(np.float64)  # (P, V, 2)
+    xi, yi = vertices[None, ..., 0], vertices[None, ..., 1]  # (1, P, V)
+    xj, yj = np.roll(xi, 1, axis=-1), np.roll(yi, 1, axis=-1)
+    px, py = points[:, None, None, 0], points[:, None, None, 1]  # (N, 1, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = ((yi > py) != (yj > py)) & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+    return crossing.sum(-1) % 2 == 1
+
+
+class CrossingCounter:
+    """
+    Vectorized counting engine that detects objects crossing lines or entering polygons across many regions at once.
+
+    Each region is either a line (2 points), crossed when the segment between a track's previous and current centroid
+    intersects it, or a polygon (3+ points), entered when the current centroid lies inside it. Every track is counted
+    at most once per region, and its direction is inward when it moves right (for regions taller than wide) or
+    downward (otherwise). Per-track state is stored in arrays indexed by an internal track row, and the rows of tracks
+    not seen for more than `max_age` frames are dropped, so a track ID that reappears after that is counted again.
+
+    Attributes:
+        regions (List[np.ndarray]): Region points, each with shape (2, 2) for lines or (V, 2) for polygons.
+        is_line (np.ndarray): Boolean array of shape (R,), True for line regions.
+        vertical (np.ndarray): Boolean array of shape (R,), True where direction is decided by horizontal movement.
+        track_rows (Dict[int, int]): Mapping from track ID to its row in the state arrays.
+        prev (np.ndarray): Last known centroid per track row with shape (T, 2).
+        counted (np.ndarray): Boolean array of shape (T, R), True where a track was already counted for a region.
+        last_seen (np.ndarray): Frame index at which each track row was last updated, with shape (T,).
+        max_age (int): Number of frames a missing track is kept before its row is dropped.
+        frame (int): Number of updates so far.
+
+    Methods:
+        update: Update the per-track state with current centroids and return the new crossings of this frame.
+
+    Examples:
+        >>> counter = CrossingCounter([[(0, 50), (100, 50)], [(0, 0), (10, 0), (10, 10), (0, 10)]])
+        >>> counter.update([1, 2], np.array([[20, 40], [5, 5]]))
+        >>> crossed, inward = counter.update([1, 2], np.array([[20, 60], [6, 6]]))
+    """
+
+    def __init__(self, regions: Sequence[Sequence[Tuple[float, float]]], max_age: int = 120) -> None:
+        """
+        Initialize the counting engine with a list of line or polygon regions.
+
+        Args:
+            regions (Sequence[Sequence[Tuple[float, float]]]): Regions given as lists of (x, y) points, 2 points for a
+                line and 3 or more for a polygon.
+            max_age (int): Number of frames a missing track is kept before its state is dropped, longer than the
+                tracker keeps lost tracks.
+        """
+        self.regions = [np.asarray(r, dtype=np.float64).reshape(-1, 2) for r in regions]
+        self.is_line = np.array([len(r) == 2 for r in self.regions], dtype=bool)
+        extent = np.array([r.max(0) - r.min(0) for r in self.regions]).reshape(-1, 2)
+        self.vertical = extent[:, 0] < extent[:, 1]
+        self.line_idx, self.poly_idx = np.nonzero(self.is_line)[0], np.nonzero(~self.is_line)[0]
+        self.line_pts = np.array([self.regions[i] for i in self.line_idx]).reshape(-1, 2, 2)
+        self.polygons = [self.regions[i] for i in self.poly_idx]
+
+        self.track_rows: Dict[int, int] = {}
+        self.prev = np.zeros((0, 2), dtype=np.float64)
+        self.counted = np.zeros((0, len(self.regions)), dtype=bool)
+        self.last_seen = np.zeros(0, dtype=np.int64)
+        self.max_age = max(int(max_age), 1)
+        self.frame = 0
+
+    def _rows(self, track_ids: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return state rows for the given track IDs, allocating rows for new tracks, and a mask of known tracks."""
+        known = np.array([t in self.track_rows for t in track_ids], dtype=bool)
+        for t in track_ids:
+            if t not in self.track_rows:
+                self.track_rows[t] = len(self.track_rows)
+        n = len(self.track_rows)
+        if n > len(self.prev):  # grow state arrays geometrically
+            size = max(n, 2 * len(self.prev))
+            self.prev = np.concatenate([self.prev, np.zeros((size - len(self.prev), 2))])
+            self.counted = np.concatenate([self.counted, np.zeros((size - len(self.counted), len(self.regions)), bool)])
+            self.last_seen = np.concatenate([self.last_seen, np.zeros(size - len(self.last_seen), np.int64)])
+        return np.array([self.track_rows[t] for t in track_ids], dtype=np.int64), known
+
+    def update(self, track_ids: List[int], centroids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Update the per-track state with the current centroids and return the crossings that happened in this frame.
+
+        Args:
+            track_ids (List[int]): Track IDs of the current frame, with length N.
+            centroids (np.ndarray): Current centroids of the tracks with shape (N, 2).
+
+        Returns:
+            crossed (np.ndarray): Boolean array of shape (N, R), True where a track is newly counted for a region.
+            inward (np.ndarray): Boolean array of shape (N, R), True where the counted movement is inward.
+        """
+        centroids = np.asarray(centroids, dtype=np.float64).reshape(-1, 2)
+        rows, known = self._rows(list(track_ids))
+        prev = self.prev[rows]
+        crossed = np.zeros((len(rows), len(self.regions)), dtype=bool)
+        if len(self.line_idx):
+            crossed[:, self.line_idx] = segments_intersect(prev, centroids, self.line_pts[:, 0], self.line_pts[:, 1])
+        if len(self.poly_idx):
+            crossed[:, self.poly_idx] = points_in_polygons(centroids, self.polygons)
+        crossed &= known[:, None] & ~self.counted[rows]  # tracks need a previous position and count once per region
+
+        delta = centroids - prev
+        inward = np.where(self.vertical[None], delta[:, :1] > 0, delta[:, 1:] > 0) & crossed
+        self.counted[rows] |= crossed
+        self.prev[rows] = centroids
+        self.last_seen[rows] = self.frame
+        self.frame += 1
+        if self.frame % self.max_age == 0:
+            self._prune()
+        return crossed, inward
+
+    def _prune(self) -> None:
+        """Drop the state rows of tracks not seen for more than `max_age` frames, compacting the state arrays."""
+        live = [(t, r) for t, r in self.track_rows.items() if self.frame - 1 - self.last_seen[r] <= self.max_age]
+        if len(live) == len(self.track_rows):
+            return
+        rows = np.array([r for _, r in live], dtype=np.int64)
+        self.prev, self.counted, self.last_seen = self.prev[rows], self.counted[rows], self.last_seen[rows]
+        self.track_rows = {t: i for i, (t, _) in enumerate(live)}
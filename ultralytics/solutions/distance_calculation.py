@@ -5,7 +5,7 @@ from typing import Any, Dict, List
 
 import cv2
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -92,7 +92,7 @@ class DistanceCalculation(BaseSolution):
             >>> print(f"Distance: {results.pixels_distance:.2f} pixels")
         """
         self.extract_tracks(im0)  # Extract tracks
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
 
         pixels_distance = 0
         # Iterate over bounding boxes, track ids and classes index
@@ -1,12 +1,12 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from typing import Any, List
+from typing import Any, Dict, List
 
 import cv2
 import numpy as np
 
 from ultralytics.solutions.object_counter import ObjectCounter
-from ultralytics.solutions.solutions import SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import SolutionResults
 
 
 class Heatmap(ObjectCounter):
@@ -19,11 +19,17 @@ class Heatmap(ObjectCounter):
     Attributes:
         initialized (bool): Flag indicating whether the heatmap has been initialized.
         colormap (int): OpenCV colormap used for heatmap visualization.
-        heatmap (np.ndarray): Array storing the cumulative heatmap data.
-        annotator (SolutionAnnotator): Object for drawing annotations on the image.
+        heatmap (np.ndarray): Single-channel array storing the cumulative heatmap data, at `heatmap_scale` resolution.
+        annotator (SolutionAnnotator | HeadlessAnnotator): Object for drawing annotations on the image.
+        decay (float): Factor applied to the accumulated heatmap every frame, 1.0 disables decay.
+        interval (int): Number of frames between colormap renders, the last render is reused in between.
+        scale (float): Resolution of the accumulated heatmap relative to the input frame.
+        colored_heatmap (np.ndarray | None): Last rendered colormap at full frame resolution.
 
     Methods:
         heatmap_effect: Calculate and update the heatmap effect for a given bounding box.
+        accumulate: Stamp the heatmap effect of all bounding boxes of a frame at once.
+        render: Normalize the heatmap and apply the colormap at full frame resolution.
         process: Generate and apply the heatmap effect to each frame.
 
     Examples:
@@ -49,6 +55,19 @@ class Heatmap(ObjectCounter):
         # Store colormap
         self.colormap = self.CFG["colormap"]
         self.heatmap = None
+        self.decay = self.CFG["heatmap_decay"]
+        self.interval = max(1, int(self.CFG["heatmap_interval"]))
+        self.scale = self.CFG["heatmap_scale"]
+        self.colored_heatmap = None
+        self.frame_count = 0
+        self._disc_cache: Dict[int, np.ndarray] = {}  # radius -> disc kernel
+
+    def disc_kernel(self, radius: int) -> np.ndarray:
+        """Return the cached (2 * radius + 1) square kernel holding 2 inside the disc of the given radius and 0 outside."""
+        if radius not in self._disc_cache:
+            d = np.arange(-radius, radius + 1)
+            self._disc_cache[radius] = 2 * (d[:, None] ** 2 + d[None] ** 2 <= radius**2).astype(np.float32)
+        return self._disc_cache[radius]
 
     def heatmap_effect(self, box: List[float]) -> None:
         """
@@ -57,20 +76,46 @@ class Heatmap(ObjectCounter):
         Args:
             box (List[float]): Bounding box coordinates [x0, y0, x1, y1].
         """
-        x0, y0, x1, y1 = map(int, box)
-        radius_squared = (min(x1 - x0, y1 - y0) // 2) ** 2
+        self.accumulate(np.asarray(box, dtype=np.float32).reshape(1, 4))
 
-        # Create a meshgrid with region of interest (ROI) for vectorized distance calculations
-        xv, yv = np.meshgrid(np.arange(x0, x1), np.arange(y0, y1))
+    def accumulate(self, boxes: np.ndarray) -> None:
+        """
+        Add a disc inscribed in each bounding box to the heatmap, for all bounding boxes of a frame at once.
 
-        # Calculate squared distances from the center
-        dist_squared = (xv - ((x0 + x1) // 2)) ** 2 + (yv - ((y0 + y1) // 2)) ** 2
+        Box geometry and clipping are computed for all boxes together, and each disc is added as a slice of a cached
+        kernel for its radius, so no per-box coordinate grids are built.
 
-        # Create a mask of points within the radius
-        within_radius = dist_squared <= radius_squared
+        Args:
+            boxes (np.ndarray): Bounding boxes of shape (N, 4) in [x0, y0, x1, y1] format at input frame resolution.
+        """
+        h, w = self.heatmap.shape
+        x0, y0, x1, y1 = (np.asarray(boxes, dtype=np.float32).reshape(-1, 4) * self.scale).astype(np.int64).T
+        radii = np.minimum(x1 - x0, y1 - y0) // 2
+        cx, cy = (x0 + x1) // 2, (y0 + y1) // 2
+
+        # Stamped area is the kernel extent clipped to the box and the heatmap
+        xs, ys = np.maximum(np.maximum(cx - radii, x0), 0), np.maximum(np.maximum(cy - radii, y0), 0)
+        xe, ye = np.minimum(np.minimum(cx + radii + 1, x1), w), np.minimum(np.minimum(cy + radii + 1, y1), h)
+        valid = (radii >= 0) & (xs < xe) & (ys < ye)
+        kx, ky = xs - cx + radii, ys - cy + radii  # offsets into the kernel
+        for r, xs_, ys_, xe_, ye_, kx_, ky_ in zip(*(v[valid].tolist() for v in (radii, xs, ys, xe, ye, kx, ky))):
+            self.heatmap[ys_:ye_, xs_:xe_] += self.disc_kernel(r)[ky_ : ky_ + ye_ - ys_, kx_ : kx_ + xe_ - xs_]
+
+    def render(self, shape: tuple) -> np.ndarray:
+        """
+        Normalize the heatmap, apply the colormap and resize it to the frame resolution if accumulated at lower scale.
 
-        # Update only the values within the bounding box in a single vectorized operation
-        self.heatmap[y0:y1, x0:x1][within_radius] += 2
+        Args:
+            shape (tuple): Shape of the input frame (H, W, C).
+
+        Returns:
+            (np.ndarray): Colored heatmap with the same height and width as the input frame.
+        """
+        normalized_heatmap = cv2.normalize(self.heatmap, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        colored_heatmap = cv2.applyColorMap(normalized_heatmap, self.colormap)
+        if colored_heatmap.shape[:2] != shape[:2]:
+            colored_heatmap = cv2.resize(colored_heatmap, (shape[1], shape[0]), interpolation=cv2.INTER_LINEAR)
+        return colored_heatmap
 
     def process(self, im0: np.ndarray) -> SolutionResults:
         """
@@ -87,35 +132,37 @@ class Heatmap(ObjectCounter):
                 'total_tracks' (int, total number of tracked objects).
         """
         if not self.initialized:
-            self.heatmap = np.zeros_like(im0, dtype=np.float32) * 0.99
+            h, w = im0.shape[:2]
+            self.heatmap = np.zeros((max(1, round(h * self.scale)), max(1, round(w * self.scale))), dtype=np.float32)
             self.initialized = True  # Initialize heatmap only once
 
         self.extract_tracks(im0)  # Extract tracks
-        self.annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        self.annotator = self.get_annotator(im0)  # Initialize annotator
 
-        # Iterate over bounding boxes, track ids and classes index
-        for box, track_id, cls in zip(self.boxes, self.track_ids, self.clss):
-            # Apply heatmap effect for the bounding box
-            self.heatmap_effect(box)
+        if self.decay != 1.0:
+            self.heatmap *= self.decay  # Exponential time decay of older activity
+        if len(self.boxes):
+            boxes = np.asarray(self.boxes, dtype=np.float32)
+            if boxes.ndim == 3:  # OBB corners (N, 4, 2) to enclosing xyxy
+                boxes = np.concatenate([boxes.min(1), boxes.max(1)], axis=1)
+            self.accumulate(boxes)  # Apply heatmap effect for all bounding boxes
 
-            if self.region is not None:
-                self.annotator.draw_region(reg_pts=self.region, color=(104, 0, 123), thickness=self.line_width * 2)
+        if self.region is not None:
+            self.annotator.draw_region(reg_pts=self.region, color=(104, 0, 123), thickness=self.line_width * 2)
+            for box, track_id in zip(self.boxes, self.track_ids):
                 self.store_tracking_history(track_id, box)  # Store track history
-                # Get previous position if available
-                prev_position = None
-                if len(self.track_history[track_id]) > 1:
-                    prev_position = self.track_history[track_id][-2]
-                self.count_objects(self.track_history[track_id][-1], track_id, prev_position, cls)  # object counting
+            self.update_counts()  # object counting for all tracks at once
 
         plot_im = self.annotator.result()
         if self.region is not None:
             self.display_counts(plot_im)  # Display the counts on the frame
 
-        # Normalize, apply colormap to heatmap and combine with original image
-        if self.track_data.is_track:
-            normalized_heatmap = cv2.normalize(self.heatmap, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-            colored_heatmap = cv2.applyColorMap(normalized_heatmap, self.colormap)
-            plot_im = cv2.addWeighted(plot_im, 0.5, colored_heatmap, 0.5, 0)
+        # Normalize, apply colormap to heatmap and combine with original image, re-rendering every `interval` frames
+        if self.track_data.is_track and not self.headless:
+            if self.colored_heatmap is None or self.frame_count % self.interval == 0:
+                self.colored_heatmap = self.render(plot_im.shape)
+            plot_im = cv2.addWeighted(plot_im, 0.5, self.colored_heatmap, 0.5, 0)
+        self.frame_count += 1
 
         self.display_output(plot_im)  # Display output with base class function
 
@@ -73,6 +73,8 @@ class InstanceSegmentation(BaseSolution):
         if self.masks is None:
             self.LOGGER.warning("No masks detected! Ensure you're using a supported Ultralytics segmentation model.")
             plot_im = im0
+        elif self.headless:
+            plot_im = im0
         else:
             results = Results(im0, path=None, names=self.names, boxes=self.track_data.data, masks=self.masks.data)
             plot_im = results.plot(
@@ -4,7 +4,7 @@ from typing import Any
 
 import cv2
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils import LOGGER
 from ultralytics.utils.plotting import colors
 
@@ -70,7 +70,7 @@ class ObjectBlurrer(BaseSolution):
             >>> print(f"Blurred {results.total_tracks} objects")
         """
         self.extract_tracks(im0)  # Extract tracks
-        annotator = SolutionAnnotator(im0, self.line_width)
+        annotator = self.get_annotator(im0)
 
         # Iterate over bounding boxes and classes
         for box, cls, conf in zip(self.boxes, self.clss, self.confs):
@@ -1,9 +1,12 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 from collections import defaultdict
-from typing import Any, Optional, Tuple
+from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+import numpy as np
+
+from ultralytics.solutions.crossing import CrossingCounter
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -23,9 +26,10 @@ class ObjectCounter(BaseSolution):
         show_in (bool): Flag to control display of inward count.
         show_out (bool): Flag to control display of outward count.
         margin (int): Margin for background rectangle size to display counts properly.
+        crossing (CrossingCounter | None): Vectorized counting engine for the region, created on first use.
 
     Methods:
-        count_objects: Count objects within a polygonal or linear region based on their tracks.
+        update_counts: Count all current tracks at once using the vectorized counting engine.
         display_counts: Display object counts on the frame.
         process: Process input data and update counts.
 
@@ -49,73 +53,36 @@ class ObjectCounter(BaseSolution):
         self.show_in = self.CFG["show_in"]
         self.show_out = self.CFG["show_out"]
         self.margin = self.line_width * 2  # Scales the background rectangle size to display counts properly
+        self.crossing = None  # Vectorized counting engine, created once the region is initialized
 
-    def count_objects(
-        self,
-        current_centroid: Tuple[float, float],
-        track_id: int,
-        prev_position: Optional[Tuple[float, float]],
-        cls: int,
-    ) -> None:
+    def update_counts(self) -> None:
         """
-        Count objects within a polygonal or linear region based on their tracks.
+        Count all current tracks at once using the vectorized counting engine.
 
-        Args:
-            current_centroid (Tuple[float, float]): Current centroid coordinates (x, y) in the current frame.
-            track_id (int): Unique identifier for the tracked object.
-            prev_position (Tuple[float, float], optional): Last frame position coordinates (x, y) of the track.
-            cls (int): Class index for classwise count updates.
+        A track is counted once, when the segment between its previous and current centroid crosses a line region, or
+        when its centroid is inside a polygon region. The movement segments of all tracks are tested against the region
+        in a single NumPy operation.
 
         Examples:
-            >>> counter = ObjectCounter()
-            >>> track_line = {1: [100, 200], 2: [110, 210], 3: [120, 220]}
-            >>> box = [130, 230, 150, 250]
-            >>> track_id_num = 1
-            >>> previous_position = (120, 220)
-            >>> class_to_count = 0  # In COCO model, class 0 = person
-            >>> counter.count_objects((140, 240), track_id_num, previous_position, class_to_count)
+            >>> counter = ObjectCounter(region=[(20, 400), (1260, 400)])
+            >>> counter.extract_tracks(frame)
+            >>> counter.update_counts()
         """
-        if prev_position is None or track_id in self.counted_ids:
+        if self.crossing is None:
+            self.crossing = CrossingCounter([self.region])
+        if not len(self.track_ids):
             return
-
-        if len(self.region) == 2:  # Linear region (defined as a line segment)
-            if self.r_s.intersects(self.LineString([prev_position, current_centroid])):
-                # Determine orientation of the region (vertical or horizontal)
-                if abs(self.region[0][0] - self.region[1][0]) < abs(self.region[0][1] - self.region[1][1]):
-                    # Vertical region: Compare x-coordinates to determine direction
-                    if current_centroid[0] > prev_position[0]:  # Moving right
-                        self.in_count += 1
-                        self.classwise_count[self.names[cls]]["IN"] += 1
-                    else:  # Moving left
-                        self.out_count += 1
-                        self.classwise_count[self.names[cls]]["OUT"] += 1
-                # Horizontal region: Compare y-coordinates to determine direction
-                elif current_centroid[1] > prev_position[1]:  # Moving downward
-                    self.in_count += 1
-                    self.classwise_count[self.names[cls]]["IN"] += 1
-                else:  # Moving upward
-                    self.out_count += 1
-                    self.classwise_count[self.names[cls]]["OUT"] += 1
-                self.counted_ids.append(track_id)
-
-        elif len(self.region) > 2:  # Polygonal region
-            if self.r_s.contains(self.Point(current_centroid)):
-                # Determine motion direction for vertical or horizontal polygons
-                region_width = max(p[0] for p in self.region) - min(p[0] for p in self.region)
-                region_height = max(p[1] for p in self.region) - min(p[1] for p in self.region)
-
-                if (
-                    region_width < region_height
-                    and current_centroid[0] > prev_position[0]
-                    or region_width >= region_height
-                    and current_centroid[1] > prev_position[1]
-                ):  # Moving right or downward
-                    self.in_count += 1
-                    self.classwise_count[self.names[cls]]["IN"] += 1
-                else:  # Moving left or upward
-                    self.out_count += 1
-                    self.classwise_count[self.names[cls]]["OUT"] += 1
-                self.counted_ids.append(track_id)
+        boxes = np.asarray(self.boxes, dtype=np.float32)
+        centroids = boxes.mean(1) if boxes.ndim == 3 else (boxes[:, :2] + boxes[:, 2:4]) / 2  # OBB or xyxy
+        crossed, inward = self.crossing.update(self.track_ids, centroids)
+        for i in np.nonzero(crossed[:, 0])[0]:
+            direction = "IN" if inward[i, 0] else "OUT"
+            if direction == "IN":
+                self.in_count += 1
+            else:
+                self.out_count += 1
+            self.classwise_count[self.names[self.clss[i]]][direction] += 1
+            self.counted_ids.append(self.track_ids[i])
 
     def display_counts(self, plot_im) -> None:
         """
@@ -163,7 +130,7 @@ class ObjectCounter(BaseSolution):
             self.region_initialized = True
 
         self.extract_tracks(im0)  # Extract tracks
-        self.annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        self.annotator = self.get_annotator(im0)  # Initialize annotator
 
         self.annotator.draw_region(
             reg_pts=self.region, color=(104, 0, 123), thickness=self.line_width * 2
@@ -174,12 +141,7 @@ class ObjectCounter(BaseSolution):
             # Draw bounding box and counting region
             self.annotator.box_label(box, label=self.adjust_box_label(cls, conf, track_id), color=colors(cls, True))
             self.store_tracking_history(track_id, box)  # Store track history
-
-            # Store previous position of track for object counting
-            prev_position = None
-            if len(self.track_history[track_id]) > 1:
-                prev_position = self.track_history[track_id][-2]
-            self.count_objects(self.track_history[track_id][-1], track_id, prev_position, cls)  # object counting
+        self.update_counts()  # object counting for all tracks at once
 
         plot_im = self.annotator.result()
         self.display_counts(plot_im)  # Display the counts on the frame
@@ -6,7 +6,7 @@ from typing import Any, List, Tuple
 import cv2
 import numpy as np
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils import LOGGER
 from ultralytics.utils.checks import check_imshow
 
@@ -240,7 +240,7 @@ class ParkingManagement(BaseSolution):
         """
         self.extract_tracks(im0)  # Extract tracks from im0
         es, fs = len(self.json), 0  # Empty slots, filled slots
-        annotator = SolutionAnnotator(im0, self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
 
         for region in self.json:
             # Convert points to a NumPy array with the correct dtype and reshape properly
@@ -258,7 +258,8 @@ class ParkingManagement(BaseSolution):
                     break
             fs, es = (fs + 1, es - 1) if rg_occupied else (fs, es)
             # Plot regions
-            cv2.polylines(im0, [pts_array], isClosed=True, color=self.occ if rg_occupied else self.arc, thickness=2)
+            if not self.headless:
+                cv2.polylines(im0, [pts_array], isClosed=True, color=self.occ if rg_occupied else self.arc, thickness=2)
 
         self.pr_info["Occupancy"], self.pr_info["Available"] = fs, es
 
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -63,7 +63,7 @@ class QueueManager(BaseSolution):
         """
         self.counts = 0  # Reset counts every frame
         self.extract_tracks(im0)  # Extract tracks from the current frame
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
         annotator.draw_region(reg_pts=self.region, color=self.rect_color, thickness=self.line_width * 2)  # Draw region
 
         for box, track_id, cls, conf in zip(self.boxes, self.track_ids, self.clss, self.confs):
@@ -4,7 +4,8 @@ from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.crossing import points_in_polygons
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -22,6 +23,7 @@ class RegionCounter(BaseSolution):
         counting_regions (list): List storing all defined regions, where each entry is based on `region_template`
             and includes specific region settings like name, coordinates, and color.
         region_counts (dict): Dictionary storing the count of objects for each named region.
+        region_points (List[np.ndarray]): Polygon vertices of every counting region, used for vectorized counting.
 
     Methods:
         add_region: Add a new counting region with specified attributes.
@@ -48,6 +50,7 @@ class RegionCounter(BaseSolution):
         }
         self.region_counts = {}
         self.counting_regions = []
+        self.region_points = []
         self.initialize_regions()
 
     def add_region(
@@ -79,6 +82,7 @@ class RegionCounter(BaseSolution):
             }
         )
         self.counting_regions.append(region)
+        self.region_points.append(np.asarray(polygon_points, dtype=np.float64))
         return region
 
     def initialize_regions(self):
@@ -88,8 +92,7 @@ class RegionCounter(BaseSolution):
         if not isinstance(self.region, dict):  # Ensure self.region is initialized and structured as a dictionary
             self.region = {"Region#01": self.region}
         for i, (name, pts) in enumerate(self.region.items()):
-            region = self.add_region(name, pts, colors(i, True), (255, 255, 255))
-            region["prepared_polygon"] = self.prep(region["polygon"])
+            self.add_region(name, pts, colors(i, True), (255, 255, 255))
 
     def process(self, im0: np.ndarray) -> SolutionResults:
         """
@@ -103,14 +106,18 @@ class RegionCounter(BaseSolution):
                 and 'region_counts' (dict, counts of objects per region).
         """
         self.extract_tracks(im0)
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)
+        annotator = self.get_annotator(im0)
 
         for box, cls, track_id, conf in zip(self.boxes, self.clss, self.track_ids, self.confs):
             annotator.box_label(box, label=self.adjust_box_label(cls, conf, track_id), color=colors(track_id, True))
-            center = self.Point(((box[0] + box[2]) / 2, (box[1] + box[3]) / 2))
-            for region in self.counting_regions:
-                if region["prepared_polygon"].contains(center):
-                    region["counts"] += 1
+
+        # Count box centers inside every region at once
+        if len(self.track_ids):
+            boxes = np.asarray(self.boxes, dtype=np.float64)
+            centers = boxes.mean(1) if boxes.ndim == 3 else (boxes[:, :2] + boxes[:, 2:4]) / 2  # OBB or xyxy
+            for region, count in zip(self.counting_regions, points_in_polygons(centers, self.region_points).sum(0)):
+                if count:
+                    region["counts"] = int(count)
                     self.region_counts[region["name"]] = region["counts"]
 
         # Display region counts
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils import LOGGER
 from ultralytics.utils.plotting import colors
 
@@ -137,7 +137,7 @@ class SecurityAlarm(BaseSolution):
             >>> results = alarm.process(frame)
         """
         self.extract_tracks(im0)  # Extract tracks
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
 
         # Iterate over bounding boxes and classes index
         for box, cls in zip(self.boxes, self.clss):
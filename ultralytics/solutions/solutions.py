@@ -27,7 +27,6 @@ class BaseSolution:
         LineString: Class for creating line string geometries from shapely.
         Polygon: Class for creating polygon geometries from shapely.
         Point: Class for creating point geometries from shapely.
-        prep: Prepared geometry function from shapely for optimized spatial operations.
         CFG (Dict[str, Any]): Configuration dictionary loaded from YAML file and updated with kwargs.
         LOGGER: Logger instance for solution-specific logging.
         annotator: Annotator instance for drawing on images.
@@ -51,16 +50,20 @@ class BaseSolution:
         device (str): Device for model inference.
         track_add_args (Dict[str, Any]): Additional arguments for tracking configuration.
         env_check (bool): Flag indicating whether environment supports image display.
+        headless (bool): Flag to skip all drawing and display, keeping only the solution analytics.
         track_history (defaultdict): Dictionary storing tracking history for each object.
         profilers (Tuple): Profiler instances for performance monitoring.
+        batch_tracking (bool): Whether process_batch may precompute tracks for all frames with one tracking call.
 
     Methods:
         adjust_box_label: Generate formatted label for bounding box.
+        get_annotator: Create the annotator used to draw on a frame, or a no-op one in headless mode.
         extract_tracks: Apply object tracking and extract tracks from input image.
         store_tracking_history: Store object tracking history for given track ID and bounding box.
         initialize_region: Initialize counting region and line segment based on configuration.
         display_output: Display processing results including frames or saved results.
         process: Process method to be implemented by each Solution subclass.
+        process_batch: Process consecutive frames of a stream with a single batched tracking call.
 
     Examples:
         >>> solution = BaseSolution(model="yolo11n.pt", region=[(0, 0), (100, 0), (100, 100), (0, 100)])
@@ -70,6 +73,8 @@ class BaseSolution:
         >>> solution.display_output(image)
     """
 
+    batch_tracking = True  # False for solutions that do not track the raw input frame via extract_tracks
+
     def __init__(self, is_cli: bool = False, **kwargs: Any) -> None:
         """
         Initialize the BaseSolution class with configuration settings and YOLO model.
@@ -83,12 +88,10 @@ class BaseSolution:
 
         check_requirements("shapely>=2.0.0")
         from shapely.geometry import LineString, Point, Polygon
-        from shapely.prepared import prep
 
         self.LineString = LineString
         self.Polygon = Polygon
         self.Point = Point
-        self.prep = prep
         self.annotator = None  # Initialize annotator
         self.tracks = None
         self.track_data = None
@@ -99,10 +102,12 @@ class BaseSolution:
         self.masks = None
         self.r_s = None
         self.frame_no = -1  # Only for logging
+        self.batch_tracks = []  # Tracking results precomputed by process_batch, consumed by extract_tracks
 
         self.LOGGER.info(f"Ultralytics Solutions: ✅ {self.CFG}")
         self.region = self.CFG["region"]  # Store region data for other classes usage
         self.line_width = self.CFG["line_width"]
+        self.headless = self.CFG["headless"]
 
         # Load Model and store additional information (classes, show_conf, show_label)
         if self.CFG["model"] is None:
@@ -127,7 +132,7 @@ class BaseSolution:
             self.CFG["source"] = d_s  # set default source
 
         # Initialize environment and region setup
-        self.env_check = check_imshow(warn=True)
+        self.env_check = not self.headless and check_imshow(warn=True)
         self.track_history = defaultdict(list)
 
         self.profilers = (
@@ -154,10 +159,24 @@ class BaseSolution:
         name = ("" if track_id is None else f"{track_id} ") + self.names[cls]
         return (f"{name} {conf:.2f}" if self.show_conf else name) if self.show_labels else None
 
+    def get_annotator(self, im0: np.ndarray):
+        """
+        Create the annotator used to draw on a frame, or a no-op annotator when running in headless mode.
+
+        Args:
+            im0 (np.ndarray): The input image or frame to annotate.
+
+        Returns:
+            (SolutionAnnotator | HeadlessAnnotator): Annotator drawing on `im0`, or one that leaves it untouched.
+        """
+        return HeadlessAnnotator(im0) if self.headless else SolutionAnnotator(im0, line_width=self.line_width)
+
     def extract_tracks(self, im0: np.ndarray) -> None:
         """
         Apply object tracking and extract tracks from an input image or frame.
 
+        Tracking results precomputed by `process_batch` are used in order instead of running the model again.
+
         Args:
             im0 (np.ndarray): The input image or frame.
 
@@ -167,9 +186,12 @@ class BaseSolution:
             >>> solution.extract_tracks(frame)
         """
         with self.profilers[0]:
-            self.tracks = self.model.track(
-                source=im0, persist=True, classes=self.classes, verbose=False, **self.track_add_args
-            )[0]
+            if self.batch_tracks:
+                self.tracks = self.batch_tracks.pop(0)
+            else:
+                self.tracks = self.model.track(
+                    source=im0, persist=True, classes=self.classes, verbose=False, **self.track_add_args
+                )[0]
         is_obb = self.tracks.obb is not None
         self.track_data = self.tracks.obb if is_obb else self.tracks.boxes  # Extract tracks for OBB or object detection
 
@@ -231,7 +253,7 @@ class BaseSolution:
               supports image display.
             - The display can be closed by pressing the 'q' key.
         """
-        if self.CFG.get("show") and self.env_check:
+        if self.CFG.get("show") and self.env_check and not self.headless:
             cv2.imshow("Ultralytics Solutions", plot_im)
             if cv2.waitKey(1) & 0xFF == ord("q"):
                 cv2.destroyAllWindows()  # Closes current frame window
@@ -240,6 +262,45 @@ class BaseSolution:
     def process(self, *args: Any, **kwargs: Any):
         """Process method should be implemented by each Solution subclass."""
 
+    def process_batch(self, frames: List[np.ndarray]) -> List["SolutionResults"]:
+        """
+        Process consecutive frames of one stream, running a single batched tracking call for all of them.
+
+        The tracker still updates frame by frame in order, so results match calling the solution on each frame, while
+        the model runs once per batch. Solutions that run their own inference (ObjectCropper) or track a modified frame
+        (TrackZone) process the frames one by one instead. Use one solution instance per stream, as counts and track
+        history are stored per instance. Combine with `headless=True` to skip drawing when only the analytics are needed.
+
+        Args:
+            frames (List[np.ndarray]): Consecutive frames of the same stream, all with the same shape.
+
+        Returns:
+            (List[SolutionResults]): Results for each frame, in order.
+
+        Examples:
+            >>> counter = ObjectCounter(region=[(20, 400), (1080, 400)], headless=True)
+            >>> results = counter.process_batch([frame1, frame2, frame3, frame4])
+            >>> print(results[-1].in_count)
+        """
+        if not len(frames):
+            return []
+        if not self.batch_tracking:
+            return [self(im0) for im0 in frames]  # solution runs its own per-frame inference
+        with self.profilers[0]:
+            self.batch_tracks = self.model.track(
+                source=list(frames), persist=True, classes=self.classes, verbose=False, **self.track_add_args
+            )
+        track_speed = self.profilers[0].dt * 1e3 / len(frames)  # batched tracking time per frame
+        results = []
+        try:
+            for im0 in frames:
+                result = self(im0)
+                result.speed["track"] = track_speed
+                results.append(result)
+        finally:
+            self.batch_tracks = []  # never leak stale tracks into later process() calls
+        return results
+
     def __call__(self, *args: Any, **kwargs: Any):
         """Allow instances to be called like a function with flexible arguments."""
         with self.profilers[1]:
@@ -754,6 +815,52 @@ class SolutionAnnotator(Annotator):
         )
 
 
+class HeadlessAnnotator:
+    """
+    A no-op stand-in for SolutionAnnotator used by solutions running in headless mode.
+
+    All drawing methods do nothing and `result` returns the input image unchanged without copying it, so solutions run
+    their analytics without any rendering cost. Helpers that compute values rather than draw, such as
+    `estimate_pose_angle`, behave exactly as in SolutionAnnotator.
+
+    Attributes:
+        im (np.ndarray): The input image, returned as is by `result`.
+
+    Methods:
+        result: Return the input image.
+        estimate_pose_angle: Calculate the angle between three points in an object pose.
+
+    Examples:
+        >>> annotator = HeadlessAnnotator(image)
+        >>> annotator.box_label([10, 10, 50, 50], label="person")  # does nothing
+        >>> annotator.result() is image
+        True
+    """
+
+    estimate_pose_angle = staticmethod(SolutionAnnotator.estimate_pose_angle)
+
+    def __init__(self, im: np.ndarray, *args: Any, **kwargs: Any):
+        """
+        Initialize the HeadlessAnnotator with the image it would otherwise annotate.
+
+        Args:
+            im (np.ndarray): The input image.
+            *args (Any): Ignored, accepted for compatibility with SolutionAnnotator.
+            **kwargs (Any): Ignored, accepted for compatibility with SolutionAnnotator.
+        """
+        self.im = im
+
+    def __getattr__(self, name: str):
+        """Return a no-op callable for any drawing method of SolutionAnnotator."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+    def result(self) -> np.ndarray:
+        """Return the input image without any annotations."""
+        return self.im
+
+
 class SolutionResults:
     """
     A class to encapsulate the results of Ultralytics Solutions.
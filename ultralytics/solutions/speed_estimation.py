@@ -4,7 +4,7 @@ from collections import deque
 from math import sqrt
 from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -78,7 +78,7 @@ class SpeedEstimator(BaseSolution):
         """
         self.frame_count += 1
         self.extract_tracks(im0)
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)
+        annotator = self.get_annotator(im0)
 
         for box, track_id, _, _ in zip(self.boxes, self.track_ids, self.clss, self.confs):
             self.store_tracking_history(track_id, box)
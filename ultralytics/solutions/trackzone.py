@@ -5,7 +5,7 @@ from typing import Any
 import cv2
 import numpy as np
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -36,6 +36,8 @@ class TrackZone(BaseSolution):
         >>> cv2.imshow("Tracked Frame", results.plot_im)
     """
 
+    batch_tracking = False  # tracks the region-masked frame, not the raw input frame
+
     def __init__(self, **kwargs: Any) -> None:
         """
         Initialize the TrackZone class for tracking objects within a defined region in video streams.
@@ -67,7 +69,7 @@ class TrackZone(BaseSolution):
             >>> frame = cv2.imread("path/to/image.jpg")
             >>> results = tracker.process(frame)
         """
-        annotator = SolutionAnnotator(im0, line_width=self.line_width)  # Initialize annotator
+        annotator = self.get_annotator(im0)  # Initialize annotator
 
         if self.mask is None:  # Create a mask for the region
             self.mask = np.zeros_like(im0[:, :, 0])
@@ -76,7 +78,8 @@ class TrackZone(BaseSolution):
         self.extract_tracks(masked_frame)
 
         # Draw the region boundary
-        cv2.polylines(im0, [self.region], isClosed=True, color=(255, 255, 255), thickness=self.line_width * 2)
+        if not self.headless:
+            cv2.polylines(im0, [self.region], isClosed=True, color=(255, 255, 255), thickness=self.line_width * 2)
 
         # Iterate over boxes, track ids, classes indexes list and draw bounding boxes
         for box, track_id, cls, conf in zip(self.boxes, self.track_ids, self.clss, self.confs):
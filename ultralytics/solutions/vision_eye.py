@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ultralytics.solutions.solutions import BaseSolution, SolutionAnnotator, SolutionResults
+from ultralytics.solutions.solutions import BaseSolution, SolutionResults
 from ultralytics.utils.plotting import colors
 
 
@@ -56,7 +56,7 @@ class VisionEye(BaseSolution):
             >>> print(f"Detected {results.total_tracks} objects")
         """
         self.extract_tracks(im0)  # Extract tracks (bounding boxes, classes, and masks)
-        annotator = SolutionAnnotator(im0, self.line_width)
+        annotator = self.get_annotator(im0)
 
         for cls, t_id, box, conf in zip(self.clss, self.track_ids, self.boxes, self.confs):
             # Annotate the image with bounding boxes, labels, and vision mapping
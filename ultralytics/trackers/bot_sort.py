@@ -1,7 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 from collections import deque
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import torch
@@ -168,6 +168,8 @@ class BOTSORT(BYTETracker):
         get_dists: Get distances between tracks and detections using IoU and (optionally) ReID.
         multi_predict: Predict and track multiple objects with a YOLO model.
         reset: Reset the BOTSORT tracker to its initial state.
+        state_dict: Return a compact snapshot of the tracker state including ReID features and the GMC reference frame.
+        load_state_dict: Restore the tracker state from a snapshot.
 
     Examples:
         Initialize BOTSORT and process detections
@@ -224,7 +226,7 @@ class BOTSORT(BYTETracker):
 
     def get_dists(self, tracks: List[BOTrack], detections: List[BOTrack]) -> np.ndarray:
         """Calculate distances between tracks and detections using IoU and optionally ReID embeddings."""
-        dists = matching.iou_distance(tracks, detections)
+        dists = self.iou_distance(tracks, detections)
         dists_mask = dists > (1 - self.proximity_thresh)
 
         if self.args.fuse_score:
@@ -246,6 +248,33 @@ class BOTSORT(BYTETracker):
         super().reset()
         self.gmc.reset_params()
 
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Return a compact snapshot of the tracker state, including ReID features and the GMC reference frame."""
+        state = super().state_dict()
+        state.update({f"gmc/{k}": v for k, v in self.gmc.state_dict().items()})
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+        """Restore the tracker state, ReID features and GMC reference frame from a snapshot."""
+        super().load_state_dict(state)
+        self.gmc.load_state_dict({k[4:]: v for k, v in state.items() if k.startswith("gmc/")})
+
+    def pack_tracks(self, tracks: List[BOTrack]) -> Dict[str, np.ndarray]:
+        """Pack a list of tracks into column arrays, adding smoothed and current ReID features when present."""
+        columns = super().pack_tracks(tracks)
+        if tracks and all(t.smooth_feat is not None for t in tracks):
+            columns["smooth_feat"] = np.asarray([t.smooth_feat for t in tracks], dtype=np.float32)
+            columns["curr_feat"] = np.asarray([t.curr_feat for t in tracks], dtype=np.float32)
+        return columns
+
+    def unpack_tracks(self, columns: Dict[str, np.ndarray], track_cls: type = BOTrack) -> List[BOTrack]:
+        """Rebuild a list of activated tracks, restoring smoothed and current ReID features when present."""
+        tracks = super().unpack_tracks(columns, track_cls)
+        if "smooth_feat" in columns:
+            for track, smooth_feat, curr_feat in zip(tracks, columns["smooth_feat"], columns["curr_feat"]):
+                track.smooth_feat, track.curr_feat = smooth_feat.copy(), curr_feat.copy()
+        return tracks
+
 
 class ReID:
     """YOLO model as encoder for re-identification."""
@@ -1,6 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from typing import Any, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -251,15 +252,21 @@ class BYTETracker:
         args (Namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
         kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+        gating (bool): Whether to compute IoU only for overlapping pairs and solve independent assignment subproblems.
 
     Methods:
         update: Update object tracker with new detections.
         get_kalmanfilter: Return a Kalman filter object for tracking bounding boxes.
         init_track: Initialize object tracking with detections.
         get_dists: Calculate the distance between tracks and detections.
+        assign: Solve the linear assignment between tracks and detections.
         multi_predict: Predict the location of tracks.
         reset_id: Reset the ID counter of STrack.
         reset: Reset the tracker by clearing all tracks.
+        state_dict: Return a compact snapshot of the tracker state.
+        load_state_dict: Restore the tracker state from a snapshot.
+        save_state: Save a snapshot of the tracker state to a file.
+        load_state: Load a snapshot of the tracker state from a file.
         joint_stracks: Combine two lists of stracks.
         sub_stracks: Filter out the stracks present in the second list from the first list.
         remove_duplicate_stracks: Remove duplicate stracks based on IoU.
@@ -292,6 +299,7 @@ class BYTETracker:
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
         self.kalman_filter = self.get_kalmanfilter()
+        self.gating = getattr(args, "gating", False)  # optional key, absent from older custom tracker YAMLs
         self.reset_id()
 
     def update(self, results, img: Optional[np.ndarray] = None, feats: Optional[np.ndarray] = None) -> np.ndarray:
@@ -338,7 +346,7 @@ class BYTETracker:
             STrack.multi_gmc(unconfirmed, warp)
 
         dists = self.get_dists(strack_pool, detections)
-        matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
+        matches, u_track, u_detection = self.assign(dists, thresh=self.args.match_thresh)
 
         for itracked, idet in matches:
             track = strack_pool[itracked]
@@ -353,8 +361,8 @@ class BYTETracker:
         detections_second = self.init_track(results_second, feats_second)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO
-        dists = matching.iou_distance(r_tracked_stracks, detections_second)
-        matches, u_track, u_detection_second = matching.linear_assignment(dists, thresh=0.5)
+        dists = self.iou_distance(r_tracked_stracks, detections_second)
+        matches, u_track, u_detection_second = self.assign(dists, thresh=0.5)
         for itracked, idet in matches:
             track = r_tracked_stracks[itracked]
             det = detections_second[idet]
@@ -373,7 +381,7 @@ class BYTETracker:
         # Deal with unconfirmed tracks, usually tracks with only one beginning frame
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
-        matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
+        matches, u_unconfirmed, u_detection = self.assign(dists, thresh=0.7)
         for itracked, idet in matches:
             unconfirmed[itracked].update(detections[idet], self.frame_id)
             activated_stracks.append(unconfirmed[itracked])
@@ -421,11 +429,19 @@ class BYTETracker:
 
     def get_dists(self, tracks: List[STrack], detections: List[STrack]) -> np.ndarray:
         """Calculate the distance between tracks and detections using IoU and optionally fuse scores."""
-        dists = matching.iou_distance(tracks, detections)
+        dists = self.iou_distance(tracks, detections)
         if self.args.fuse_score:
             dists = matching.fuse_score(dists, detections)
         return dists
 
+    def iou_distance(self, tracks: List[STrack], detections: List[STrack]) -> np.ndarray:
+        """Calculate the IoU distance between tracks and detections, only for overlapping pairs if gating is enabled."""
+        return (matching.gated_iou_distance if self.gating else matching.iou_distance)(tracks, detections)
+
+    def assign(self, dists: np.ndarray, thresh: float):
+        """Solve the linear assignment, split into independent connected components if gating is enabled."""
+        return (matching.sparse_linear_assignment if self.gating else matching.linear_assignment)(dists, thresh=thresh)
+
     def multi_predict(self, tracks: List[STrack]):
         """Predict the next states for multiple tracks using Kalman filter."""
         STrack.multi_predict(tracks)
@@ -444,6 +460,93 @@ class BYTETracker:
         self.kalman_filter = self.get_kalmanfilter()
         self.reset_id()
 
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Return a compact snapshot of the tracker state as a flat dictionary of NumPy arrays.
+
+        Each track list is stored column-wise (Kalman mean and covariance, box, IDs, scores, classes, frame counters)
+        together with the frame counter and the global track ID counter, so snapshots are cheap to take every frame.
+
+        Returns:
+            (Dict[str, np.ndarray]): Tracker state with keys such as 'frame_id', 'count' and 'tracked/mean'.
+
+        Examples:
+            >>> state = tracker.state_dict()
+            >>> new_tracker = BYTETracker(args, frame_rate=30)
+            >>> new_tracker.load_state_dict(state)
+        """
+        state = {"frame_id": np.array(self.frame_id), "count": np.array(BaseTrack._count)}
+        for name in ("tracked", "lost", "removed"):
+            tracks = getattr(self, f"{name}_stracks")
+            state.update({f"{name}/{k}": v for k, v in self.pack_tracks(tracks).items()})
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Restore the tracker state from a snapshot produced by `state_dict`, continuing with the same track IDs.
+
+        Args:
+            state (Dict[str, np.ndarray]): Tracker state as returned by `state_dict`.
+
+        Examples:
+            >>> tracker.load_state_dict(np.load("tracker.npz"))
+        """
+        self.reset()
+        self.frame_id = int(state["frame_id"])
+        BaseTrack._count = int(state["count"])
+        for name in ("tracked", "lost", "removed"):
+            prefix = f"{name}/"
+            tracks = self.unpack_tracks({k[len(prefix) :]: v for k, v in state.items() if k.startswith(prefix)})
+            setattr(self, f"{name}_stracks", tracks)
+
+    def save_state(self, file: Union[str, Path]) -> None:
+        """Save a snapshot of the tracker state to an uncompressed `.npz` file."""
+        np.savez(file, **self.state_dict())
+
+    def load_state(self, file: Union[str, Path]) -> None:
+        """Load a snapshot of the tracker state from a `.npz` file written by `save_state`."""
+        with np.load(file) as state:
+            self.load_state_dict(dict(state))
+
+    def pack_tracks(self, tracks: List[STrack]) -> Dict[str, np.ndarray]:
+        """Pack a list of tracks into a dictionary of column arrays, storing missing angles as NaN."""
+        return {
+            "mean": np.asarray([t.mean for t in tracks], dtype=np.float64).reshape(len(tracks), -1),
+            "covariance": np.asarray([t.covariance for t in tracks], dtype=np.float64).reshape(len(tracks), -1),
+            "tlwh": np.asarray([t._tlwh for t in tracks], dtype=np.float32).reshape(-1, 4),
+            "track_id": np.asarray([t.track_id for t in tracks], dtype=np.int64),
+            "state": np.asarray([t.state for t in tracks], dtype=np.int8),
+            "is_activated": np.asarray([t.is_activated for t in tracks], dtype=bool),
+            "score": np.asarray([t.score for t in tracks], dtype=np.float32),
+            "cls": np.asarray([t.cls for t in tracks], dtype=np.float32),
+            "idx": np.asarray([t.idx for t in tracks], dtype=np.float32),
+            "angle": np.asarray([np.nan if t.angle is None else t.angle for t in tracks], dtype=np.float32),
+            "tracklet_len": np.asarray([t.tracklet_len for t in tracks], dtype=np.int64),
+            "start_frame": np.asarray([t.start_frame for t in tracks], dtype=np.int64),
+            "frame": np.asarray([t.frame_id for t in tracks], dtype=np.int64),
+        }
+
+    def unpack_tracks(self, columns: Dict[str, np.ndarray], track_cls: type = STrack) -> List[STrack]:
+        """Rebuild a list of activated tracks from the column arrays produced by `pack_tracks`."""
+        tracks = []
+        for i in range(len(columns["track_id"])):
+            tlwh, angle = columns["tlwh"][i], columns["angle"][i]
+            extra = [columns["idx"][i]] if np.isnan(angle) else [angle, columns["idx"][i]]
+            xywh = np.concatenate([tlwh[:2] + tlwh[2:] / 2, tlwh[2:], extra])
+            track = track_cls(xywh, columns["score"][i], columns["cls"][i])
+            track._tlwh = tlwh.copy()
+            track.kalman_filter = self.kalman_filter
+            track.mean = columns["mean"][i].copy()
+            track.covariance = columns["covariance"][i].reshape(len(track.mean), -1).copy()
+            track.track_id = int(columns["track_id"][i])
+            track.state = int(columns["state"][i])
+            track.is_activated = bool(columns["is_activated"][i])
+            track.tracklet_len = int(columns["tracklet_len"][i])
+            track.start_frame = int(columns["start_frame"][i])
+            track.frame_id = int(columns["frame"][i])
+            tracks.append(track)
+        return tracks
+
     @staticmethod
     def joint_stracks(tlista: List[STrack], tlistb: List[STrack]) -> List[STrack]:
         """Combine two lists of STrack objects into a single list, ensuring no duplicates based on track IDs."""
@@ -1,7 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import copy
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import cv2
 import numpy as np
@@ -30,6 +30,8 @@ class GMC:
         apply_features: Apply feature-based methods like ORB or SIFT to a raw frame.
         apply_sparseoptflow: Apply the Sparse Optical Flow method to a raw frame.
         reset_params: Reset the internal parameters of the GMC object.
+        state_dict: Return the reference frame state for snapshotting.
+        load_state_dict: Restore the reference frame state from a snapshot.
 
     Examples:
         Create a GMC object and apply it to a frame
@@ -347,3 +349,50 @@ class GMC:
         self.prevKeyPoints = None
         self.prevDescriptors = None
         self.initializedFirstFrame = False
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Return the reference frame state as a dictionary of NumPy arrays, omitting entries that are not set.
+
+        ORB and SIFT keypoints are stored as rows of (x, y, size, angle, response, octave, class_id).
+
+        Returns:
+            (Dict[str, np.ndarray]): Reference frame, keypoints, descriptors and initialization flag.
+
+        Examples:
+            >>> gmc = GMC(method="sparseOptFlow")
+            >>> state = gmc.state_dict()
+        """
+        keypoints = self.prevKeyPoints
+        if keypoints is not None and self.method in {"orb", "sift"}:
+            keypoints = np.array(
+                [[*k.pt, k.size, k.angle, k.response, k.octave, k.class_id] for k in keypoints], dtype=np.float32
+            ).reshape(-1, 7)
+        state = {"initialized": np.array(self.initializedFirstFrame)}
+        for k, v in {"frame": self.prevFrame, "keypoints": keypoints, "descriptors": self.prevDescriptors}.items():
+            if v is not None:
+                state[k] = np.asarray(v)
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Restore the reference frame state produced by `state_dict`.
+
+        Args:
+            state (Dict[str, np.ndarray]): Reference frame state as returned by `state_dict`.
+
+        Examples:
+            >>> gmc = GMC(method="sparseOptFlow")
+            >>> gmc.load_state_dict(other_gmc.state_dict())
+        """
+        self.reset_params()
+        self.initializedFirstFrame = bool(state["initialized"])
+        self.prevFrame = state.get("frame")
+        self.prevDescriptors = state.get("descriptors")
+        keypoints = state.get("keypoints")
+        if keypoints is not None and self.method in {"orb", "sift"}:
+            keypoints = tuple(
+                cv2.KeyPoint(x, y, size, angle, response, int(octave), int(class_id))
+                for x, y, size, angle, response, octave, class_id in keypoints.tolist()
+            )
+        self.prevKeyPoints = keypoints
@@ -1,7 +1,10 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from typing import Tuple
+
 import numpy as np
 import scipy
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
@@ -61,6 +64,67 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
+def sparse_linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True):
+    """
+    Perform linear assignment by splitting the problem into independent connected components.
+
+    Only pairs with a cost below `thresh` can ever be matched, so rows and columns not linked through such pairs form
+    independent subproblems. Each component is solved separately with `linear_assignment`, and 1x1 components are
+    matched directly. For the cost-limited `lap.lapjv` formulation the result is identical to solving the full matrix,
+    while crowded scenes with thousands of objects only ever solve many small assignments.
+
+    Args:
+        cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        thresh (float): Threshold for considering an assignment valid.
+        use_lap (bool): Use lap.lapjv for each component. If False, scipy.optimize.linear_sum_assignment is used.
+
+    Returns:
+        matched_indices (np.ndarray): Array of matched indices of shape (K, 2), where K is the number of matches.
+        unmatched_a (np.ndarray): Array of unmatched indices from the first set, with shape (L,).
+        unmatched_b (np.ndarray): Array of unmatched indices from the second set, with shape (M,).
+
+    Examples:
+        >>> cost_matrix = np.array([[0.1, 1.0, 1.0], [1.0, 0.2, 0.3], [1.0, 0.4, 1.0]])
+        >>> matched_indices, unmatched_a, unmatched_b = sparse_linear_assignment(cost_matrix, thresh=0.8)
+    """
+    if cost_matrix.size == 0:
+        return linear_assignment(cost_matrix, thresh, use_lap)
+
+    n, m = cost_matrix.shape
+    rows, cols = np.nonzero(cost_matrix <= thresh)
+    graph = scipy.sparse.coo_matrix((np.ones(len(rows)), (rows, cols + n)), shape=(n + m, n + m))
+    num, labels = connected_components(graph, directed=False)
+
+    # Group row and column indices by component label
+    row_groups = np.split(np.argsort(labels[:n], kind="stable"), np.cumsum(np.bincount(labels[:n], minlength=num))[:-1])
+    col_groups = np.split(np.argsort(labels[n:], kind="stable"), np.cumsum(np.bincount(labels[n:], minlength=num))[:-1])
+
+    matches = []
+    for ra, cb in zip(row_groups, col_groups):
+        if len(ra) == 0 or len(cb) == 0:  # isolated row or column
+            continue
+        if len(ra) == 1 and len(cb) == 1:  # single valid pair, no assignment required
+            matches.append((ra[0], cb[0]))
+            continue
+        sub_matches, _, _ = linear_assignment(cost_matrix[np.ix_(ra, cb)], thresh, use_lap)
+        matches.extend((ra[i], cb[j]) for i, j in sub_matches)
+
+    matches = np.asarray(matches, dtype=int).reshape(-1, 2)
+    matches = matches[np.argsort(matches[:, 0], kind="stable")]  # row order, as returned by linear_assignment
+    unmatched_a = np.setdiff1d(np.arange(n), matches[:, 0])
+    unmatched_b = np.setdiff1d(np.arange(m), matches[:, 1])
+    return matches, unmatched_a, unmatched_b
+
+
+def _track_boxes(atracks: list, btracks: list) -> Tuple[list, list]:
+    """Return the boxes of two lists of tracks, passing through lists that already contain np.ndarray boxes."""
+    if atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
+        return atracks, btracks
+    atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
+    btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
+    return atlbrs, btlbrs
+
+
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     """
     Compute cost based on Intersection over Union (IoU) between tracks.
@@ -78,13 +142,7 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
         >>> btracks = [np.array([5, 5, 15, 15]), np.array([25, 25, 35, 35])]
         >>> cost_matrix = iou_distance(atracks, btracks)
     """
-    if atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
-        atlbrs = atracks
-        btlbrs = btracks
-    else:
-        atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
-        btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
-
+    atlbrs, btlbrs = _track_boxes(atracks, btracks)
     ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
     if len(atlbrs) and len(btlbrs):
         if len(atlbrs[0]) == 5 and len(btlbrs[0]) == 5:
@@ -101,6 +159,83 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     return 1 - ious  # cost matrix
 
 
+def overlap_pairs(boxes1: np.ndarray, boxes2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all pairs of overlapping axis-aligned boxes using a sort-and-sweep along the x axis.
+
+    Boxes in `boxes2` are sorted by their left edge, so only candidates whose left edge lies within
+    (x1 - max_width, x2) of a box in `boxes1` are tested, avoiding the full N x M comparison.
+
+    Args:
+        boxes1 (np.ndarray): Boxes of shape (N, 4) in x1y1x2y2 format.
+        boxes2 (np.ndarray): Boxes of shape (M, 4) in x1y1x2y2 format.
+
+    Returns:
+        idx1 (np.ndarray): Indices into `boxes1` of the overlapping pairs, with shape (K,).
+        idx2 (np.ndarray): Indices into `boxes2` of the overlapping pairs, with shape (K,).
+
+    Examples:
+        >>> boxes1 = np.array([[0, 0, 10, 10], [100, 100, 110, 110]])
+        >>> boxes2 = np.array([[5, 5, 15, 15]])
+        >>> idx1, idx2 = overlap_pairs(boxes1, boxes2)  # (array([0]), array([0]))
+    """
+    if len(boxes1) == 0 or len(boxes2) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    order = np.argsort(boxes2[:, 0], kind="stable")
+    x1_sorted = boxes2[order, 0]
+    max_w = (boxes2[:, 2] - boxes2[:, 0]).max()
+    lo = np.searchsorted(x1_sorted, boxes1[:, 0] - max_w, side="right")
+    hi = np.searchsorted(x1_sorted, boxes1[:, 2], side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    # Expand the candidate ranges into flat index pairs
+    idx1 = np.repeat(np.arange(len(boxes1)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    idx2 = order[np.repeat(lo, counts) + offsets]
+    b1, b2 = boxes1[idx1], boxes2[idx2]
+    keep = (b2[:, 2] > b1[:, 0]) & (b2[:, 0] < b1[:, 2]) & (b2[:, 3] > b1[:, 1]) & (b2[:, 1] < b1[:, 3])
+    return idx1[keep], idx2[keep]
+
+
+def gated_iou_distance(atracks: list, btracks: list, eps: float = 1e-7) -> np.ndarray:
+    """
+    Compute the IoU cost between tracks only for spatially overlapping pairs.
+
+    Produces the same cost matrix as `iou_distance`, but IoU is evaluated only for the pairs returned by `overlap_pairs`
+    while all other entries keep the maximum cost of 1. Oriented boxes fall back to `iou_distance`.
+
+    Args:
+        atracks (List[STrack] | List[np.ndarray]): List of tracks 'a' or bounding boxes.
+        btracks (List[STrack] | List[np.ndarray]): List of tracks 'b' or bounding boxes.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        (np.ndarray): Cost matrix computed based on IoU with shape (len(atracks), len(btracks)).
+
+    Examples:
+        >>> atracks = [np.array([0, 0, 10, 10]), np.array([20, 20, 30, 30])]
+        >>> btracks = [np.array([5, 5, 15, 15]), np.array([25, 25, 35, 35])]
+        >>> cost_matrix = gated_iou_distance(atracks, btracks)
+    """
+    atlbrs, btlbrs = _track_boxes(atracks, btracks)
+    if len(atlbrs) and len(btlbrs) and len(atlbrs[0]) == 5 and len(btlbrs[0]) == 5:
+        return iou_distance(atlbrs, btlbrs)
+
+    cost = np.ones((len(atlbrs), len(btlbrs)), dtype=np.float32)
+    if cost.size:
+        b1 = np.ascontiguousarray(atlbrs, dtype=np.float32)
+        b2 = np.ascontiguousarray(btlbrs, dtype=np.float32)
+        i, j = overlap_pairs(b1, b2)
+        p1, p2 = b1[i], b2[j]
+        inter = (np.minimum(p1[:, 2], p2[:, 2]) - np.maximum(p1[:, 0], p2[:, 0])).clip(0) * (
+            np.minimum(p1[:, 3], p2[:, 3]) - np.maximum(p1[:, 1], p2[:, 1])
+        ).clip(0)
+        area1 = (p1[:, 2] - p1[:, 0]) * (p1[:, 3] - p1[:, 1])
+        area2 = (p2[:, 2] - p2[:, 0]) * (p2[:, 3] - p2[:, 1])
+        cost[i, j] = 1 - inter / (area1 + area2 - inter + eps)
+    return cost
+
+
 def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -> np.ndarray:
     """
     Compute distance between tracks and detections based on embeddings.
@@ -0,0 +1,140 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+from ultralytics.utils import LOGGER
+
+
+def parse_cpus(cpus: Union[str, int, Sequence[int]]) -> List[int]:
+    """
+    Parse a CPU core specification into a sorted list of core indices.
+
+    Args:
+        cpus (str | int | Sequence[int]): Cores as a Linux cpulist string like '0-3,8-11', a single index, or a list.
+
+    Returns:
+        (List[int]): Sorted unique core indices.
+
+    Examples:
+        >>> parse_cpus("0-3,8")
+        [0, 1, 2, 3, 8]
+        >>> parse_cpus([3, 1])
+        [1, 3]
+    """
+    if isinstance(cpus, int):
+        return [cpus]
+    if isinstance(cpus, str):
+        cores = set()
+        for part in cpus.replace(" ", "").strip("[]()").split(","):
+            if "-" in part:
+                start, end = part.split("-")
+                cores.update(range(int(start), int(end) + 1))
+            elif part:
+                cores.add(int(part))
+        return sorted(cores)
+    return sorted({int(c) for c in cpus})
+
+
+def cpu_count() -> int:
+    """Return the number of CPU cores available to this process, honoring its affinity mask where supported."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def numa_nodes() -> List[List[int]]:
+    """
+    Return the CPU cores of each NUMA node of the machine.
+
+    Nodes are read from sysfs on Linux. On other platforms, or when sysfs is unavailable, all cores are reported as a
+    single node.
+
+    Returns:
+        (List[List[int]]): Core indices for each NUMA node with at least one core.
+
+    Examples:
+        >>> nodes = numa_nodes()  # e.g. [[0, 1, ..., 31], [32, 33, ..., 63]] on a dual-socket host
+    """
+    nodes = []
+    node_dir = Path("/sys/devices/system/node")
+    for f in sorted(node_dir.glob("node[0-9]*/cpulist"), key=lambda x: int(x.parent.name[4:])):
+        try:
+            cores = parse_cpus(f.read_text().strip())
+        except (OSError, ValueError):
+            continue
+        if cores:
+            nodes.append(cores)
+    return nodes or [list(range(os.cpu_count() or 1))]
+
+
+def numa_layout(workers: int, nodes: Optional[List[List[int]]] = None) -> List[List[int]]:
+    """
+    Lay out worker processes across NUMA nodes, assigning each a disjoint set of cores within a single node.
+
+    Workers are spread evenly over the nodes, and each node's cores are split evenly between the workers placed on it,
+    so no worker spans two sockets. When there are more workers than cores on a node, workers share cores.
+
+    Args:
+        workers (int): Number of worker processes to place.
+        nodes (List[List[int]], optional): Cores of each NUMA node, defaults to the nodes of this machine.
+
+    Returns:
+        (List[List[int]]): Cores assigned to each worker, to pass as `cpus` to that worker's predictor.
+
+    Examples:
+        >>> numa_layout(4, nodes=[list(range(0, 8)), list(range(8, 16))])
+        [[0, 1, 2, 3], [8, 9, 10, 11], [4, 5, 6, 7], [12, 13, 14, 15]]
+    """
+    nodes = nodes or numa_nodes()
+    per_node = [workers // len(nodes) + (i < workers % len(nodes)) for i in range(len(nodes))]
+    assignments = []
+    for cores, n in zip(nodes, per_node):
+        size = len(cores) / n if n else 0
+        assignments.append(
+            [cores[int(j * size) : max(int((j + 1) * size), int(j * size) + 1)] or cores[-1:] for j in range(n)]
+        )
+    # Interleave nodes so consecutive workers land on different sockets
+    return [a[j] for j in range(max(per_node)) for a in assignments if j < len(a)]
+
+
+def set_cpu_config(
+    threads: Optional[int] = None,
+    inter_threads: Optional[int] = None,
+    cpus: Optional[Union[str, int, Sequence[int]]] = None,
+) -> Optional[int]:
+    """
+    Apply a CPU execution config to this process by pinning it to cores and setting PyTorch and OpenCV thread counts.
+
+    Args:
+        threads (int, optional): Number of intra-op threads. Defaults to the number of pinned cores when `cpus` is set.
+        inter_threads (int, optional): Number of PyTorch inter-op threads.
+        cpus (str | int | Sequence[int], optional): Cores to pin this process to, i.e. '0-15' or [0, 1, 2, 3].
+
+    Returns:
+        (int | None): The resolved number of intra-op threads, None if neither `threads` nor `cpus` is set.
+
+    Examples:
+        >>> set_cpu_config(threads=8, cpus="0-7")
+        8
+    """
+    import cv2
+    import torch
+
+    if cpus is not None:
+        cores = parse_cpus(cpus)
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cores)
+        else:
+            LOGGER.warning("CPU affinity is not supported on this platform, ignoring 'cpus'.")
+        threads = threads or len(cores)
+    if threads:
+        torch.set_num_threads(threads)
+        cv2.setNumThreads(threads)
+    if inter_threads and torch.get_num_interop_threads() != inter_threads:
+        try:
+            torch.set_num_interop_threads(inter_threads)
+        except RuntimeError as e:  # can only be set once, before any inter-op parallel work has started
+            LOGGER.warning(f"Failed to set PyTorch inter-op threads to {inter_threads}: {e}")
+    return threads
@@ -12,7 +12,7 @@ import torch
 import torch.nn.functional as F
 
 from ultralytics.utils import LOGGER
-from ultralytics.utils.metrics import batch_probiou
+from ultralytics.utils.metrics import batch_probiou, box_iou
 
 
 class Profile(contextlib.ContextDecorator):
@@ -189,6 +189,55 @@ def nms_rotated(boxes, scores, threshold: float = 0.45, use_triu: bool = True):
     return sorted_idx[pick]
 
 
+def merge_boxes(boxes, scores, classes=None, iou_thres: float = 0.45, rotated: bool = False, weighted: bool = False):
+    """
+    Merge overlapping boxes with NMS, optionally fusing each group of suppressed boxes into its kept box (WBF).
+
+    With `weighted=True`, every box is assigned to the highest scoring kept box it overlaps, and the coordinates of each
+    kept box are replaced by the score-weighted mean of its group, as in weighted box fusion. The kept box score is
+    unchanged, and rotated boxes keep the angle of the kept box since angles can not be averaged across their period.
+
+    Args:
+        boxes (torch.Tensor): Boxes with shape (N, 4) in xyxy format, or (N, 5) in xywhr format if `rotated`.
+        scores (torch.Tensor): Confidence scores with shape (N,).
+        classes (torch.Tensor, optional): Class indices with shape (N,), only boxes of the same class are merged.
+        iou_thres (float): IoU threshold above which boxes are merged.
+        rotated (bool): Whether boxes are rotated boxes merged with probiou.
+        weighted (bool): Whether to fuse the coordinates of merged boxes instead of only suppressing them.
+
+    Returns:
+        keep (torch.Tensor): Indices of the kept boxes, sorted by decreasing score.
+        boxes (torch.Tensor): The kept boxes, fused with the boxes they suppressed if `weighted`.
+
+    Examples:
+        >>> boxes = torch.tensor([[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]], dtype=torch.float32)
+        >>> keep, fused = merge_boxes(boxes, torch.tensor([0.9, 0.9, 0.5]), iou_thres=0.5, weighted=True)
+        >>> fused[0]  # tensor([0.5, 0.5, 10.5, 10.5])
+    """
+    import torchvision  # scope for faster 'import ultralytics'
+
+    b = boxes.clone()
+    if classes is not None:  # offset boxes by class so that boxes of different classes never overlap
+        offset = classes.float()[:, None] * (boxes[:, :4].abs().max() + 1 if len(boxes) else 1)
+        if rotated:
+            b[:, :2] += offset
+        else:
+            b[:, :4] += offset
+    keep = nms_rotated(b, scores, iou_thres) if rotated else torchvision.ops.nms(b, scores, iou_thres)
+    if not weighted or not len(keep):
+        return keep, boxes[keep]
+
+    iou = batch_probiou(b[keep], b) if rotated else box_iou(b[keep], b)  # (K, N)
+    group = (iou >= iou_thres).float().argmax(0)  # first, i.e. highest scoring, kept box overlapping each box
+    group[keep] = torch.arange(len(keep), device=group.device)  # kept boxes always head their own group
+    w = scores.float()[:, None]
+    fused = torch.zeros((len(keep), boxes.shape[1]), device=boxes.device).index_add_(0, group, boxes.float() * w)
+    fused /= torch.zeros((len(keep), 1), device=boxes.device).index_add_(0, group, w)
+    if rotated:
+        fused[:, 4] = boxes[keep, 4]
+    return keep, fused.to(boxes.dtype)
+
+
 def non_max_suppression(
     prediction,
     conf_thres: float = 0.25,
@@ -742,6 +791,87 @@ def process_mask_native(protos, masks_in, bboxes, shape):
     return masks.gt_(0.0)
 
 
+def bilinear_matrix(size: int, src: int, device=None) -> torch.Tensor:
+    """
+    Return the matrix that resizes a 1D signal of length `src` to `size` like `F.interpolate(mode='bilinear')`.
+
+    Bilinear resizing is separable, so resizing an (H, W) image to (h, w) equals `My @ image @ Mx.T` with
+    `My = bilinear_matrix(h, H)` and `Mx = bilinear_matrix(w, W)`, and any block of the output can be computed from the
+    matching rows of both matrices without resizing the whole image.
+
+    Args:
+        size (int): Output length.
+        src (int): Input length.
+        device (torch.device, optional): Device of the returned matrix.
+
+    Returns:
+        (torch.Tensor): Interpolation weights with shape (size, src), using align_corners=False.
+    """
+    x = ((torch.arange(size, device=device, dtype=torch.float32) + 0.5) * (src / size) - 0.5).clamp_(min=0)
+    i0 = x.long().clamp_(max=src - 1)
+    i1 = (i0 + 1).clamp_(max=src - 1)
+    lam = x - i0
+    m = torch.zeros(size, src, device=device)
+    rows = torch.arange(size, device=device)
+    m.index_put_((rows, i0), 1 - lam, accumulate=True)
+    m.index_put_((rows, i1), lam, accumulate=True)
+    return m
+
+
+def process_mask_roi(protos, masks_in, bboxes, shape, native: bool = False):
+    """
+    Apply masks to bounding boxes using mask head output, upsampling each mask only inside its bounding box region.
+
+    Produces the same masks as `process_mask(..., upsample=True)`, or `process_mask_native` when `native=True`, but
+    returns each of them as a binary crop of its region of interest (ROI) with the offset of that crop. Memory and
+    compute scale with the area of the objects rather than with the number of objects times the image area. ROIs of
+    `process_mask` masks are padded by one prototype pixel, since those masks are cropped before upsampling.
+
+    Args:
+        protos (torch.Tensor): Mask prototypes with shape (mask_dim, mask_h, mask_w).
+        masks_in (torch.Tensor): Mask coefficients with shape (N, mask_dim) where N is number of masks after NMS.
+        bboxes (torch.Tensor): Bounding boxes with shape (N, 4) in the space of `shape`.
+        shape (tuple): Target image size as (height, width), the input image size or the original image size.
+        native (bool): Whether `shape` is the original image size, removing letterbox padding like `scale_masks`.
+
+    Returns:
+        masks (List[torch.Tensor]): Binary mask crops, each with shape (h, w) and dtype bool.
+        offsets (torch.Tensor): Top-left (x, y) offsets of the crops in the target image with shape (N, 2).
+    """
+    c, mh, mw = protos.shape  # CHW
+    ih, iw = shape
+    masks = (masks_in @ protos.float().view(c, -1)).view(-1, mh, mw)
+    if native:
+        gain = min(mh / ih, mw / iw)  # gain  = old / new
+        pad = (mw - iw * gain) / 2, (mh - ih * gain) / 2  # wh padding
+        top, left = int(round(pad[1] - 0.1)), int(round(pad[0] - 0.1))
+        masks = masks[:, top : mh - int(round(pad[1] + 0.1)), left : mw - int(round(pad[0] + 0.1))]
+        mh, mw = masks.shape[1:]
+        rois = bboxes.ceil()  # pixels inside boxes, matching crop_mask after upsampling
+    else:
+        ratio = torch.tensor([mw / iw, mh / ih, mw / iw, mh / ih], device=bboxes.device)
+        masks = crop_mask(masks, bboxes * ratio)
+        cells = (bboxes * ratio).ceil()  # prototype pixels kept by crop_mask, [x0, x1) and [y0, y1)
+        rois = torch.cat([(cells[:, :2] - 0.5) / ratio[:2] - 0.5, (cells[:, 2:] + 0.5) / ratio[:2] - 0.5], 1)
+        rois[:, :2] = rois[:, :2].floor()  # pixels reached by the bilinear support of the kept prototype pixels
+        rois[:, 2:] = rois[:, 2:].ceil()
+    rois = rois.clamp_(min=0)
+    rois[:, [0, 2]] = rois[:, [0, 2]].clamp_(max=iw)
+    rois[:, [1, 3]] = rois[:, [1, 3]].clamp_(max=ih)
+    my, mx = bilinear_matrix(ih, mh, masks.device), bilinear_matrix(iw, mw, masks.device)
+    sy, sx = my.argmax(1), mx.argmax(1)  # nearest source pixel of each output pixel, bounds the support of an ROI
+
+    crops = []
+    for m, (x0, y0, x1, y1) in zip(masks, rois.int().tolist()):
+        if x1 <= x0 or y1 <= y0:
+            crops.append(torch.zeros((max(y1 - y0, 0), max(x1 - x0, 0)), dtype=torch.bool, device=masks.device))
+            continue
+        p0, p1 = max(int(sy[y0]) - 1, 0), min(int(sy[y1 - 1]) + 2, mh)  # source rows of the ROI
+        q0, q1 = max(int(sx[x0]) - 1, 0), min(int(sx[x1 - 1]) + 2, mw)  # source columns of the ROI
+        crops.append((my[y0:y1, p0:p1] @ m[p0:p1, q0:q1] @ mx[x0:x1, q0:q1].T) > 0.0)
+    return crops, rois[:, :2].long()
+
+
 def scale_masks(masks, shape, padding: bool = True):
     """
     Rescale segment masks to target shape.
@@ -771,6 +901,55 @@ def scale_masks(masks, shape, padding: bool = True):
     return masks
 
 
+def scale_masks_roi(rois, offsets, src_shape, shape, padding: bool = True):
+    """
+    Rescale binary mask crops to target shape, resizing each crop only inside the region it reaches.
+
+    Produces the same masks as `scale_masks` on the dense masks followed by thresholding at 0, as crops of the target
+    shape with their offsets, so memory scales with the area of the objects rather than with the number of masks times
+    the target image area.
+
+    Args:
+        rois (List[torch.Tensor]): Binary mask crops, each with shape (h, w).
+        offsets (torch.Tensor): Top-left (x, y) offsets of the crops in the source masks with shape (N, 2).
+        src_shape (tuple): Source masks height and width as (height, width).
+        shape (tuple): Target height and width as (height, width).
+        padding (bool): Whether masks are based on YOLO-style augmented images with padding.
+
+    Returns:
+        masks (List[torch.Tensor]): Binary mask crops of the target shape, each with shape (h, w) and dtype bool.
+        offsets (torch.Tensor): Top-left (x, y) offsets of the crops in the target shape with shape (N, 2).
+    """
+    mh, mw = src_shape
+    gain = min(mh / shape[0], mw / shape[1])  # gain  = old / new
+    pad = [mw - shape[1] * gain, mh - shape[0] * gain]  # wh padding
+    if padding:
+        pad[0] /= 2
+        pad[1] /= 2
+    top, left = (int(round(pad[1] - 0.1)), int(round(pad[0] - 0.1))) if padding else (0, 0)  # y, x
+    bottom, right = mh - int(round(pad[1] + 0.1)), mw - int(round(pad[0] + 0.1))
+    device = offsets.device
+    my, mx = bilinear_matrix(shape[0], bottom - top, device), bilinear_matrix(shape[1], right - left, device)
+    # first and last source pixel with a nonzero weight in each target pixel, both non-decreasing
+    ly, hy = (my > 0).int().argmax(1), my.shape[1] - 1 - (my > 0).int().flip(1).argmax(1)
+    lx, hx = (mx > 0).int().argmax(1), mx.shape[1] - 1 - (mx > 0).int().flip(1).argmax(1)
+
+    crops, out = [], []
+    for roi, (x, y) in zip(rois, offsets.tolist()):
+        y0, x0 = max(y, top) - top, max(x, left) - left  # source window inside the unpadded region
+        y1, x1 = min(y + roi.shape[0], bottom) - top, min(x + roi.shape[1], right) - left
+        if y1 <= y0 or x1 <= x0:
+            crops.append(torch.zeros((0, 0), dtype=torch.bool, device=device))
+            out.append((0, 0))
+            continue
+        p0, p1 = int(torch.searchsorted(hy, y0)), int(torch.searchsorted(ly, y1))  # target rows reached
+        q0, q1 = int(torch.searchsorted(hx, x0)), int(torch.searchsorted(lx, x1))  # target columns reached
+        m = roi[y0 + top - y : y1 + top - y, x0 + left - x : x1 + left - x].float()
+        crops.append((my[p0:p1, y0:y1] @ m @ mx[q0:q1, x0:x1].T) > 0.0)
+        out.append((q0, p0))
+    return crops, torch.tensor(out, dtype=torch.long, device=device).view(-1, 2)
+
+
 def scale_coords(img1_shape, coords, img0_shape, ratio_pad=None, normalize: bool = False, padding: bool = True):
     """
     Rescale segment coordinates from img1_shape to img0_shape.